@@ -0,0 +1,53 @@
+"""API JSON lokal untuk wallboard & skrip laporan.
+
+Contoh (dari root repo):
+    python api_server.py
+    python api_server.py --host 0.0.0.0 --port 8601
+
+    curl -s --compressed 'http://127.0.0.1:8601/api/produksi/daily?start=2025-09-01&shift=Shift%201'
+    curl -s -H 'If-None-Match: W/"..."' -o /dev/null -w '%{http_code}' http://127.0.0.1:8601/api/overview
+
+Endpoint: /api/versions, /api/overview, /api/produksi/kpi,
+/api/produksi/{daily,shift,excavator,blok,front,material,jam},
+/api/gangguan/top, /api/monitoring/bbm. Filter produksi: start, end
+(YYYY-MM-DD), shift, excavator, blok, front.
+"""
+import argparse
+import sys
+import warnings
+
+sys.path.append('.')
+
+from config import API_HOST, API_PORT
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default=API_HOST)
+    parser.add_argument('--port', type=int, default=API_PORT)
+    parser.add_argument('--quiet', action='store_true', help='tanpa log per request')
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore')
+    # Loader dipanggil di luar server Streamlit: peringatan runtime tidak relevan
+    from streamlit import config as st_config, logger as st_logger
+    st_config.set_option('logger.level', 'error')
+    st_logger.set_log_level('error')
+
+    from utils.api import ENDPOINTS, make_server
+    from utils.data_loader import warm_disk_caches
+
+    # Workbook yang belum ada di cache disk di-parse dulu, sebelum request pertama
+    warm_disk_caches()
+    server = make_server(args.host, args.port, quiet=args.quiet)
+    print(f"API berjalan di http://{args.host}:{args.port} ({len(ENDPOINTS)} endpoint)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,303 @@
+"""Benchmark loader & agregasi halaman dengan data sintetis.
+
+Contoh (dari root repo):
+    python -m benchmarks.run --years 1 5 --rows-per-year 8000
+    python -m benchmarks.run --years 1 --pages --compare benchmarks/results/lama.json
+
+Hasil ditulis ke benchmarks/results/<waktu>.json (bisa dibandingkan antar run
+dengan --compare). Tiap baris hasil: skenario, tahap, baris masuk/keluar,
+median & minimum detik dari --repeat kali jalan, dan puncak memori (MB,
+tracemalloc: alokasi Python/numpy, tidak termasuk buffer pyarrow).
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+import pandas as pd
+
+from benchmarks.synthetic import write_dataset
+
+
+# ============================================================
+# PENGUKURAN
+# ============================================================
+def _rows(value):
+    if isinstance(value, pd.DataFrame):
+        return len(value)
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (tuple, list)):
+        counts = [n for n in map(_rows, value) if n is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+def measure(fn, repeat):
+    """(hasil, daftar detik, puncak MB): `repeat` kali tanpa tracemalloc + 1 kali untuk memori"""
+    seconds = []
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn()
+        seconds.append(time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, seconds, peak / 1024 / 1024
+
+
+class Recorder:
+    def __init__(self, scenario, repeat):
+        self.scenario = scenario
+        self.repeat = repeat
+        self.results = []
+
+    def stage(self, name, fn, rows_in=None):
+        result, seconds, peak_mb = measure(fn, self.repeat)
+        self.results.append({
+            **self.scenario,
+            'stage': name,
+            'rows_in': rows_in,
+            'rows_out': _rows(result),
+            'seconds': statistics.median(seconds),
+            'seconds_min': min(seconds),
+            'runs': len(seconds),
+            'peak_mb': round(peak_mb, 2),
+        })
+        print(f"  {name:32s} {statistics.median(seconds):8.3f}s  {peak_mb:8.1f} MB", flush=True)
+        return result
+
+
+# ============================================================
+# TAHAP LOADER & AGREGASI
+# ============================================================
+def bench_loaders(rec, paths):
+    """Parse (baca workbook) & clean per loader, lalu agregasi yang dipakai halaman"""
+    from utils import data_loader as dl
+    from utils.aggregates import build_overview_snapshot, build_produksi_cube, filter_cube, rollup
+    from utils.indexing import FrameIndex
+    from utils.kpi import PrefixKpi
+    from utils.store import Store
+    from utils.streaming import combine_rows, stream_produksi_rows
+
+    # --- Produksi: streaming (termasuk perbaikan kolom bergeser) lalu compact ---
+    fp = paths['produksi']
+    sheets = dl.produksi_sheets(fp)
+    raw = rec.stage('produksi.parse', lambda: [stream_produksi_rows(fp, s)[:2] for s in sheets])
+    combined = [combine_rows(normal, shifted) for normal, shifted in raw]
+    rows_raw = sum(len(c) for c in combined)
+    df = rec.stage(
+        'produksi.clean',
+        lambda: dl._categorize_produksi(pd.concat([dl._compact_produksi(c.copy()) for c in combined], ignore_index=True)),
+        rows_in=rows_raw,
+    )
+    rec.stage('produksi.parse_pandas', lambda: [dl._parse_produksi_pandas(fp, s) for s in sheets])
+
+    cube = rec.stage('produksi.cube', lambda: build_produksi_cube(df), rows_in=len(df))
+    index = rec.stage('produksi.index', lambda: FrameIndex(df), rows_in=len(df))
+    rec.stage('produksi.kpi_prefix', lambda: PrefixKpi(cube), rows_in=len(cube))
+
+    # --- Gangguan ---
+    fp = paths['gangguan']
+    sheet_names = [f'Monitoring {b}' for b in dl.BULAN_LIST]
+    sheets_g = rec.stage('gangguan.parse', lambda: pd.read_excel(fp, sheet_name=sheet_names, skiprows=1))
+    gangguan = rec.stage(
+        'gangguan.clean',
+        lambda: {name: dl._clean_gangguan(s.copy()) for name, s in sheets_g.items()},
+        rows_in=_rows(sheets_g),
+    )
+
+    # --- Monitoring ---
+    fp = paths['monitoring']
+    sheets_m = rec.stage('monitoring.parse', lambda: pd.read_excel(fp, sheet_name=dl.MONITORING_SHEETS))
+    monitoring = rec.stage(
+        'monitoring.clean',
+        lambda: {
+            'bbm': dl._clean_bbm(sheets_m['BBM'].copy()),
+            'ritase': dl._clean_ritase(sheets_m['Ritase'].copy()),
+            'analisa': [dl._clean_analisa_produksi(sheets_m['Analisa Produksi'].copy(), b) for b in dl.ANALISA_BULAN_MAP],
+        },
+        rows_in=_rows(sheets_m),
+    )
+
+    # --- Daily plan (baca + clean dalam satu fungsi parser) ---
+    fp = paths['daily_plan']
+    rec.stage('daily_plan.parse_clean', lambda: (dl._parse_daily_plan(fp), dl._parse_realisasi(fp)))
+
+    # --- Agregasi halaman ---
+    gangguan_jan = gangguan.get('Monitoring Januari', pd.DataFrame())
+    rec.stage('page.overview.snapshot',
+              lambda: build_overview_snapshot(cube, monitoring['bbm'], gangguan_jan), rows_in=len(cube))
+
+    dates = df['Date'].dropna()
+    start, end = dates.min(), dates.max()
+    mid = start + (end - start) / 2
+    filters = {'Shift': 'Shift 1'}
+    by_list = ['Date', 'Shift', 'Excavator', 'Commudity', 'BLOK', ['Shift', 'Jam']]
+
+    def produksi_cube_page():
+        cells = filter_cube(cube, mid, end, filters)
+        return [rollup(cells, by) for by in by_list]
+
+    def produksi_rows_page():
+        sel = index.select(mid, end, filters)
+        return index.df.iloc[sel]
+
+    rec.stage('page.produksi.cube_rollups', produksi_cube_page, rows_in=len(cube))
+    rec.stage('page.produksi.filter_rows', produksi_rows_page, rows_in=len(df))
+
+    store = Store(os.path.join('data', '.cache', 'bench.sqlite'))
+    rec.stage('store.sync', lambda: store.sync('produksi', str(time.time_ns()), lambda: {'produksi': df}), rows_in=len(df))
+    rec.stage('page.produksi.sql_rollups',
+              lambda: [store.rollup('produksi', by, mid, end, filters) for by in by_list], rows_in=len(df))
+
+
+# ============================================================
+# RENDER HALAMAN (AppTest)
+# ============================================================
+PAGES = ['Dashboard Overview', 'Produksi Harian', 'Gangguan', 'Monitoring', 'Daily Plan']
+
+
+def bench_pages(rec):
+    """Waktu satu run skrip penuh per halaman: pertama (cache dingin) & kedua (cache hangat)"""
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    from config import USERS
+
+    username = next(u for u, info in USERS.items() if info['role'] == 'supervisor')
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    for label in ('cold', 'warm'):
+        for page in PAGES:
+            at = AppTest.from_file(os.path.join(REPO_ROOT, 'app.py'), default_timeout=600)
+            at.session_state.logged_in = True
+            at.session_state.username = username
+            at.session_state.role = USERS[username]['role']
+            at.session_state.name = USERS[username].get('name', username)
+            at.session_state.current_menu = page
+            t0 = time.perf_counter()
+            at.run()
+            seconds = time.perf_counter() - t0
+            rec.results.append({
+                **rec.scenario,
+                'stage': f'render.{label}.{page}',
+                'rows_in': None,
+                'rows_out': None,
+                'seconds': seconds,
+                'seconds_min': seconds,
+                'runs': 1,
+                'peak_mb': None,
+                'exceptions': len(at.exception),
+            })
+            print(f"  render.{label}.{page:22s} {seconds:8.3f}s  exceptions={len(at.exception)}", flush=True)
+
+
+# ============================================================
+# HASIL & PERBANDINGAN
+# ============================================================
+def _meta(args):
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=10).stdout.strip()
+    except Exception:
+        commit = None
+    import openpyxl
+    return {
+        'created': datetime.datetime.now().isoformat(timespec='seconds'),
+        'git': commit,
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'openpyxl': openpyxl.__version__,
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'args': vars(args),
+    }
+
+
+def compare(old_path, results):
+    with open(old_path) as f:
+        old = {(r['years'], r['rows_per_year'], r['stage']): r for r in json.load(f)['results']}
+    print(f"\n{'tahap':40s} {'skenario':>12s} {'lama':>9s} {'baru':>9s} {'rasio':>7s}")
+    for r in results:
+        key = (r['years'], r['rows_per_year'], r['stage'])
+        if key not in old:
+            continue
+        before, after = old[key]['seconds'], r['seconds']
+        ratio = after / before if before else float('nan')
+        print(f"{r['stage']:40s} {r['years']:>5d}y/{r['rows_per_year']:<6d}"
+              f"{before:9.3f} {after:9.3f} {ratio:7.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--years', type=int, nargs='+', default=[1, 5], help='jumlah tahun data produksi per skenario')
+    parser.add_argument('--rows-per-year', type=int, default=8000, help='baris trip per tahun')
+    parser.add_argument('--repeat', type=int, default=3, help='jumlah pengulangan per tahap')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--pages', action='store_true', help='ukur juga render halaman lewat AppTest')
+    parser.add_argument('--out', help='file JSON hasil (default benchmarks/results/<waktu>.json)')
+    parser.add_argument('--compare', help='file JSON hasil run sebelumnya untuk dibandingkan')
+    parser.add_argument('--keep', action='store_true', help='jangan hapus folder data sintetis')
+    args = parser.parse_args(argv)
+
+    warnings.filterwarnings('ignore')
+    # Loader & AppTest dijalankan di luar server Streamlit: peringatan runtime,
+    # ScriptRunContext & deprecation tidak relevan untuk benchmark
+    from streamlit import config as st_config, logger as st_logger
+    st_config.set_option('logger.level', 'error')
+    st_logger.set_log_level('error')
+    results = []
+    cwd = os.getcwd()
+    for years in args.years:
+        scenario = {'years': years, 'rows_per_year': args.rows_per_year}
+        print(f"Skenario {years} tahun x {args.rows_per_year} baris", flush=True)
+        workdir = tempfile.mkdtemp(prefix=f'bench-{years}y-')
+        try:
+            t0 = time.perf_counter()
+            paths = write_dataset(workdir, years, args.rows_per_year, seed=args.seed)
+            print(f"  (data sintetis ditulis dalam {time.perf_counter() - t0:.1f}s: {workdir})", flush=True)
+            # Loader memakai path relatif 'data/...'
+            os.chdir(workdir)
+            rec = Recorder(scenario, args.repeat)
+            bench_loaders(rec, {k: os.path.relpath(p, workdir) for k, p in paths.items()})
+            if args.pages:
+                bench_pages(rec)
+            results += rec.results
+        finally:
+            os.chdir(cwd)
+            if not args.keep:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+    out = args.out or os.path.join(RESULTS_DIR, datetime.datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w') as f:
+        json.dump({'meta': _meta(args), 'results': results}, f, indent=1, default=str)
+    print(f"\nHasil: {out}")
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Ukur waktu startup & rerun script dashboard per halaman.
+
+Contoh (dari root repo):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --repeat 5 --scenarios login "Produksi Harian"
+
+Tiap skenario dijalankan di proses Python baru (modul belum ter-import) lewat
+AppTest: 'first' = run pertama (import + render, yang dialami pengguna saat
+membuka halaman di worker baru), 'rerun' = run kedua di sesi yang sama.
+Kolom modul menunjukkan library berat yang ter-import oleh skenario itu
+(untuk login: termasuk yang sudah sempat di-import thread warm-up).
+Data yang dipakai adalah folder data/ repo (cache disk ikut terpakai).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = ['login', 'Dashboard Overview', 'Produksi Harian', 'Gangguan', 'Monitoring', 'Daily Plan']
+
+# Modul yang dicatat apakah ikut ter-import
+HEAVY_MODULES = ['plotly.express', 'numpy', 'pandas', 'pyarrow', 'openpyxl', 'utils.data_loader']
+
+
+def _child(scenario):
+    """Dijalankan di proses baru: satu skenario, hasil JSON ke stdout"""
+    from streamlit import config as st_config, logger as st_logger
+    from streamlit.testing.v1 import AppTest
+
+    st_config.set_option('logger.level', 'error')
+    st_logger.set_log_level('error')
+    # Import streamlit sendiri tidak dihitung: sama untuk semua skenario
+    before = set(sys.modules)
+
+    at = AppTest.from_file(os.path.join(REPO_ROOT, 'app.py'), default_timeout=300)
+    if scenario != 'login':
+        from config import USERS
+        user = next(iter(USERS))
+        at.session_state.logged_in = True
+        at.session_state.username = user
+        at.session_state.role = USERS[user]['role']
+        at.session_state.name = USERS[user]['name']
+        at.session_state.current_menu = scenario
+
+    t0 = time.perf_counter()
+    at.run()
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    at.run()
+    rerun = time.perf_counter() - t0
+
+    loaded = set(sys.modules) - before
+    print(json.dumps({
+        'first': first,
+        'rerun': rerun,
+        'exceptions': len(at.exception),
+        'modules': len(loaded),
+        'heavy': [m for m in HEAVY_MODULES if m in loaded],
+    }))
+
+
+def run_scenario(scenario):
+    proc = subprocess.run(
+        [sys.executable, '-m', 'benchmarks.startup', '--child', scenario],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    lines = [line for line in proc.stdout.splitlines() if line.startswith('{')]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(f"Skenario {scenario} gagal:\n{proc.stderr[-2000:]}")
+    return json.loads(lines[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--scenarios', nargs='+', default=SCENARIOS, help="'login' dan/atau nama menu")
+    parser.add_argument('--repeat', type=int, default=3, help='jumlah proses baru per skenario')
+    parser.add_argument('--child', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.child)
+        return
+
+    print(f"{'skenario':20s} {'first (s)':>10s} {'rerun (s)':>10s} {'modul':>6s}  library berat")
+    for scenario in args.scenarios:
+        runs = [run_scenario(scenario) for _ in range(args.repeat)]
+        first = statistics.median(r['first'] for r in runs)
+        rerun = statistics.median(r['rerun'] for r in runs)
+        last = runs[-1]
+        errors = f"  ({last['exceptions']} exception)" if last['exceptions'] else ''
+        print(f"{scenario:20s} {first:10.3f} {rerun:10.3f} {last['modules']:6d}  {', '.join(last['heavy']) or '-'}{errors}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+import datetime
+import os
+import random
+
+from openpyxl import Workbook
+
+# ============================================================
+# GENERATOR WORKBOOK SINTETIS
+# ============================================================
+# Workbook berbentuk sama dengan file asli di data/ (nama sheet, baris judul,
+# header berulang, layout kolom bergeser mulai September) dengan jumlah
+# baris yang bisa diatur, untuk benchmark loader & halaman dashboard.
+# Semua workbook ditulis dengan openpyxl write_only (baris langsung ke file).
+
+BULAN_LIST = ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli",
+              "Agustus", "September", "Oktober", "November", "Desember"]
+
+PRODUKSI_HEADER = ['Date', 'Time', 'Shift', 'Front', 'Commudity', 'Excavator',
+                   'Dump Truck', 'Dump Loc', 'Rit', 'Tonnase']
+
+# Bulan mulai layout bergeser (kolom BLOK disisipkan sebelum Front)
+SHIFTED_FROM_MONTH = 9
+
+# Jam mulai tiap shift (Shift 3 melewati tengah malam)
+SHIFT_HOURS = {
+    'Shift 1': range(6, 14),
+    'Shift 2': range(14, 22),
+    'Shift 3': [22, 23, 0, 1, 2, 3, 4, 5],
+}
+
+FRONTS = ['TAJARANG', 'FRONT B', 'FRONT C', 'PLB', 'PLT']
+COMMODITIES = ['LIMESTONE', 'LIMESTONE MIX', 'LIMESTONE BERSIH', 'CLAY', 'SILICA']
+EXCAVATORS = [f'PC 850-0{i}' for i in range(1, 7)]
+DUMP_LOCS = ['LSC6', 'SP6', 'SP3', 'LSC3', 'TIMBUNAN']
+BLOKS = [f'{c}{n}' for c in 'GHM' for n in range(1, 10)]
+TONNASE_PER_RIT = 34
+
+
+def _days(year):
+    day = datetime.date(year, 1, 1)
+    while day.year == year:
+        yield day
+        day += datetime.timedelta(days=1)
+
+
+def _time_label(hour):
+    return f'{hour:02d}:00-{(hour + 1) % 24:02d}:00'
+
+
+def produksi_rows(year, rows_per_year, rng):
+    """Baris sheet 'Tahun YYYY': header berulang tiap awal bulan, layout bergeser mulai September"""
+    days = list(_days(year))
+    per_day, extra = divmod(rows_per_year, len(days))
+    month = 1
+    for i, day in enumerate(days):
+        if day.month != month:
+            month = day.month
+            # Header berulang di awal tiap bulan (seperti rekap bulanan yang ditempel)
+            yield list(PRODUKSI_HEADER)
+        for _ in range(per_day + (1 if i < extra else 0)):
+            shift = rng.choice(list(SHIFT_HOURS))
+            hour = rng.choice(SHIFT_HOURS[shift])
+            rit = rng.randint(1, 15)
+            values = [rng.choice(FRONTS), rng.choice(COMMODITIES), rng.choice(EXCAVATORS),
+                      rng.randint(1, 40), rng.choice(DUMP_LOCS), rit, rit * TONNASE_PER_RIT]
+            date = datetime.datetime.combine(day, datetime.time())
+            if day.month >= SHIFTED_FROM_MONTH:
+                yield [date, _time_label(hour), shift, rng.choice(BLOKS)] + values
+            else:
+                yield [date, _time_label(hour), shift] + values + [None]
+
+
+def write_produksi(path, years, rows_per_year, rng):
+    """Satu workbook dengan sheet 'Tahun YYYY' per tahun"""
+    wb = Workbook(write_only=True)
+    for year in years:
+        ws = wb.create_sheet(f'Tahun {year}')
+        ws.append(PRODUKSI_HEADER)
+        for row in produksi_rows(year, rows_per_year, rng):
+            ws.append(row)
+    wb.save(path)
+
+
+def write_gangguan(path, year, causes_per_month, rng):
+    """Sheet 'Monitoring <bulan>' berisi pivot frekuensi penyebab gangguan"""
+    wb = Workbook(write_only=True)
+    for bulan in BULAN_LIST:
+        ws = wb.create_sheet(f'Monitoring {bulan}')
+        ws.append(['Tanggal', '(All)', None])
+        ws.append([])
+        ws.append(['Row Labels', 'Frekuensi', 'Persentase'])
+        freq = [rng.randint(1, 250) for _ in range(causes_per_month)]
+        total = sum(freq)
+        for i, f in enumerate(sorted(freq, reverse=True)):
+            ws.append([f'Gangguan {i + 1:03d}', f, f / total])
+        ws.append(['Grand Total', total, 1])
+    wb.save(path)
+
+
+def write_monitoring(path, year, units, rng):
+    """Sheet BBM (per unit x tanggal), Ritase (per tanggal x shift) & Analisa Produksi"""
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet('Analisa Produksi')
+    ws.append([f'Januari {year}', None, None, None, None, f'Februari {year}'])
+    ws.append(['Tanggal', 'Plan', 'Aktual', 'Ketercapaian', None] * 2)
+    for day in range(1, 32):
+        row = []
+        for _ in range(2):
+            aktual = rng.randint(0, 30000)
+            row += [day, 25000, aktual, aktual / 25000, None]
+        ws.append(row)
+
+    ritase_cols = ['Front B LS', 'Front B Clay', 'Front B LS MIX', 'Front C LS', 'Front C LS MIX',
+                   'PLB LS', 'PLB SS', 'PLT SS', 'PLT MIX', 'Timbunan', 'Stockpile 6  SS',
+                   'PLT LS MIX', 'Stockpile 6 ']
+    ws = wb.create_sheet('Ritase')
+    ws.append(['Tanggal', 'Shift', 'Pengawasan'] + ritase_cols)
+    for day in _days(year):
+        for shift in (1, 2, 3):
+            date = datetime.datetime.combine(day, datetime.time())
+            ws.append([date, shift, rng.randint(0, 150)] + [rng.choice([0, 0, rng.randint(1, 400)]) for _ in ritase_cols])
+
+    ws = wb.create_sheet('BBM')
+    ws.append(['No', 'Alat Berat', 'Tipe Alat'] + list(range(1, 32)) + ['Total'])
+    for i in range(units):
+        usage = [rng.choice([0, rng.randint(50, 800)]) for _ in range(31)]
+        jenis = 'Excavator' if i % 3 == 0 else 'Dump Truck'
+        ws.append([i + 1, jenis, f'{jenis[:2].upper()} {i + 1:03d}'] + usage + [sum(usage)])
+    wb.save(path)
+
+
+def write_daily_plan(path, year, rows, rng):
+    """Sheet 'W22 Scheduling' & 'W22 realisasi' dengan baris judul + header di baris ketiga"""
+    hari = ['Senin', 'Selasa', 'Rabu', 'Kamis', 'Jumat', 'Sabtu', 'Minggu']
+    start = datetime.datetime(year, 6, 16)
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet('W22 Scheduling')
+    ws.append([None, 'PLAN'])
+    ws.append([])
+    ws.append([None, 'Hari', 'Tanggal', 'Shift', 'Batu Kapur', 'Silika', 'Clay', 'Alat Muat',
+               'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan'])
+    for i in range(rows):
+        date = start + datetime.timedelta(days=i // 9)
+        ws.append([None, hari[date.weekday()], date, i % 3 + 1, rng.randint(1000, 4000), None, None,
+                   rng.choice(EXCAVATORS), 'Scania', rng.choice(BLOKS), 'Y13', 'SP 6', 'Batu Kapur'])
+
+    ws = wb.create_sheet('W22 realisasi')
+    ws.append(['Rencana Produksi & Plotting Peralatan'])
+    ws.append([])
+    ws.append([None, 'Hari', 'Tanggal', 'Week', 'Shift', 'Batu Kapur', 'Silika', 'Timbunan',
+               'Alat Bor', 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan'])
+    for i in range(rows):
+        date = start + datetime.timedelta(days=i // 9)
+        ws.append([None, hari[date.weekday()], date, 3, i % 3 + 1, rng.randint(1000, 4000), None, None,
+                   None, rng.choice(EXCAVATORS), 'Scania', rng.choice(BLOKS), 'Y13', 'SP 6', 'Batu Kapur'])
+    wb.save(path)
+
+
+def write_dataset(root, years=1, rows_per_year=8000, first_year=2025, seed=0):
+    """Tulis semua workbook ke <root>/data dengan nama file yang dipakai dashboard"""
+    rng = random.Random(seed)
+    data_dir = os.path.join(root, 'data')
+    os.makedirs(data_dir, exist_ok=True)
+    year_list = list(range(first_year, first_year + years))
+    last = year_list[-1]
+
+    paths = {
+        'produksi': os.path.join(data_dir, 'Produksi_UTSG_Harian.xlsx'),
+        'gangguan': os.path.join(data_dir, 'Gangguan_Produksi_2025_baru.xlsx'),
+        'monitoring': os.path.join(data_dir, 'Monitoring_2025_.xlsx'),
+        'daily_plan': os.path.join(data_dir, 'DAILY_PLAN.xlsx'),
+    }
+    write_produksi(paths['produksi'], year_list, rows_per_year, rng)
+    write_gangguan(paths['gangguan'], last, causes_per_month=140, rng=rng)
+    write_monitoring(paths['monitoring'], last, units=200, rng=rng)
+    write_daily_plan(paths['daily_plan'], last, rows=max(50, rows_per_year // 4), rng=rng)
+    return paths
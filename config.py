@@ -24,3 +24,19 @@ CHART_COLORS = [
     "#D500F9", "#FFEA00", "#00E5FF",
     "#FF1744", "#76FF03"
 ]
+
+# Batas memori cache figure Plotly (MB), dibagi semua sesi
+FIGURE_CACHE_MAX_MB = 64
+
+# Mesin query chart Produksi: 'sqlite' (store data/.cache/dashboard.sqlite)
+# atau 'pandas' (roll-up cube di memori)
+QUERY_ENGINE = 'sqlite'
+
+# Panel performa (waktu loader, bagian halaman & chart) di sidebar hanya
+# untuk role ini; tombol dump menambahkan sampel ke file JSONL berikut
+PERF_PANEL_ROLE = 'supervisor'
+PERF_LOG_FILE = 'logs/perf.jsonl'
+
+# API JSON lokal (python api_server.py) untuk wallboard & skrip laporan
+API_HOST = '127.0.0.1'
+API_PORT = 8601
@@ -0,0 +1,15 @@
+import os
+import sys
+
+import pytest
+
+# Modul repo di-import sebagai `utils.*` / `views.*` dari root repo
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """Folder kerja sementara dengan data/ kosong (path data & cache relatif ke cwd)"""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+    return tmp_path
@@ -0,0 +1,79 @@
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.cache import cached_frame
+
+REPO_DATA = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def _assert_same(cold, warm):
+    pd.testing.assert_frame_equal(cold, warm)
+    assert cold.dtypes.to_dict() == warm.dtypes.to_dict()
+    for col in cold.columns:
+        assert cold[col].isna().tolist() == warm[col].isna().tolist(), col
+        assert cold[col].map(type).tolist() == warm[col].map(type).tolist(), col
+
+
+def _cold_and_warm(name, file_path, builder):
+    cold = cached_frame(name, file_path, builder)
+    warm = cached_frame(name, file_path, lambda fp: pytest.fail('cache tidak terpakai'))
+    return cold, warm
+
+
+def test_cache_hit_keeps_parse_dtypes(workdir):
+    with open('data/sumber.xlsx', 'wb') as f:
+        f.write(b'isi workbook')
+
+    def builder(file_path):
+        return pd.DataFrame({
+            'Week': pd.Series([22, 22, 23], dtype=object),
+            'Alat': pd.Series(['EX-01', np.nan, 'EX-02'], dtype=object),
+            'Tanggal': pd.to_datetime(['2025-06-02', None, '2025-06-04']),
+            'Shift': pd.Series(['Shift 1', 'Shift 2', 'Shift 1'], dtype='category'),
+            'Tonnase': np.array([1.5, 2.0, np.nan], dtype='float32'),
+        })
+
+    cold, warm = _cold_and_warm('contoh', 'data/sumber.xlsx', builder)
+    assert os.path.exists(os.path.join('data', '.cache')) and any(
+        name.endswith('.parquet') for name in os.listdir(os.path.join('data', '.cache'))
+    )
+    _assert_same(cold, warm)
+
+
+@pytest.mark.skipif(not os.path.exists(os.path.join(REPO_DATA, 'DAILY_PLAN.xlsx')), reason='workbook contoh tidak ada')
+def test_realisasi_cold_parse_matches_cache_hit(workdir):
+    from utils.data_loader import _parse_realisasi
+
+    shutil.copy(os.path.join(REPO_DATA, 'DAILY_PLAN.xlsx'), 'data/DAILY_PLAN.xlsx')
+    cold, warm = _cold_and_warm('realisasi', 'data/DAILY_PLAN.xlsx', _parse_realisasi)
+    _assert_same(cold, warm)
+
+
+def test_ingest_moves_staging_fingerprint(workdir):
+    import json
+
+    from utils.cache import MANIFEST_FILE, file_fingerprint
+    from utils.ingest import GAGAL, SELESAI, Ingestor
+
+    ingestor = Ingestor()
+
+    def fail(staging_path):
+        file_fingerprint(staging_path)
+        raise ValueError('workbook rusak')
+
+    statuses = []
+    for build in (file_fingerprint, fail):
+        job = ingestor.submit('contoh', 'data/sumber.xlsx', b'isi workbook', build, lambda: None)
+        while not job.done:
+            time.sleep(0.01)
+        statuses.append(job.status)
+    assert statuses == [SELESAI, GAGAL]
+
+    with open(MANIFEST_FILE) as f:
+        keys = list(json.load(f))
+    assert keys == [os.path.abspath('data/sumber.xlsx')]
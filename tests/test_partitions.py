@@ -0,0 +1,55 @@
+import pandas as pd
+
+from utils.partitions import PartitionSet
+
+
+def _frame(start, days, value):
+    return pd.DataFrame({
+        'Date': pd.date_range(start, periods=days, freq='D'),
+        'Tonnase': [float(value)] * days,
+    })
+
+
+def test_sync_reads_only_changed_sources(tmp_path):
+    parts = PartitionSet('produksi', root=str(tmp_path))
+    calls = []
+
+    def source(name, frame):
+        def frame_fn():
+            calls.append(name)
+            return frame
+        return frame_fn
+
+    y2025 = _frame('2025-11-20', 20, 1)
+    parts.sync('v1', {
+        '2025': ('a', source('2025', y2025)),
+        '2026': ('b', source('2026', _frame('2026-01-01', 10, 2))),
+    })
+    paths_2025 = {p['path'] for p in parts.partitions() if p['source'] == '2025'}
+
+    calls.clear()
+    assert parts.sync('v2', {
+        '2025': ('a', source('2025', y2025)),
+        '2026': ('c', source('2026', _frame('2026-01-01', 40, 3))),
+    })
+    assert calls == ['2026']
+    assert {p['path'] for p in parts.partitions() if p['source'] == '2025'} == paths_2025
+    assert parts.row_count() == 60
+    assert parts.date_bounds() == ('2025-11-20', '2026-02-09')
+
+    # Satu minggu 2026 hanya membaca partisi Januari 2026
+    week = parts.partitions('2026-01-05', '2026-01-11')
+    assert [(p['year'], p['month']) for p in week] == [(2026, 1)]
+    df = parts.read('2026-01-05', '2026-01-11')
+    assert len(df) == 7 and (df['Tonnase'] == 3).all()
+
+
+def test_removed_source_drops_its_partitions(tmp_path):
+    parts = PartitionSet('produksi', root=str(tmp_path))
+    parts.sync('v1', {
+        '2025': ('a', lambda: _frame('2025-12-01', 5, 1)),
+        '2026': ('b', lambda: _frame('2026-01-01', 5, 2)),
+    })
+    parts.sync('v2', {'2026': ('b', lambda: _frame('2026-01-01', 5, 2))})
+    assert parts.row_count() == 5
+    assert parts.read()['Tonnase'].tolist() == [2.0] * 5
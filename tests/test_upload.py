@@ -0,0 +1,60 @@
+import os
+
+from openpyxl import Workbook
+
+from utils.data_loader import _produksi_sources, upload_target
+from utils.ingest import SELESAI, Ingestor
+
+
+def _workbook(path, sheets):
+    wb = Workbook()
+    wb.remove(wb.active)
+    for sheet in sheets:
+        wb.create_sheet(sheet)
+    wb.save(path)
+
+
+def _upload(target_name, source_path, dataset='produksi'):
+    """Jalur handle_upload tanpa Streamlit: tujuan dari upload_target, tulis lewat staging"""
+    target = upload_target(dataset, target_name)
+    with open(source_path, 'rb') as f:
+        job = Ingestor().submit(dataset, target, f.read(), build=lambda path: None, publish=lambda: None)
+    while not job.done:
+        pass
+    assert job.status == SELESAI, job.error
+    return target
+
+
+def test_main_filename_upload_keeps_yearly_workbook(workdir):
+    _workbook('data/Produksi_UTSG_Harian.xlsx', ['Tahun 2025'])
+    _workbook('data/Produksi_UTSG_Harian_2026.xlsx', ['Tahun 2026'])
+    with open('data/Produksi_UTSG_Harian_2026.xlsx', 'rb') as f:
+        yearly = f.read()
+
+    _workbook('upload.xlsx', ['Tahun 2025'])
+    target = _upload('Produksi_UTSG_Harian.xlsx', 'upload.xlsx')
+
+    assert target == os.path.join('data', 'Produksi_UTSG_Harian.xlsx')
+    with open('data/Produksi_UTSG_Harian_2026.xlsx', 'rb') as f:
+        assert f.read() == yearly
+    assert _produksi_sources() == [
+        ('data/Produksi_UTSG_Harian.xlsx', 'Tahun 2025'),
+        ('data/Produksi_UTSG_Harian_2026.xlsx', 'Tahun 2026'),
+    ]
+
+
+def test_yearly_filename_upload_gets_its_own_workbook(workdir):
+    _workbook('data/Produksi_UTSG_Harian.xlsx', ['Tahun 2025'])
+    _workbook('upload.xlsx', ['Tahun 2027'])
+    target = _upload('Produksi_UTSG_Harian_2027.xlsx', 'upload.xlsx')
+    assert target == os.path.join('data', 'Produksi_UTSG_Harian_2027.xlsx')
+
+
+def test_sheet_year_counted_once_across_workbooks(workdir):
+    # File utama masih memuat 2026, file 2026 masih memuat 2025
+    _workbook('data/Produksi_UTSG_Harian.xlsx', ['Tahun 2025', 'Tahun 2026'])
+    _workbook('data/Produksi_UTSG_Harian_2026.xlsx', ['Tahun 2025', 'Tahun 2026'])
+    assert _produksi_sources() == [
+        ('data/Produksi_UTSG_Harian.xlsx', 'Tahun 2025'),
+        ('data/Produksi_UTSG_Harian_2026.xlsx', 'Tahun 2026'),
+    ]
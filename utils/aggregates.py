@@ -0,0 +1,136 @@
+import pandas as pd
+
+# ============================================================
+# CUBE AGREGAT PRODUKSI
+# ============================================================
+# Cube berisi jumlah Rit, Tonnase & jumlah trip per kombinasi
+# (tanggal, jam, shift, excavator, BLOK, front, commodity). Semua chart &
+# KPI di halaman Produksi/Overview dihitung dengan roll-up cube ini, jadi
+# biaya render mengikuti jumlah sel cube, bukan jumlah trip truk.
+
+CUBE_DIMENSIONS = ['Date', 'Jam', 'Shift', 'Excavator', 'BLOK', 'Front', 'Commudity']
+CUBE_MEASURES = ['Rit', 'Tonnase', 'Trip']
+
+
+def build_produksi_cube(df):
+    """Bangun cube agregat dari frame hasil load_produksi"""
+    if df.empty:
+        return pd.DataFrame(columns=CUBE_DIMENSIONS + CUBE_MEASURES)
+
+    # Kolom Jam sudah dihitung saat load (int8, -1 = Time kosong)
+    df = df.assign(Trip=1)
+    cube = (
+        df.groupby(CUBE_DIMENSIONS, observed=True, dropna=False)
+        .agg(Rit=('Rit', 'sum'), Tonnase=('Tonnase', 'sum'), Trip=('Trip', 'sum'))
+        .reset_index()
+    )
+    cube['Rit'] = cube['Rit'].astype('float64')
+    cube['Tonnase'] = cube['Tonnase'].astype('float64')
+    cube['Trip'] = cube['Trip'].astype('int32')
+    return cube
+
+
+def merge_cubes(cubes):
+    """Gabung beberapa cube (mis. cube versi lama + cube baris baru) menjadi satu cube"""
+    cubes = [c for c in cubes if not c.empty]
+    if not cubes:
+        return build_produksi_cube(pd.DataFrame())
+    if len(cubes) == 1:
+        return cubes[0]
+
+    df = pd.concat(cubes, ignore_index=True)
+    for col in CUBE_DIMENSIONS:
+        # Kategori tiap cube berbeda, concat mengubahnya jadi object
+        if df[col].dtype == object:
+            df[col] = df[col].astype('category')
+    cube = (
+        df.groupby(CUBE_DIMENSIONS, observed=True, dropna=False)[CUBE_MEASURES]
+        .sum()
+        .reset_index()
+    )
+    cube['Rit'] = cube['Rit'].astype('float64')
+    cube['Tonnase'] = cube['Tonnase'].astype('float64')
+    cube['Trip'] = cube['Trip'].astype('int32')
+    return cube
+
+
+def filter_cube(cube, start_date=None, end_date=None, filters=None):
+    """Ambil sel cube untuk rentang tanggal & filter dimensi ({kolom: nilai})"""
+    mask = pd.Series(True, index=cube.index)
+    if start_date is not None:
+        mask &= cube['Date'] >= pd.Timestamp(start_date)
+    if end_date is not None:
+        mask &= cube['Date'] <= pd.Timestamp(end_date)
+    for col, value in (filters or {}).items():
+        mask &= cube[col] == value
+    return cube[mask]
+
+
+def rollup(cube, by):
+    """Jumlahkan measure cube per kolom `by`"""
+    return (
+        cube.groupby(by, observed=True)[CUBE_MEASURES]
+        .sum()
+        .reset_index()
+    )
+
+
+def cube_kpis(cube):
+    """KPI ringkas (ritase, tonase, avg/trip, excavator, hari) dari sel cube"""
+    trips = int(cube['Trip'].sum())
+    tonnase = float(cube['Tonnase'].sum())
+    return {
+        'rit': float(cube['Rit'].sum()),
+        'tonnase': tonnase,
+        'trip': trips,
+        'avg_trip': tonnase / trips if trips else 0.0,
+        'excavator': int(cube['Excavator'].nunique()),
+        'hari': int(cube['Date'].nunique()),
+    }
+
+
+# ============================================================
+# SNAPSHOT DASHBOARD OVERVIEW
+# ============================================================
+def build_overview_snapshot(cube, df_bbm, df_gangguan, kpi_engine=None):
+    """Semua angka & tabel kecil untuk halaman Overview, dihitung sekali per versi data
+
+    Total KPI diambil dari array prefix-sum (utils.kpi.PrefixKpi) jika diberikan,
+    sama dengan kartu KPI halaman Produksi; tanpa itu dijumlah dari cube.
+    """
+    if kpi_engine is not None:
+        kpi = dict(kpi_engine.totals(), excavator=kpi_engine.distinct('Excavator'))
+    else:
+        kpi = cube_kpis(cube)
+    snapshot = {
+        'metrics': {
+            'rit': kpi['rit'],
+            'tonnase': kpi['tonnase'],
+            'excavator': kpi['excavator'],
+            'bbm': float(df_bbm['Total'].sum()) if not df_bbm.empty else 0.0,
+            'gangguan': len(df_gangguan),
+        },
+        'daily': None,
+        'top_excavator': None,
+        'material': None,
+        'shift': None,
+        'heatmap': None,
+        'top_gangguan': df_gangguan.head(5) if not df_gangguan.empty else None,
+        'bbm_per_alat': None,
+    }
+
+    if not cube.empty:
+        snapshot['daily'] = rollup(cube, 'Date')
+        snapshot['top_excavator'] = rollup(cube, 'Excavator').sort_values('Tonnase').tail(6)
+        snapshot['material'] = rollup(cube, 'Commudity')
+        snapshot['shift'] = rollup(cube, 'Shift')
+        snapshot['heatmap'] = (
+            rollup(cube, ['Excavator', 'Shift'])
+            .pivot(index='Excavator', columns='Shift', values='Tonnase')
+            .fillna(0)
+        )
+
+    if not df_bbm.empty:
+        snapshot['bbm_per_alat'] = df_bbm.groupby('Alat Berat')['Total'].sum().reset_index().head(5)
+
+    return snapshot
@@ -0,0 +1,378 @@
+import datetime
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from utils.data_loader import (
+    BULAN_LIST, DATASETS, dataset_version, invalidate_dataset, load_bbm, load_gangguan,
+    kpi_produksi, load_gangguan_ytd, load_overview_snapshot, load_produksi_summary,
+    rollup_produksi,
+)
+from utils.kpi import previous_period
+
+# ============================================================
+# API JSON LOKAL (WALLBOARD & SKRIP LAPORAN)
+# ============================================================
+# Server HTTP kecil (http.server) yang memakai loader & agregat yang sama
+# dengan halaman Overview/Produksi, tanpa merender UI Streamlit.
+# Tiap endpoint terikat ke dataset sumbernya: ETag = sidik versi dataset +
+# path + query, Last-Modified = mtime file sumber terbaru. Klien yang polling
+# dengan If-None-Match / If-Modified-Since mendapat 304 tanpa body; body yang
+# sama dilayani dari cache kecil di memori, di-gzip bila klien mendukung.
+
+# Body lebih kecil dari ini tidak di-gzip
+GZIP_MIN_BYTES = 1024
+
+# Jumlah body respons (per ETag) yang disimpan
+RESPONSE_CACHE_MAX = 128
+
+# Parameter query -> kolom filter (sama dengan selectbox halaman Produksi)
+PRODUKSI_FILTER_PARAMS = {'shift': 'Shift', 'excavator': 'Excavator', 'blok': 'BLOK', 'front': 'Front'}
+
+# /api/produksi/<grup> -> kolom roll-up
+PRODUKSI_GROUPS = {
+    'daily': 'Date',
+    'shift': 'Shift',
+    'excavator': 'Excavator',
+    'blok': 'BLOK',
+    'front': 'Front',
+    'material': 'Commudity',
+    'jam': ['Shift', 'Jam'],
+}
+
+YTD = 'ytd'
+
+
+class ApiError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ============================================================
+# SERIALISASI
+# ============================================================
+def _json_default(value):
+    if isinstance(value, pd.Timestamp):
+        return value.date().isoformat() if value == value.normalize() else value.isoformat()
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def records(df):
+    """Frame -> list dict; NaN jadi null"""
+    if df is None or df.empty:
+        return []
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict('records')
+
+
+def _number(value):
+    if value is None or pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+# ============================================================
+# PARAMETER QUERY
+# ============================================================
+def _param(query, name, default=None):
+    values = query.get(name)
+    return values[-1] if values else default
+
+
+def _date_param(query, name):
+    value = _param(query, name)
+    if value is None:
+        return None
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        raise ApiError(400, f"Parameter {name} harus tanggal YYYY-MM-DD")
+
+
+def _int_param(query, name, default, minimum=1, maximum=1000):
+    value = _param(query, name)
+    if value is None:
+        return default
+    try:
+        return min(max(int(value), minimum), maximum)
+    except ValueError:
+        raise ApiError(400, f"Parameter {name} harus bilangan bulat")
+
+
+def produksi_filter(query):
+    """(tanggal awal, akhir, filter dimensi) dari query; default seluruh rentang data"""
+    summary = load_produksi_summary()
+    min_date, max_date = summary['min_date'], summary['max_date']
+    start_date = _date_param(query, 'start') or min_date
+    end_date = _date_param(query, 'end') or max_date
+    if start_date is not None and end_date is not None and start_date > end_date:
+        raise ApiError(400, "Parameter start harus <= end")
+    filters = {
+        col: value for param, col in PRODUKSI_FILTER_PARAMS.items()
+        if (value := _param(query, param)) not in (None, '', 'Semua')
+    }
+    return start_date, end_date, filters
+
+
+def _range(start_date, end_date, filters):
+    return {
+        'start': start_date.isoformat() if start_date else None,
+        'end': end_date.isoformat() if end_date else None,
+        'filters': filters,
+    }
+
+
+# ============================================================
+# ENDPOINT
+# ============================================================
+# path -> (dataset yang dipakai, fungsi(query) -> payload)
+ENDPOINTS = {}
+
+
+def endpoint(path, *datasets):
+    def register(fn):
+        ENDPOINTS[path] = (datasets, fn)
+        return fn
+    return register
+
+
+@endpoint('/api/versions', *DATASETS)
+def api_versions(query):
+    return {name: dataset_version(name) for name in DATASETS}
+
+
+@endpoint('/api/overview', 'produksi', 'gangguan', 'monitoring')
+def api_overview(query):
+    """Angka & tabel kecil halaman Overview"""
+    snap = load_overview_snapshot()
+    return {
+        'metrics': {key: _number(value) for key, value in snap['metrics'].items()},
+        'top_excavator': records(snap['top_excavator']),
+        'material': records(snap['material']),
+        'shift': records(snap['shift']),
+        'top_gangguan': records(snap['top_gangguan']),
+        'bbm_per_alat': records(snap['bbm_per_alat']),
+    }
+
+
+@endpoint('/api/produksi/kpi', 'produksi')
+def api_produksi_kpi(query):
+    """KPI rentang terfilter + periode sebelumnya (panjang sama), seperti kartu halaman Produksi"""
+    start_date, end_date, filters = produksi_filter(query)
+    if start_date is None:
+        return {'range': _range(None, None, filters), 'kpi': None, 'previous': None}
+    kpi = kpi_produksi(start_date, end_date, filters)
+    prev = kpi_produksi(*previous_period(start_date, end_date), filters)
+    return {
+        'range': _range(start_date, end_date, filters),
+        'kpi': {key: _number(value) for key, value in kpi.items()},
+        'previous': {key: _number(value) for key, value in prev.items()},
+    }
+
+
+def _produksi_group(by):
+    def api_produksi_group(query):
+        start_date, end_date, filters = produksi_filter(query)
+        df = rollup_produksi(by, start_date, end_date, filters)
+        if by != 'Date' and not isinstance(by, list):
+            df = df.sort_values('Tonnase', ascending=False)
+        return {'range': _range(start_date, end_date, filters), 'rows': records(df)}
+    return api_produksi_group
+
+
+for _group, _by in PRODUKSI_GROUPS.items():
+    endpoint(f'/api/produksi/{_group}', 'produksi')(_produksi_group(_by))
+
+
+@endpoint('/api/gangguan/top', 'gangguan')
+def api_gangguan_top(query):
+    """Jenis gangguan dengan frekuensi tertinggi; bulan=<nama bulan> atau ytd (default)"""
+    bulan = _param(query, 'bulan', YTD)
+    limit = _int_param(query, 'limit', 10)
+    if bulan.lower() == YTD:
+        dg = load_gangguan_ytd()
+    elif bulan in BULAN_LIST:
+        dg = load_gangguan(bulan)
+    else:
+        raise ApiError(400, f"Parameter bulan harus salah satu dari {BULAN_LIST} atau '{YTD}'")
+    if not dg.empty:
+        dg = dg.assign(**{'Row Labels': dg['Row Labels'].astype(str)})
+        dg = dg.sort_values('Frekuensi', ascending=False, kind='stable').head(limit)
+    return {'bulan': bulan, 'rows': records(dg)}
+
+
+@endpoint('/api/monitoring/bbm', 'monitoring')
+def api_monitoring_bbm(query):
+    """Total BBM per unit (Tipe Alat) atau per jenis alat (group=jenis)"""
+    group = _param(query, 'group', 'unit')
+    limit = _int_param(query, 'limit', 100)
+    if group not in ('unit', 'jenis'):
+        raise ApiError(400, "Parameter group harus 'unit' atau 'jenis'")
+    db = load_bbm()
+    if db.empty:
+        return {'group': group, 'rows': []}
+    col = 'Tipe Alat' if group == 'unit' else 'Alat Berat'
+    by_unit = db.groupby(col, sort=False)['Total'].sum().reset_index()
+    if group == 'unit':
+        by_unit = by_unit.merge(db[['Tipe Alat', 'Alat Berat']].drop_duplicates('Tipe Alat'), on='Tipe Alat')
+    by_unit = by_unit.sort_values('Total', ascending=False, kind='stable').head(limit)
+    return {'group': group, 'rows': records(by_unit)}
+
+
+# ============================================================
+# VERSI, ETAG & CACHE RESPONS
+# ============================================================
+_versions_lock = threading.Lock()
+_seen_versions = {}
+
+_responses_lock = threading.Lock()
+_responses = OrderedDict()
+
+
+def refresh_versions(datasets):
+    """Versi dataset saat ini; cache Streamlit proses ini dibersihkan jika file sumber berubah
+
+    (upload diproses oleh server dashboard, proses API hanya melihat file berganti)
+    """
+    versions = {}
+    for name in datasets:
+        version = dataset_version(name)
+        with _versions_lock:
+            previous = _seen_versions.get(name)
+            _seen_versions[name] = version
+        if previous is not None and previous != version:
+            invalidate_dataset(name)
+        versions[name] = version
+    return versions
+
+
+def last_modified(datasets):
+    """mtime file sumber terbaru (detik) dari dataset-dataset endpoint"""
+    mtimes = [
+        os.path.getmtime(file_path)
+        for name in datasets for file_path in DATASETS[name]['sources']()
+        if os.path.exists(file_path)
+    ]
+    return int(max(mtimes)) if mtimes else None
+
+
+def etag(path, query, versions):
+    key = json.dumps([path, sorted((k, v) for k, v in query.items()), sorted(versions.items())])
+    # Weak: body sama secara makna untuk semua Content-Encoding
+    return 'W/"' + hashlib.sha1(key.encode('utf-8')).hexdigest()[:24] + '"'
+
+
+def _cached_body(tag, build):
+    with _responses_lock:
+        if tag in _responses:
+            _responses.move_to_end(tag)
+            return _responses[tag]
+    body = build()
+    entry = (body, gzip.compress(body) if len(body) >= GZIP_MIN_BYTES else None)
+    with _responses_lock:
+        _responses[tag] = entry
+        while len(_responses) > RESPONSE_CACHE_MAX:
+            _responses.popitem(last=False)
+    return entry
+
+
+def _not_modified(headers, tag, modified):
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match is not None:
+        # If-None-Match lebih diutamakan daripada If-Modified-Since
+        tags = [t.strip() for t in if_none_match.split(',')]
+        return '*' in tags or tag in tags or tag.removeprefix('W/') in tags
+    if_modified_since = headers.get('If-Modified-Since')
+    if if_modified_since and modified is not None:
+        try:
+            return modified <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+# ============================================================
+# SERVER HTTP
+# ============================================================
+class ApiHandler(BaseHTTPRequestHandler):
+    server_version = 'DashboardTambangAPI/1.0'
+    quiet = False
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        path = url.path.rstrip('/') or '/'
+        if path not in ENDPOINTS:
+            self._send_json(404, {'error': f"Endpoint {path} tidak ada", 'endpoints': sorted(ENDPOINTS)})
+            return
+        datasets, fn = ENDPOINTS[path]
+        query = parse_qs(url.query)
+
+        try:
+            versions = refresh_versions(datasets)
+            tag = etag(path, query, versions)
+            modified = last_modified(datasets)
+            headers = {
+                'ETag': tag,
+                'Cache-Control': 'no-cache',
+                'Vary': 'Accept-Encoding',
+                'Access-Control-Allow-Origin': '*',
+            }
+            if modified is not None:
+                headers['Last-Modified'] = formatdate(modified, usegmt=True)
+            if _not_modified(self.headers, tag, modified):
+                self._send(304, b'', headers)
+                return
+
+            body, gzipped = _cached_body(tag, lambda: self._encode(fn(query)))
+        except ApiError as e:
+            self._send_json(e.status, {'error': str(e)})
+            return
+        except Exception as e:
+            self._send_json(500, {'error': str(e)})
+            return
+
+        headers['Content-Type'] = 'application/json; charset=utf-8'
+        if gzipped is not None and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            headers['Content-Encoding'] = 'gzip'
+            body = gzipped
+        self._send(200, body, headers)
+
+    @staticmethod
+    def _encode(payload):
+        return json.dumps(payload, default=_json_default, ensure_ascii=False).encode('utf-8')
+
+    def _send_json(self, status, payload):
+        self._send(status, self._encode(payload), {'Content-Type': 'application/json; charset=utf-8'})
+
+    def _send(self, status, body, headers):
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        if status != 304:
+            self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if not self.quiet:
+            super().log_message(format, *args)
+
+
+def make_server(host, port, quiet=False):
+    handler = type('Handler', (ApiHandler,), {'quiet': quiet})
+    return ThreadingHTTPServer((host, port), handler)
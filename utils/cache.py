@@ -0,0 +1,230 @@
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: hanya kunci antar-thread
+    fcntl = None
+
+# ============================================================
+# CACHE DISK (PARQUET) UNTUK HASIL LOADER
+# ============================================================
+# Hasil bersih tiap loader disimpan di data/.cache, dengan kunci sidik
+# file sumber (size + mtime + hash isi). Selama workbook tidak berubah,
+# frame dibaca dari cache tanpa parsing ulang openpyxl.
+
+CACHE_DIR = 'data/.cache'
+MANIFEST_FILE = os.path.join(CACHE_DIR, 'manifest.json')
+
+# Naikkan angka ini jika logika cleaning di loader berubah
+CACHE_VERSION = 6
+
+# Kunci df.attrs berisi dtype asli per kolom & kolom object yang isinya bilangan
+# bulat Python (ikut tersimpan di metadata parquet)
+_DTYPES_ATTR = 'cache_dtypes'
+
+_manifest_lock = threading.Lock()
+
+
+@contextmanager
+def file_lock(path):
+    """Kunci eksklusif lintas proses untuk read-modify-write file JSON bersama.
+
+    flock pada file pendamping <path>.lock: worker warm-up (spawn) dan server
+    API memperbarui file yang sama dengan server dashboard.
+    """
+    if fcntl is None:
+        yield
+        return
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f'{path}.lock', 'a') as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _write_atomic(path, data, mode='wb'):
+    """Tulis ke file sementara lalu rename, supaya pembaca tidak pernah melihat file setengah jadi"""
+    tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}"
+    with open(tmp_path, mode) as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+def _hash_file(file_path):
+    h = hashlib.sha1()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def file_fingerprint(file_path):
+    """Sidik file sumber: hash isi, di-cache per (size, mtime) agar tidak hash ulang setiap panggilan"""
+    stat = os.stat(file_path)
+    key = os.path.abspath(file_path)
+
+    entry = _read_manifest().get(key)
+    if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+        return entry['sha1']
+
+    # Hash di luar kunci; manifest dibaca ulang di dalam kunci supaya entri
+    # yang ditulis proses/thread lain sementara itu tidak hilang
+    sha1 = _hash_file(file_path)
+    try:
+        with _manifest_lock, file_lock(MANIFEST_FILE):
+            manifest = _read_manifest()
+            manifest[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha1': sha1}
+            _write_atomic(MANIFEST_FILE, json.dumps(manifest, indent=1), mode='w')
+    except Exception:
+        pass
+    return sha1
+
+
+def move_fingerprint(src, dst=None):
+    """Pindahkan entri sidik `src` ke `dst` (rename mempertahankan size/mtime),
+    atau buang bila `dst` None; entri file yang sudah tidak ada ikut dibuang"""
+    try:
+        with _manifest_lock, file_lock(MANIFEST_FILE):
+            manifest = _read_manifest()
+            entry = manifest.pop(os.path.abspath(src), None)
+            if entry and dst is not None:
+                manifest[os.path.abspath(dst)] = entry
+            manifest = {key: value for key, value in manifest.items() if os.path.exists(key)}
+            _write_atomic(MANIFEST_FILE, json.dumps(manifest, indent=1), mode='w')
+    except Exception:
+        pass
+
+
+def _cache_base(name, fingerprint, args):
+    key = json.dumps([name, CACHE_VERSION, fingerprint, list(args)], default=str)
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+    return os.path.join(CACHE_DIR, f"{name}-{digest}")
+
+
+def _is_int(value):
+    return isinstance(value, (int, np.integer)) and not isinstance(value, bool)
+
+
+def _dtype_meta(df):
+    """Dtype asli per kolom + kolom object yang semua nilai terisinya int"""
+    ints = []
+    for col in df.columns:
+        if df[col].dtype == object:
+            values = df[col].dropna()
+            if len(values) and values.map(_is_int).all():
+                ints.append(str(col))
+    return {'dtypes': {str(col): str(dtype) for col, dtype in df.dtypes.items()}, 'ints': ints}
+
+
+def _restore_dtypes(df):
+    """Kembalikan dtype hasil parse asli. Parquet menyimpan kolom object berisi
+    angka sebagai int64/float64 (int + NaN menjadi float) dan teks sebagai str
+    (NaN menjadi None), jadi tanpa ini frame dari cache berbeda dengan hasil
+    parse pertama."""
+    meta = df.attrs.pop(_DTYPES_ATTR, None) or {}
+    dtypes, ints = meta.get('dtypes', {}), set(meta.get('ints', []))
+    for col in df.columns:
+        dtype = dtypes.get(str(col))
+        if dtype == 'object':
+            # Kolom object (juga yang seluruhnya kosong): nilai kosong kembali NaN
+            values = df[col].astype(object)
+            if str(col) in ints:
+                values = pd.Series([v if pd.isna(v) else int(v) for v in values], index=values.index, dtype=object)
+            df[col] = values.where(values.notna(), np.nan)
+        elif dtype is not None and str(df[col].dtype) != dtype:
+            try:
+                df[col] = df[col].astype(dtype)
+            except (TypeError, ValueError):
+                pass
+    return df
+
+
+def _read_cached(base):
+    if os.path.exists(base + '.parquet'):
+        return _restore_dtypes(pd.read_parquet(base + '.parquet'))
+    if os.path.exists(base + '.pkl'):
+        with open(base + '.pkl', 'rb') as f:
+            return pickle.load(f)
+    return None
+
+
+def _write_cached(base, df):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    try:
+        # Parquet butuh pyarrow; kolom object campuran (str + int) juga ditolak
+        tagged = df.copy(deep=False)
+        tagged.attrs[_DTYPES_ATTR] = _dtype_meta(df)
+        _write_atomic(base + '.parquet', tagged.to_parquet(index=False))
+    except Exception:
+        _write_atomic(base + '.pkl', pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def cached_frame(name, file_path, builder, *args):
+    """Ambil hasil builder(file_path, *args) dari cache disk, parsing ulang hanya jika file berubah"""
+    base = _cache_base(name, file_fingerprint(file_path), args)
+
+    try:
+        df = _read_cached(base)
+        if df is not None:
+            return df
+    except Exception:
+        pass
+
+    df = builder(file_path, *args)
+
+    # Frame kosong biasanya tanda error parsing, jangan disimpan
+    if df is not None and not df.empty:
+        try:
+            _write_cached(base, df)
+        except Exception:
+            pass
+    return df
+
+
+def cached_version(name, fingerprint, *args):
+    """Hasil cached_frame untuk versi file bersidik `fingerprint` (mis. versi sebelum upload), None jika tidak ada"""
+    try:
+        return _read_cached(_cache_base(name, fingerprint, args))
+    except Exception:
+        return None
+
+
+def is_cached(name, file_path, *args):
+    """True jika hasil cached_frame(name, file_path, ..., *args) sudah ada di disk"""
+    base = _cache_base(name, file_fingerprint(file_path), args)
+    return os.path.exists(base + '.parquet') or os.path.exists(base + '.pkl')
+
+
+def clear_disk_cache():
+    """Hapus semua file cache disk"""
+    if not os.path.isdir(CACHE_DIR):
+        return
+    for name in os.listdir(CACHE_DIR):
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            else:
+                os.remove(path)
+        except OSError:
+            pass
@@ -1,34 +1,421 @@
+import numpy as np
 import pandas as pd
 import streamlit as st
 from datetime import datetime
+import fnmatch
+import glob
+import hashlib
+import logging
+import multiprocessing
 import os
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+from config import QUERY_ENGINE
+from utils.aggregates import build_overview_snapshot, build_produksi_cube, merge_cubes, rollup
+from utils.cache import cached_frame, cached_version, file_fingerprint, is_cached
+from utils.export import export_rows
+from utils.grid import DETAIL_COLUMNS, SEARCH_COLUMNS, DetailGrid, GridResult
+from utils.indexing import FrameIndex
+from utils.kpi import PrefixKpi, period_kpis
+from utils.partitions import PartitionSet
+from utils.perf import REGISTRY, STEP, instrument, timed
+from utils.store import Store
+from utils.streaming import HistoryChanged, combine_rows, stream_produksi_rows
+from utils.watermark import get_watermark, latest_watermark, record_watermark
 
 # ============================================================
-# 1. LOAD PRODUKSI HARIAN
+# 0. VERSI DATA
 # ============================================================
-@st.cache_data
-def load_produksi():
-    """Load data produksi harian dengan fix kolom bergeser"""
-    possible_names = [
-        'data/Produksi_UTSG_Harian.xlsx',
-        'data/Produksi UTSG Harian.xlsx',
-        'data/Produksi_UTSG_Harian .xlsx',
-    ]
-    
-    df = None
+def data_version(possible_names):
+    """Sidik singkat file sumber yang dipakai (untuk kunci cache chart dsb.)"""
     for file_path in possible_names:
         if os.path.exists(file_path):
             try:
-                df = pd.read_excel(file_path, sheet_name='Tahun 2025')
-                # File loaded successfully
-                break
-            except Exception as e:
-                pass
+                return file_fingerprint(file_path)[:12]
+            except OSError:
                 continue
-    
-    if df is None:
-        # File not found
+    return 'none'
+
+
+def files_version(file_paths):
+    """Sidik gabungan beberapa file sumber (sama dengan data_version jika hanya satu file)"""
+    fingerprints = []
+    for file_path in file_paths:
+        try:
+            fingerprints.append(file_fingerprint(file_path))
+        except OSError:
+            continue
+    if not fingerprints:
+        return 'none'
+    if len(fingerprints) == 1:
+        return fingerprints[0][:12]
+    return hashlib.sha1('|'.join(fingerprints).encode('utf-8')).hexdigest()[:12]
+
+
+def _first_existing(possible_names):
+    for file_path in possible_names:
+        if os.path.exists(file_path):
+            return file_path
+    return None
+
+
+def _file_year(file_path):
+    """Tahun di nama file (4 digit pertama), '' jika tidak ada"""
+    match = re.search(r'(\d{4})', os.path.basename(file_path))
+    return match.group(1) if match else ''
+
+
+def _yearly_files(pattern):
+    """File yang cocok dengan pola, urut tahun"""
+    return sorted(glob.glob(pattern), key=lambda fp: (_file_year(fp), fp))
+
+
+# ============================================================
+# 1. LOAD PRODUKSI HARIAN
+# ============================================================
+PRODUKSI_FILES = [
+    'data/Produksi_UTSG_Harian.xlsx',
+    'data/Produksi UTSG Harian.xlsx',
+    'data/Produksi_UTSG_Harian .xlsx',
+]
+
+
+# Workbook tahunan tambahan, mis. data/Produksi_UTSG_Harian_2026.xlsx
+PRODUKSI_YEARLY_PATTERN = 'data/Produksi_UTSG_Harian_[0-9][0-9][0-9][0-9].xlsx'
+
+# Sheet produksi per tahun: 'Tahun 2025', 'Tahun 2026', ...
+PRODUKSI_SHEET_PATTERN = re.compile(r'^Tahun \d{4}$')
+
+
+def produksi_files():
+    """Workbook produksi yang dipakai: file utama + semua file tahunan"""
+    main = _first_existing(PRODUKSI_FILES)
+    return ([main] if main else []) + _yearly_files(PRODUKSI_YEARLY_PATTERN)
+
+
+@lru_cache(maxsize=64)
+def _sheet_names(file_path, fingerprint):
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True)
+    try:
+        return tuple(wb.sheetnames)
+    finally:
+        wb.close()
+
+
+def produksi_sheets(file_path):
+    """Sheet 'Tahun YYYY' dalam workbook produksi, urut tahun"""
+    try:
+        names = _sheet_names(file_path, file_fingerprint(file_path))
+    except Exception as e:
+        # File .xls lama tidak bisa dibuka openpyxl
+        return ['Tahun 2025']
+    return sorted((n for n in names if PRODUKSI_SHEET_PATTERN.match(n.strip())), key=str.strip)
+
+
+def _produksi_sources():
+    """Pasangan (workbook, sheet tahunan) sumber data produksi, satu per tahun.
+
+    Sheet tahun yang sama bisa ada di lebih dari satu workbook (mis. file utama
+    masih memuat 'Tahun 2026' padahal sudah ada Produksi_UTSG_Harian_2026.xlsx).
+    Yang dipakai workbook tahunan untuk tahun itu, selain itu workbook pertama
+    di produksi_files() (file utama), supaya satu tahun tidak terhitung dua kali.
+    """
+    chosen = {}
+    for file_path in produksi_files():
+        for sheet in produksi_sheets(file_path):
+            year = sheet.strip()[-4:]
+            current = chosen.get(year)
+            if current is None or (_file_year(file_path) == year and _file_year(current[0]) != year):
+                chosen[year] = (file_path, sheet)
+    return [chosen[year] for year in sorted(chosen)]
+
+
+def _sheet_frame(name, file_path, builder, sheet):
+    # Sheet yang gagal di-parse dilewati (tidak menghalangi sheet lain)
+    try:
+        return cached_frame(name, file_path, builder, sheet)
+    except Exception as e:
+        return pd.DataFrame()
+
+
+def _produksi_partition_sources(name, builder):
+    """Sumber partisi per sheet tahunan: {'workbook:sheet': (sidik file, fungsi frame)}"""
+    sources = {}
+    for file_path, sheet in _produksi_sources():
+        try:
+            fingerprint = file_fingerprint(file_path)
+        except OSError:
+            continue
+        key = f'{os.path.basename(file_path)}:{sheet}'
+        sources[key] = (fingerprint, partial(_sheet_frame, name, file_path, builder, sheet))
+    return sources
+
+
+@instrument('load_produksi_partitions', st.cache_resource)
+def load_produksi_partitions(version):
+    """Partisi tahun/bulan data produksi & cube-nya (hanya sheet yang berubah yang ditulis ulang)"""
+    rows = PartitionSet('produksi', date_col='Date')
+    rows.sync(version, _produksi_partition_sources('produksi', _parse_produksi))
+    cube = PartitionSet('produksi_cube', date_col='Date')
+    cube.sync(version, _produksi_partition_sources('produksi_cube', _build_produksi_cube))
+    return rows, cube
+
+
+@instrument('load_produksi', st.cache_data)
+def load_produksi():
+    """Load data produksi harian semua tahun (semua partisi tahun/bulan).
+
+    Halaman Produksi tidak memakai ini: batas tanggal & jumlah baris diambil
+    dari manifest partisi (load_produksi_summary), KPI & Data Detail dari store
+    SQLite (kpi_produksi / detail_produksi).
+    """
+    try:
+        rows, _ = load_produksi_partitions(dataset_version('produksi'))
+        return rows.read()
+    except Exception as e:
         return pd.DataFrame()
+
+
+@instrument('load_produksi_range')
+def load_produksi_range(start_date=None, end_date=None, columns=None):
+    """Data produksi untuk rentang tanggal; hanya partisi bulan yang beririsan yang dibaca"""
+    try:
+        rows, _ = load_produksi_partitions(dataset_version('produksi'))
+        return rows.read(start_date, end_date, columns)
+    except Exception as e:
+        return pd.DataFrame()
+
+
+@instrument('load_produksi_summary', st.cache_data)
+def load_produksi_summary():
+    """Jumlah baris & batas tanggal data produksi dari manifest partisi (tanpa membaca data)"""
+    try:
+        rows, _ = load_produksi_partitions(dataset_version('produksi'))
+        start, end = rows.date_bounds()
+        to_date = lambda value: pd.Timestamp(value).date() if value else None
+        return {'rows': rows.row_count(), 'min_date': to_date(start), 'max_date': to_date(end)}
+    except Exception as e:
+        return {'rows': 0, 'min_date': None, 'max_date': None}
+
+
+@instrument('load_produksi_cube', st.cache_data)
+def load_produksi_cube():
+    """Load cube agregat produksi (dibangun sekali per versi data)"""
+    try:
+        _, cube = load_produksi_partitions(dataset_version('produksi'))
+        return cube.read()
+    except Exception as e:
+        return build_produksi_cube(pd.DataFrame())
+
+
+# Rentang tanggal berbeda yang index/grid-nya disimpan (LRU per proses)
+RANGE_CACHE_ENTRIES = 8
+
+
+@instrument('load_produksi_index', st.cache_resource(max_entries=RANGE_CACHE_ENTRIES))
+def load_produksi_index(start_date=None, end_date=None):
+    """Index tanggal & dimensi di atas data produksi satu rentang tanggal
+    (hanya partisi yang beririsan yang dibaca; read-only, dibagi antar sesi)"""
+    return FrameIndex(load_produksi_range(start_date, end_date))
+
+
+@instrument('load_produksi_cube_index', st.cache_resource)
+def load_produksi_cube_index():
+    """Index tanggal & dimensi di atas cube agregat produksi (read-only)"""
+    return FrameIndex(load_produksi_cube())
+
+
+@instrument('load_produksi_kpi', st.cache_resource)
+def load_produksi_kpi():
+    """Array prefix-sum KPI harian produksi (read-only)"""
+    return PrefixKpi(load_produksi_cube())
+
+
+@instrument('load_produksi_grid', st.cache_resource(max_entries=RANGE_CACHE_ENTRIES))
+def load_produksi_grid(start_date=None, end_date=None):
+    """Grid Data Detail (permutasi sort & label pencarian) di atas index produksi satu rentang tanggal"""
+    return DetailGrid(load_produksi_index(start_date, end_date))
+
+
+@instrument('export_produksi')
+def export_produksi(fmt, start_date=None, end_date=None, filters=None):
+    """Path file export produksi terfilter (dibuat saat diminta, di-cache per versi data & filter)"""
+    filters = filters or {}
+    key = [dataset_version('produksi'), str(start_date), str(end_date), sorted(filters.items())]
+
+    # Hanya partisi bulan yang beririsan dengan rentang yang dibaca
+    df = load_produksi_range(start_date, end_date)
+    mask = np.ones(len(df), dtype=bool)
+    for col, value in filters.items():
+        mask &= (df[col] == value).to_numpy()
+    return export_rows(df, np.flatnonzero(mask), fmt, key)
+
+
+@instrument('parse_produksi')
+def _parse_produksi(file_path, sheet_name='Tahun 2025'):
+    """Baca satu sheet tahunan secara streaming (hemat memori); jika hanya ada
+    baris baru di akhir sheet, cukup baris baru itu yang di-parse"""
+    try:
+        df = _append_produksi(file_path, sheet_name)
+        if df is not None:
+            return df
+    except Exception as e:
+        pass
+
+    watermark = None
+    try:
+        # Baca workbook + validasi & perbaikan kolom bergeser per baris
+        with timed('produksi.stream') as t:
+            normal, shifted, watermark = stream_produksi_rows(file_path, sheet_name)
+            df = combine_rows(normal, shifted) if watermark is not None else pd.DataFrame()
+            t.rows_out = len(df)
+        # Pastikan kolom selalu ada (untuk bulan lama)
+        for col in ['BLOK', 'Dump Loc']:
+            if col not in df.columns:
+                df[col] = ''
+    except Exception as e:
+        # Fallback: file .xls lama tidak bisa dibaca openpyxl read-only
+        df = _parse_produksi_pandas(file_path, sheet_name)
+    
+    if df.empty:
+        return df
+    with timed('produksi.compact') as t:
+        t.rows_in = len(df)
+        df = _compact_produksi(df)
+    if watermark is not None:
+        record_watermark('produksi', file_fingerprint(file_path), sheet_name, watermark)
+    return df
+
+
+def _append_produksi(file_path, sheet_name):
+    """Sheet = versi sebelumnya + baris baru di akhir: parse & bersihkan ekornya saja lalu
+    sambung ke frame lama dari cache disk. None jika baris lama berubah (parse penuh)"""
+    fingerprint = file_fingerprint(file_path)
+    parent = latest_watermark('produksi', sheet_name, exclude=fingerprint)
+    if parent is None:
+        return None
+    old = cached_version('produksi', parent['fingerprint'], sheet_name)
+    if old is None or len(old) != parent['normal'] + parent['shifted']:
+        return None
+
+    try:
+        with timed('produksi.stream_tail') as t:
+            normal, shifted, watermark = stream_produksi_rows(file_path, sheet_name, previous=parent)
+            t.rows_out = len(normal) + len(shifted)
+    except HistoryChanged:
+        return None
+    if len(shifted) and not parent['shifted']:
+        # Frame lama tanpa baris bergeser memakai BLOK '' di semua baris
+        return None
+
+    # Urutan hasil parse penuh: [normal lama, normal baru, bergeser lama, bergeser baru]
+    n_old, s_old, n_new = parent['normal'], parent['shifted'], len(normal)
+    appended = []
+    df = old
+    if len(normal) or len(shifted):
+        tail = combine_rows(normal, shifted, has_shifted=s_old > 0)
+        tail = _compact_produksi(tail)
+        df = pd.concat(
+            [old.iloc[:n_old], tail.iloc[:n_new], old.iloc[n_old:], tail.iloc[n_new:]],
+            ignore_index=True,
+        )
+        df = _categorize_produksi(df)
+        appended = [[n_old, n_old + n_new], [n_old + n_new + s_old, len(df)]]
+
+    record_watermark('produksi', fingerprint, sheet_name, watermark,
+                     parent=parent['fingerprint'], appended=appended)
+    return df
+
+
+def _build_produksi_cube(file_path, sheet_name='Tahun 2025'):
+    """Cube satu sheet; setelah upload append, cube versi lama + cube baris baru saja"""
+    df = cached_frame('produksi', file_path, _parse_produksi, sheet_name)
+    entry = get_watermark('produksi', file_fingerprint(file_path), sheet_name)
+    if entry and entry['parent']:
+        old = cached_version('produksi_cube', entry['parent'], sheet_name)
+        if old is not None:
+            rows = np.concatenate([np.arange(a, b) for a, b in entry['appended']] or [np.arange(0)])
+            return merge_cubes([old, build_produksi_cube(df.iloc[rows])])
+    return build_produksi_cube(df)
+
+
+# Kolom dimensi produksi yang disimpan sebagai categorical
+PRODUKSI_DIMENSIONS = ['Time', 'Shift', 'BLOK', 'Front', 'Commudity', 'Excavator', 'Dump Loc']
+
+
+def _compact_produksi(df):
+    """Skema ringkas: dimensi categorical, Date datetime64, Dump Truck int, Rit/Tonnase float32"""
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce')
+    
+    df = _categorize_produksi(df)
+    
+    # Dump Truck sudah divalidasi hanya berisi digit
+    df['Dump Truck'] = pd.to_numeric(df['Dump Truck'], errors='coerce').astype('int32')
+    df['Rit'] = df['Rit'].astype('float32')
+    df['Tonnase'] = df['Tonnase'].astype('float32')
+    
+    return _add_time_columns(df)
+
+
+def _categorize_produksi(df):
+    for col in PRODUKSI_DIMENSIONS:
+        # Nilai campuran (angka & teks) disamakan ke teks dulu supaya kategori konsisten
+        values = df[col].astype(object)
+        values = values.where(values.isna(), values.astype(str))
+        df[col] = values.astype('category')
+    return df
+
+
+# Shift 3 berjalan 22:00-06:00; baris jam 00-05 tetap memakai tanggal awal shift
+SHIFT_MALAM = 'Shift 3'
+JAM_AKHIR_SHIFT_MALAM = 6
+
+
+def _parse_time_categories(time_col):
+    """Jam & menit awal dari kategori Time ('07:00-08:00' -> 7, 0); -1 jika kosong/tidak valid"""
+    labels = pd.Series(time_col.cat.categories.astype(str))
+    parts = labels.str.extract(r'^\s*(\d{1,2})\s*[:.]\s*(\d{2})')
+    hour = pd.to_numeric(parts[0], errors='coerce')
+    minute = pd.to_numeric(parts[1], errors='coerce')
+    valid = hour.between(0, 23) & minute.between(0, 59)
+    hour = hour.where(valid).fillna(-1).astype('int8').to_numpy()
+    minute = minute.where(valid).fillna(-1).astype('int8').to_numpy()
+    return hour, minute
+
+
+def _add_time_columns(df):
+    """Kolom waktu turunan (int8) dihitung sekali saat load: Jam, Menit, Minggu ISO,
+    Bulan, Hari (0=Senin) dan Lintas Hari (1 = Shift 3 setelah tengah malam)"""
+    # Parsing hanya atas kategori Time yang unik, lalu dipetakan lewat kode
+    hour, minute = _parse_time_categories(df['Time'])
+    codes = df['Time'].cat.codes.to_numpy()
+    # Kode -1 (Time kosong) menunjuk ke elemen -1 terakhir
+    df['Jam'] = np.append(hour, -1).astype('int8')[codes]
+    df['Menit'] = np.append(minute, -1).astype('int8')[codes]
+
+    date = df['Date']
+    df['Minggu'] = date.dt.isocalendar().week.astype('float64').fillna(-1).astype('int8')
+    df['Bulan'] = date.dt.month.fillna(-1).astype('int8')
+    df['Hari'] = date.dt.dayofweek.fillna(-1).astype('int8')
+
+    after_midnight = (
+        (df['Shift'] == SHIFT_MALAM).to_numpy()
+        & (df['Jam'] >= 0).to_numpy()
+        & (df['Jam'] < JAM_AKHIR_SHIFT_MALAM).to_numpy()
+    )
+    df['Lintas Hari'] = after_midnight.astype('int8')
+    return df
+
+
+@instrument('parse_produksi_pandas')
+def _parse_produksi_pandas(file_path, sheet_name='Tahun 2025'):
+    """Baca satu sheet tahunan lalu bersihkan"""
+    with timed('produksi.read_excel'):
+        df = pd.read_excel(file_path, sheet_name=sheet_name)
     
     try:
         # Hapus header berulang & validasi shift
@@ -102,250 +489,784 @@ def load_produksi():
 # ============================================================
 # 2. LOAD GANGGUAN
 # ============================================================
-@st.cache_data
+BULAN_LIST = ["Januari", "Februari", "Maret", "April", "Mei", "Juni", "Juli",
+              "Agustus", "September", "Oktober", "November", "Desember"]
+
+
+GANGGUAN_FILES = [
+    'data/Gangguan_Produksi_2025_baru.xlsx',
+    'data/Gangguan Produksi 2025 baru.xlsx',
+]
+
+# Workbook gangguan per tahun, mis. data/Gangguan_Produksi_2026_baru.xlsx
+GANGGUAN_YEARLY_PATTERN = 'data/Gangguan_Produksi_[0-9][0-9][0-9][0-9]*.xlsx'
+
+
+def gangguan_files():
+    """Workbook gangguan yang dipakai: tahun terbaru, jatuh ke nama lama jika tidak ada"""
+    yearly = _yearly_files(GANGGUAN_YEARLY_PATTERN)
+    if yearly:
+        return yearly[-1:]
+    main = _first_existing(GANGGUAN_FILES)
+    return [main] if main else []
+
+
+@instrument('load_gangguan_all', st.cache_data)
+def load_gangguan_all():
+    """Load data gangguan semua bulan sekaligus (long-form, kolom Bulan)"""
+    for file_path in gangguan_files():
+        try:
+            return cached_frame('gangguan_all', file_path, _parse_gangguan_all)
+        except Exception as e:
+            continue
+    
+    return pd.DataFrame()
+
+
+@instrument('load_gangguan', st.cache_data)
 def load_gangguan(bulan):
     """Load data gangguan per bulan"""
-    possible_names = [
-        'data/Gangguan_Produksi_2025_baru.xlsx',
-        'data/Gangguan Produksi 2025 baru.xlsx',
-    ]
+    dg = load_gangguan_all()
+    if dg.empty:
+        return pd.DataFrame()
     
-    sheet = f'Monitoring {bulan}'
+    df = dg[dg['Bulan'] == bulan].drop(columns='Bulan')
+    return df.reset_index(drop=True)
+
+
+@instrument('load_gangguan_ytd', st.cache_data)
+def load_gangguan_ytd():
+    """Total year-to-date: frekuensi semua bulan dijumlahkan per jenis gangguan"""
+    dg = load_gangguan_all()
+    if dg.empty:
+        return pd.DataFrame()
+
+    dg = dg.assign(**{'Row Labels': dg['Row Labels'].astype(str)})
+    dg = dg.groupby('Row Labels', sort=False)['Frekuensi'].sum().reset_index()
+    dg = dg.sort_values('Frekuensi', ascending=False).reset_index(drop=True)
+    dg['Persentase'] = dg['Frekuensi'] / dg['Frekuensi'].sum()
+    return dg
+
+
+@instrument('parse_gangguan_all')
+def _parse_gangguan_all(file_path):
+    # Satu kali buka workbook untuk semua sheet 'Monitoring <bulan>'
+    with timed('gangguan.read_excel'), pd.ExcelFile(file_path) as xls:
+        sheet_bulan = {f'Monitoring {b}': b for b in BULAN_LIST if f'Monitoring {b}' in xls.sheet_names}
+        sheets = pd.read_excel(xls, sheet_name=list(sheet_bulan), skiprows=1)
     
-    for file_path in possible_names:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_excel(file_path, sheet_name=sheet, skiprows=1)
-                
-                # Rename kolom
-                if len(df.columns) >= 3:
-                    df.columns = ['Row Labels', 'Frekuensi', 'Persentase']
-                
-                # Clean data
-                df = df[df['Row Labels'] != 'Row Labels']
-                df = df[df['Row Labels'] != 'Grand Total']
-                df['Frekuensi'] = pd.to_numeric(df['Frekuensi'], errors='coerce')
-                df = df.dropna(subset=['Frekuensi'])
-                df = df[df['Frekuensi'] > 0]
-                df = df.reset_index(drop=True)
-                
-                return df
-            except Exception as e:
-                continue
+    frames = []
+    for sheet, bulan in sheet_bulan.items():
+        try:
+            df = _clean_gangguan(sheets[sheet])
+        except Exception as e:
+            continue
+        df['Bulan'] = bulan
+        frames.append(df)
     
-    return pd.DataFrame()
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def _clean_gangguan(df):
+    # Rename kolom
+    if len(df.columns) >= 3:
+        df.columns = ['Row Labels', 'Frekuensi', 'Persentase']
+    
+    # Clean data
+    df = df[df['Row Labels'] != 'Row Labels']
+    df = df[df['Row Labels'] != 'Grand Total']
+    df['Frekuensi'] = pd.to_numeric(df['Frekuensi'], errors='coerce')
+    df = df.dropna(subset=['Frekuensi'])
+    df = df[df['Frekuensi'] > 0]
+    df = df.reset_index(drop=True)
+    
+    return df
+
+
+# ============================================================
+# 3. LOAD MONITORING (BBM, Ritase, Analisa Produksi sekaligus)
+# ============================================================
+# Sheet Monitoring_2025_.xlsx yang dipakai dashboard
+MONITORING_SHEETS = ['BBM', 'Ritase', 'Analisa Produksi']
+
+# Mapping bulan ke index kolom di sheet Analisa Produksi
+ANALISA_BULAN_MAP = {
+    'Januari': 0,
+    'Februari': 5,
+}
+
+
+MONITORING_FILES = [
+    'data/Monitoring_2025_.xlsx',
+    'data/Monitoring 2025_.xlsx',
+]
+
+# Workbook monitoring per tahun, mis. data/Monitoring_2026_.xlsx
+MONITORING_YEARLY_PATTERN = 'data/Monitoring_[0-9][0-9][0-9][0-9]*.xlsx'
+
+
+def monitoring_files():
+    """Semua workbook monitoring tahunan (urut tahun), jatuh ke nama lama jika tidak ada"""
+    yearly = _yearly_files(MONITORING_YEARLY_PATTERN)
+    if yearly:
+        return yearly
+    main = _first_existing(MONITORING_FILES)
+    return [main] if main else []
+
+
+@instrument('load_monitoring', st.cache_data)
+def load_monitoring():
+    """Load semua sheet monitoring dalam satu kali buka workbook (workbook tahun terbaru)"""
+    for file_path in reversed(monitoring_files()):
+        try:
+            return _parse_monitoring(file_path)
+        except Exception as e:
+            continue
+    
+    return {'bbm': pd.DataFrame(), 'ritase': pd.DataFrame(), 'analisa_produksi': {}}
+
+
+def _ritase_frame(file_path):
+    try:
+        return _parse_monitoring(file_path)['ritase']
+    except Exception as e:
+        return pd.DataFrame()
+
+
+def _ritase_sources():
+    """Sumber partisi ritase per workbook monitoring: {nama file: (sidik, fungsi frame)}"""
+    sources = {}
+    for file_path in monitoring_files():
+        try:
+            sources[os.path.basename(file_path)] = (file_fingerprint(file_path), partial(_ritase_frame, file_path))
+        except OSError:
+            continue
+    return sources
+
+
+@instrument('load_ritase_partitions', st.cache_resource)
+def load_ritase_partitions(version):
+    """Partisi tahun/bulan data ritase semua tahun (hanya workbook yang berubah yang ditulis ulang)"""
+    rows = PartitionSet('ritase', date_col='Tanggal')
+    rows.sync(version, _ritase_sources())
+    return rows
+
+
+@instrument('parse_monitoring')
+def _parse_monitoring(file_path):
+    # Workbook hanya dibuka (sekali) jika ada hasil yang belum ada di cache disk
+    sheets = {}
+
+    def sheet(name):
+        if not sheets:
+            with timed('monitoring.read_excel'):
+                sheets.update(pd.read_excel(file_path, sheet_name=MONITORING_SHEETS))
+        return sheets[name].copy()
+
+    def piece(name, clean, sheet_name, *args):
+        # Satu sheet gagal dibersihkan tidak boleh mengosongkan sheet lain
+        try:
+            return cached_frame(name, file_path, lambda fp, *a: clean(sheet(sheet_name), *a), *args)
+        except Exception as e:
+            return pd.DataFrame()
+
+    result = {
+        'bbm': piece('bbm', _clean_bbm, 'BBM'),
+        'ritase': piece('ritase', _clean_ritase, 'Ritase'),
+        'analisa_produksi': {},
+    }
+    for bulan in ANALISA_BULAN_MAP:
+        result['analisa_produksi'][bulan] = piece(
+            'analisa_produksi', _clean_analisa_produksi, 'Analisa Produksi', bulan
+        )
+    return result
 
 
 # ============================================================
-# 3. LOAD BBM
+# 4. LOAD BBM
 # ============================================================
-@st.cache_data
+@instrument('load_bbm', st.cache_data)
 def load_bbm():
     """Load data BBM"""
-    possible_names = [
-        'data/Monitoring_2025_.xlsx',
-        'data/Monitoring 2025_.xlsx',
-    ]
+    return load_monitoring()['bbm']
+
+
+def _clean_bbm(df):
+    # Hapus baris header yang ikut terbaca
+    if 'Total' in df.columns:
+        df = df[df['Total'] != 'Total']
+        df['Total'] = pd.to_numeric(df['Total'], errors='coerce').fillna(0)
     
-    for file_path in possible_names:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_excel(file_path, sheet_name='BBM')
-                
-                # Hapus baris header yang ikut terbaca
-                if 'Total' in df.columns:
-                    df = df[df['Total'] != 'Total']
-                    df['Total'] = pd.to_numeric(df['Total'], errors='coerce').fillna(0)
-                
-                # Convert kolom tanggal (1-31) ke numerik
-                for col in df.columns:
-                    if col not in ['No', 'Alat Berat', 'Tipe Alat', 'Total']:
-                        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                
-                # Filter data valid
-                df = df[df['No'].notna()]
-                df = df[df['Alat Berat'].notna()]
-                df = df.reset_index(drop=True)
-                
-                return df
-            except Exception as e:
-                continue
+    # Convert kolom tanggal (1-31) ke numerik
+    for col in df.columns:
+        if col not in ['No', 'Alat Berat', 'Tipe Alat', 'Total']:
+            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
     
-    return pd.DataFrame()
+    # Filter data valid
+    df = df[df['No'].notna()]
+    df = df[df['Alat Berat'].notna()]
+    df = df.reset_index(drop=True)
+    
+    return df
 
 
 # ============================================================
-# 4. LOAD ANALISA PRODUKSI (Plan vs Aktual)
+# 5. LOAD ANALISA PRODUKSI (Plan vs Aktual)
 # ============================================================
-@st.cache_data
+@instrument('load_analisa_produksi', st.cache_data)
 def load_analisa_produksi(bulan='Januari'):
     """Load data analisa produksi per bulan"""
-    possible_names = [
-        'data/Monitoring_2025_.xlsx',
-        'data/Monitoring 2025_.xlsx',
-    ]
-    
-    # Mapping bulan ke index kolom
-    bulan_map = {
-        'Januari': 0,
-        'Februari': 5,
-    }
+    return load_monitoring()['analisa_produksi'].get(bulan, pd.DataFrame())
+
+
+def _clean_analisa_produksi(df, bulan):
+    start_col = ANALISA_BULAN_MAP[bulan]
     
-    if bulan not in bulan_map:
-        return pd.DataFrame()
+    # Ambil kolom untuk bulan tertentu
+    df_bulan = df.iloc[1:32, start_col:start_col+4].copy()
+    df_bulan.columns = ['Tanggal', 'Plan', 'Aktual', 'Ketercapaian']
     
-    start_col = bulan_map[bulan]
+    # Clean data
+    df_bulan['Tanggal'] = pd.to_numeric(df_bulan['Tanggal'], errors='coerce')
+    df_bulan['Plan'] = pd.to_numeric(df_bulan['Plan'], errors='coerce')
+    df_bulan['Aktual'] = pd.to_numeric(df_bulan['Aktual'], errors='coerce')
+    df_bulan['Ketercapaian'] = pd.to_numeric(df_bulan['Ketercapaian'], errors='coerce')
     
-    for file_path in possible_names:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_excel(file_path, sheet_name='Analisa Produksi')
-                
-                # Ambil kolom untuk bulan tertentu
-                df_bulan = df.iloc[1:32, start_col:start_col+4].copy()
-                df_bulan.columns = ['Tanggal', 'Plan', 'Aktual', 'Ketercapaian']
-                
-                # Clean data
-                df_bulan['Tanggal'] = pd.to_numeric(df_bulan['Tanggal'], errors='coerce')
-                df_bulan['Plan'] = pd.to_numeric(df_bulan['Plan'], errors='coerce')
-                df_bulan['Aktual'] = pd.to_numeric(df_bulan['Aktual'], errors='coerce')
-                df_bulan['Ketercapaian'] = pd.to_numeric(df_bulan['Ketercapaian'], errors='coerce')
-                
-                df_bulan = df_bulan.dropna(subset=['Tanggal'])
-                df_bulan['Bulan'] = bulan
-                df_bulan = df_bulan.reset_index(drop=True)
-                
-                return df_bulan
-            except Exception as e:
-                continue
+    df_bulan = df_bulan.dropna(subset=['Tanggal'])
+    df_bulan['Bulan'] = bulan
+    df_bulan = df_bulan.reset_index(drop=True)
     
-    return pd.DataFrame()
+    return df_bulan
 
 
 # ============================================================
-# 5. LOAD RITASE
+# 6. LOAD RITASE
 # ============================================================
-@st.cache_data
+@instrument('load_ritase', st.cache_data)
 def load_ritase():
-    """Load data ritase dengan cleaning"""
-    possible_names = [
-        'data/Monitoring_2025_.xlsx',
-        'data/Monitoring 2025_.xlsx',
-    ]
+    """Load data ritase dengan cleaning (semua tahun, dari partisi)"""
+    try:
+        df = load_ritase_partitions(dataset_version('monitoring')).read()
+    except Exception as e:
+        df = pd.DataFrame()
+    return df if not df.empty else load_monitoring()['ritase']
+
+
+def _clean_ritase(df):
+    # Kolom yang dibutuhkan (sampai kolom 16)
+    cols_keep = ['Tanggal', 'Shift', 'Pengawasan', 'Front B LS', 'Front B Clay', 
+                'Front B LS MIX', 'Front C LS', 'Front C LS MIX', 'PLB LS', 
+                'PLB SS', 'PLT SS', 'PLT MIX', 'Timbunan', 'Stockpile 6  SS', 
+                'PLT LS MIX', 'Stockpile 6 ']
     
-    for file_path in possible_names:
-        if os.path.exists(file_path):
-            try:
-                df = pd.read_excel(file_path, sheet_name='Ritase')
-                
-                # Kolom yang dibutuhkan (sampai kolom 16)
-                cols_keep = ['Tanggal', 'Shift', 'Pengawasan', 'Front B LS', 'Front B Clay', 
-                            'Front B LS MIX', 'Front C LS', 'Front C LS MIX', 'PLB LS', 
-                            'PLB SS', 'PLT SS', 'PLT MIX', 'Timbunan', 'Stockpile 6  SS', 
-                            'PLT LS MIX', 'Stockpile 6 ']
-                
-                available_cols = [col for col in cols_keep if col in df.columns]
-                df = df[available_cols].copy()
-                
-                # Convert Tanggal
-                df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
-                df = df[df['Tanggal'].notna()]
-                
-                # Hapus baris dengan Shift bukan angka
-                df = df[df['Shift'].isin([1, 2, 3, '1', '2', '3'])]
-                df['Shift'] = df['Shift'].astype(str)
-                
-                # Convert kolom numerik
-                numeric_cols = [col for col in df.columns if col not in ['Tanggal', 'Shift', 'Pengawasan']]
-                for col in numeric_cols:
-                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                
-                df = df.reset_index(drop=True)
-                return df
-            except Exception as e:
-                continue
+    available_cols = [col for col in cols_keep if col in df.columns]
+    df = df[available_cols].copy()
     
-    return pd.DataFrame()
+    # Convert Tanggal
+    df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
+    df = df[df['Tanggal'].notna()]
+    
+    # Hapus baris dengan Shift bukan angka
+    df = df[df['Shift'].isin([1, 2, 3, '1', '2', '3'])]
+    df['Shift'] = df['Shift'].astype(str)
+    
+    # Convert kolom numerik
+    numeric_cols = [col for col in df.columns if col not in ['Tanggal', 'Shift', 'Pengawasan']]
+    for col in numeric_cols:
+        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+    
+    df = df.reset_index(drop=True)
+    return df
 
 
 # ============================================================
-# 6. LOAD DAILY PLAN
+# 7. LOAD DAILY PLAN
 # ============================================================
-@st.cache_data
+DAILY_PLAN_FILES = ['data/DAILY_PLAN.xlsx']
+
+
+@instrument('load_daily_plan', st.cache_data)
 def load_daily_plan():
     """Load data daily plan scheduling"""
     try:
-        df = pd.read_excel('data/DAILY_PLAN.xlsx', sheet_name='W22 Scheduling', skiprows=1)
-        
-        # Rename kolom dari baris pertama
-        new_cols = ['No', 'Hari', 'Tanggal', 'Shift', 'Batu Kapur', 'Silika', 
-                    'Clay', 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan']
-        
-        if len(df.columns) >= len(new_cols):
-            df.columns = new_cols + list(df.columns[len(new_cols):])
-        
-        # Skip header row
-        df = df.iloc[1:].copy()
-        
-        # Clean Tanggal
-        df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
-        
-        # Filter data valid
-        df = df[df['Hari'].notna()]
-        df = df[df['Hari'] != 'Hari']
-        
-        # Ambil kolom yang dibutuhkan
-        cols_keep = ['Hari', 'Tanggal', 'Shift', 'Batu Kapur', 'Silika', 'Clay', 
-                     'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan']
-        available = [c for c in cols_keep if c in df.columns]
-        df = df[available].copy()
-        
-        df = df.dropna(how='all')
-        df = df.reset_index(drop=True)
-        
-        return df
+        return cached_frame('daily_plan', DAILY_PLAN_FILES[0], _parse_daily_plan)
     except Exception as e:
         pass
         return pd.DataFrame()
 
 
+@instrument('parse_daily_plan')
+def _parse_daily_plan(file_path):
+    with timed('daily_plan.read_excel'):
+        df = pd.read_excel(file_path, sheet_name='W22 Scheduling', skiprows=1)
+    
+    # Rename kolom dari baris pertama
+    new_cols = ['No', 'Hari', 'Tanggal', 'Shift', 'Batu Kapur', 'Silika', 
+                'Clay', 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan']
+    
+    if len(df.columns) >= len(new_cols):
+        df.columns = new_cols + list(df.columns[len(new_cols):])
+    
+    # Skip header row
+    df = df.iloc[1:].copy()
+    
+    # Clean Tanggal
+    df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
+    
+    # Filter data valid
+    df = df[df['Hari'].notna()]
+    df = df[df['Hari'] != 'Hari']
+    
+    # Ambil kolom yang dibutuhkan
+    cols_keep = ['Hari', 'Tanggal', 'Shift', 'Batu Kapur', 'Silika', 'Clay', 
+                 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 'ROM', 'Keterangan']
+    available = [c for c in cols_keep if c in df.columns]
+    df = df[available].copy()
+    
+    df = df.dropna(how='all')
+    df = df.reset_index(drop=True)
+    
+    return df
+
+
 # ============================================================
-# 7. LOAD REALISASI
+# 8. LOAD REALISASI
 # ============================================================
-@st.cache_data
+@instrument('load_realisasi', st.cache_data)
 def load_realisasi():
     """Load data realisasi dari W22 realisasi"""
     try:
-        df = pd.read_excel('data/DAILY_PLAN.xlsx', sheet_name='W22 realisasi', skiprows=1)
-        
-        # Rename kolom
-        new_cols = ['No', 'Hari', 'Tanggal', 'Week', 'Shift', 'Batu Kapur', 'Silika', 
-                    'Timbunan', 'Alat Bor', 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 
-                    'ROM', 'Keterangan']
-        
-        if len(df.columns) >= len(new_cols):
-            df.columns = new_cols + list(df.columns[len(new_cols):])
-        
-        # Skip header row
-        df = df.iloc[1:].copy()
-        
-        # Clean Tanggal
-        df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
-        
-        # Filter valid
-        df = df[df['Hari'].notna()]
-        df = df[df['Hari'] != 'Hari']
-        
-        cols_keep = ['Hari', 'Tanggal', 'Week', 'Shift', 'Batu Kapur', 'Silika', 
-                     'Timbunan', 'Alat Bor', 'Alat Muat', 'Alat Angkut', 'Blok', 
-                     'Grid', 'ROM', 'Keterangan']
-        available = [c for c in cols_keep if c in df.columns]
-        df = df[available].copy()
-        
-        df = df.dropna(how='all')
-        df = df.reset_index(drop=True)
-        
-        return df
+        return cached_frame('realisasi', DAILY_PLAN_FILES[0], _parse_realisasi)
     except Exception as e:
         pass
-        return pd.DataFrame()
\ No newline at end of file
+        return pd.DataFrame()
+
+
+@instrument('parse_realisasi')
+def _parse_realisasi(file_path):
+    with timed('realisasi.read_excel'):
+        df = pd.read_excel(file_path, sheet_name='W22 realisasi', skiprows=1)
+    
+    # Rename kolom
+    new_cols = ['No', 'Hari', 'Tanggal', 'Week', 'Shift', 'Batu Kapur', 'Silika', 
+                'Timbunan', 'Alat Bor', 'Alat Muat', 'Alat Angkut', 'Blok', 'Grid', 
+                'ROM', 'Keterangan']
+    
+    if len(df.columns) >= len(new_cols):
+        df.columns = new_cols + list(df.columns[len(new_cols):])
+    
+    # Skip header row
+    df = df.iloc[1:].copy()
+    
+    # Clean Tanggal
+    df['Tanggal'] = pd.to_datetime(df['Tanggal'], errors='coerce')
+    
+    # Filter valid
+    df = df[df['Hari'].notna()]
+    df = df[df['Hari'] != 'Hari']
+    
+    cols_keep = ['Hari', 'Tanggal', 'Week', 'Shift', 'Batu Kapur', 'Silika', 
+                 'Timbunan', 'Alat Bor', 'Alat Muat', 'Alat Angkut', 'Blok', 
+                 'Grid', 'ROM', 'Keterangan']
+    available = [c for c in cols_keep if c in df.columns]
+    df = df[available].copy()
+    
+    df = df.dropna(how='all')
+    df = df.reset_index(drop=True)
+    
+    return df
+
+
+# ============================================================
+# 9. SNAPSHOT OVERVIEW
+# ============================================================
+@instrument('load_overview_snapshot', st.cache_resource)
+def load_overview_snapshot():
+    """Snapshot KPI & tabel Overview (read-only, dihitung sekali per versi data)"""
+    return build_overview_snapshot(load_produksi_cube(), load_bbm(), load_gangguan("Januari"), load_produksi_kpi())
+
+
+# ============================================================
+# 10. REGISTRY DATASET (INVALIDASI CACHE PER UPLOAD)
+# ============================================================
+# Tiap dataset: file sumber (semua tahun), nama upload default (kunci tombol
+# upload halaman; tujuan sebenarnya lihat upload_target), fungsi build (mengisi
+# cache disk dari sebuah file), entri cache disk yang wajib ada setelah build
+# dan semua cache Streamlit yang bergantung padanya
+# (loader, index, agregat, snapshot). Upload satu file hanya membersihkan
+# rantai cache dataset itu; dataset lain tetap hangat.
+# Cache disk (data/.cache) tidak perlu dihapus karena kuncinya sidik isi file.
+def _require(df, label):
+    # File yang tidak menghasilkan data jangan sampai menggantikan versi lama
+    if df is None or len(df) == 0:
+        raise ValueError(f"Data {label} kosong atau format file tidak dikenali")
+
+
+def _build_produksi_caches(file_path):
+    # Satu entri cache disk (frame & cube) per sheet tahunan
+    sheets = produksi_sheets(file_path)
+    frames = [cached_frame('produksi', file_path, _parse_produksi, sheet) for sheet in sheets]
+    _require(pd.concat(frames) if frames else None, 'produksi')
+    for sheet in sheets:
+        cached_frame('produksi_cube', file_path, _build_produksi_cube, sheet)
+
+
+def _build_gangguan_caches(file_path):
+    _require(cached_frame('gangguan_all', file_path, _parse_gangguan_all), 'gangguan')
+
+
+def _build_monitoring_caches(file_path):
+    result = _parse_monitoring(file_path)
+    if result['bbm'].empty and result['ritase'].empty:
+        _require(None, 'monitoring')
+
+
+def _build_daily_plan_caches(file_path):
+    _require(cached_frame('daily_plan', file_path, _parse_daily_plan), 'daily plan')
+    cached_frame('realisasi', file_path, _parse_realisasi)
+
+
+DATASETS = {
+    'produksi': {
+        'sources': produksi_files,
+        'upload_name': 'Produksi_UTSG_Harian.xlsx',
+        'yearly_pattern': PRODUKSI_YEARLY_PATTERN,
+        # Workbook utama (multi-sheet) terpisah dari file tahunan
+        'main_file': lambda: _first_existing(PRODUKSI_FILES),
+        'build': _build_produksi_caches,
+        'disk': lambda file_path: [
+            (name, sheet) for sheet in produksi_sheets(file_path) for name in ('produksi', 'produksi_cube')
+        ],
+        'caches': [
+            load_produksi_partitions, load_produksi, load_produksi_summary, load_produksi_cube,
+            load_produksi_index, load_produksi_cube_index, load_produksi_kpi, load_produksi_grid,
+            load_overview_snapshot,
+        ],
+    },
+    'gangguan': {
+        'sources': gangguan_files,
+        'upload_name': 'Gangguan_Produksi_2025_baru.xlsx',
+        'yearly_pattern': GANGGUAN_YEARLY_PATTERN,
+        'build': _build_gangguan_caches,
+        'disk': [('gangguan_all',)],
+        'caches': [load_gangguan_all, load_gangguan, load_gangguan_ytd, load_overview_snapshot],
+    },
+    'monitoring': {
+        'sources': monitoring_files,
+        'upload_name': 'Monitoring_2025_.xlsx',
+        'yearly_pattern': MONITORING_YEARLY_PATTERN,
+        'build': _build_monitoring_caches,
+        'disk': [('bbm',), ('ritase',)],
+        'caches': [
+            load_monitoring, load_bbm, load_analisa_produksi,
+            load_ritase_partitions, load_ritase,
+            load_overview_snapshot,
+        ],
+    },
+    'daily_plan': {
+        'sources': lambda: [fp for fp in DAILY_PLAN_FILES if os.path.exists(fp)],
+        'upload_name': 'DAILY_PLAN.xlsx',
+        'build': _build_daily_plan_caches,
+        'disk': [('daily_plan',)],
+        'caches': [load_daily_plan, load_realisasi],
+    },
+}
+
+
+def dataset_for_upload(target_name):
+    """Nama dataset untuk file tujuan upload, None jika tidak terdaftar"""
+    for name, spec in DATASETS.items():
+        if spec['upload_name'] == target_name:
+            return name
+    return None
+
+
+def upload_target(name, uploaded_name=None):
+    """Path tujuan file upload dataset `name`.
+
+    Nama file upload yang cocok dengan pola tahunan dataset (mis.
+    Gangguan_Produksi_2026_baru.xlsx) dipakai apa adanya, sehingga tahun baru
+    menjadi workbook sendiri dan histori tahun lain tidak tertimpa. Selain itu
+    upload menggantikan file utama dataset: workbook produksi utama (bukan
+    file tahunan), atau workbook terbaru untuk dataset yang hanya punya file
+    tahunan; nama default jika belum ada file sama sekali.
+    """
+    spec = DATASETS[name]
+    pattern = spec.get('yearly_pattern')
+    if uploaded_name and pattern:
+        candidate = os.path.join('data', os.path.basename(uploaded_name))
+        if fnmatch.fnmatch(candidate, pattern):
+            return candidate
+    main_file = spec['main_file']() if 'main_file' in spec else dataset_file(name)
+    return main_file or os.path.join('data', spec['upload_name'])
+
+
+def invalidate_dataset(name):
+    """Bersihkan semua cache Streamlit yang bergantung pada dataset `name`"""
+    for cached_fn in DATASETS[name]['caches']:
+        cached_fn.clear()
+
+
+@instrument('build_dataset')
+def build_dataset(name, file_path):
+    """Parsing + agregat dataset dari `file_path` ke cache disk (tanpa menyentuh cache Streamlit)"""
+    DATASETS[name]['build'](file_path)
+
+
+# ============================================================
+# 11. WARM-UP PARALEL (COLD START)
+# ============================================================
+# Tiap workbook di-parse openpyxl (CPU-bound, kena GIL), jadi saat cache disk
+# kosong semua workbook di-parse bersamaan di proses terpisah. Proses utama
+# lalu cukup membaca parquet, sehingga cold start ~ workbook paling lambat,
+# bukan jumlah semuanya.
+def dataset_file(name):
+    """File sumber utama dataset (tahun terbaru), None jika tidak ada"""
+    sources = DATASETS[name]['sources']()
+    return sources[-1] if sources else None
+
+
+def dataset_version(name):
+    """Versi gabungan semua file sumber sebuah dataset"""
+    return files_version(DATASETS[name]['sources']())
+
+
+def data_versions():
+    """Versi semua dataset, untuk kunci cache yang bergantung pada seluruh data"""
+    return tuple(dataset_version(name) for name in DATASETS)
+
+
+def _dataset_is_cached(name, file_path):
+    disk = DATASETS[name]['disk']
+    try:
+        keys = disk(file_path) if callable(disk) else disk
+        return all(is_cached(key[0], file_path, *key[1:]) for key in keys)
+    except OSError:
+        return False
+
+
+def warm_disk_caches(max_workers=None):
+    """Bangun cache disk semua workbook yang belum ada, paralel satu proses per workbook"""
+    status = {}
+    pending = {}
+    for name, spec in DATASETS.items():
+        sources = spec['sources']()
+        if not sources:
+            status[name] = 'tidak ada file'
+        for file_path in sources:
+            if _dataset_is_cached(name, file_path):
+                status.setdefault(name, 'cache')
+            else:
+                pending[(name, file_path)] = file_path
+
+    workers = min(len(pending), max_workers or os.cpu_count() or 1)
+    if workers <= 1:
+        # Satu workbook / satu CPU: overhead proses baru tidak sebanding
+        for (name, file_path) in pending:
+            try:
+                build_dataset(name, file_path)
+                status[name] = 'dibangun'
+            except Exception as e:
+                status[name] = 'gagal'
+        return status
+
+    # spawn: fork dari server Streamlit yang multi-thread tidak aman
+    ctx = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        futures = {key: pool.submit(build_dataset, *key) for key in pending}
+        for (name, file_path), future in futures.items():
+            try:
+                future.result()
+                status[name] = 'dibangun'
+            except Exception as e:
+                # Loader akan parsing sendiri saat dipanggil
+                status[name] = 'gagal'
+    return status
+
+
+@instrument('warm_start', st.cache_resource(show_spinner="Menyiapkan data..."))
+def warm_start(versions):
+    """Warm-up cache disk sekali per kombinasi versi data"""
+    return warm_disk_caches()
+
+
+# ============================================================
+# 12. LANGKAH PRE-WARM SEMUA CACHE
+# ============================================================
+def _warm_produksi_grid():
+    # Rentang default halaman Produksi = seluruh rentang data
+    summary = load_produksi_summary()
+    return load_produksi_grid(summary['min_date'], summary['max_date'])
+
+
+def warm_steps():
+    """Urutan (label, fungsi) untuk mengisi semua cache: disk dulu, lalu loader,
+    agregat & snapshot (termasuk semua bulan gangguan & analisa produksi)"""
+    steps = [
+        ('Cache disk', lambda: warm_start(data_versions())),
+        ('Ringkasan produksi', load_produksi_summary),
+        ('Cube produksi', load_produksi_cube),
+        ('Index cube', load_produksi_cube_index),
+        ('KPI prefix-sum', load_produksi_kpi),
+        ('Gangguan', load_gangguan_all),
+    ]
+    steps += [(f'Gangguan {bulan}', partial(load_gangguan, bulan)) for bulan in BULAN_LIST]
+    steps.append(('Gangguan YTD', load_gangguan_ytd))
+    steps += [
+        ('Monitoring', load_monitoring),
+        ('BBM', load_bbm),
+        ('Ritase', load_ritase),
+    ]
+    steps += [(f'Analisa {bulan}', partial(load_analisa_produksi, bulan)) for bulan in ANALISA_BULAN_MAP]
+    steps += [
+        ('Daily plan', load_daily_plan),
+        ('Realisasi', load_realisasi),
+        ('Snapshot overview', load_overview_snapshot),
+        ('Store SQLite', lambda: load_store(data_versions())),
+    ]
+    if QUERY_ENGINE != 'sqlite':
+        # Tanpa store, Data Detail memakai grid di memori
+        steps.append(('Grid detail', _warm_produksi_grid))
+    return steps
+
+
+# ============================================================
+# 13. STORE SQLITE
+# ============================================================
+_logger = logging.getLogger(__name__)
+_last_store_error = None
+
+
+def _store_tables(dataset):
+    """Frame hasil loader yang disalin ke store untuk sebuah dataset"""
+    if dataset == 'produksi':
+        # Langsung dari partisi: frame semua tahun tidak ditahan di cache Streamlit
+        rows, _ = load_produksi_partitions(dataset_version('produksi'))
+        return {'produksi': rows.read()}
+    if dataset == 'gangguan':
+        return {'gangguan': load_gangguan_all()}
+    if dataset == 'monitoring':
+        analisa = [
+            df.assign(Bulan=bulan)
+            for bulan in ANALISA_BULAN_MAP
+            if not (df := load_analisa_produksi(bulan)).empty
+        ]
+        return {
+            'bbm': load_bbm(),
+            'ritase': load_ritase(),
+            'analisa_produksi': pd.concat(analisa, ignore_index=True) if analisa else pd.DataFrame(),
+        }
+    if dataset == 'daily_plan':
+        return {'daily_plan': load_daily_plan(), 'realisasi': load_realisasi()}
+    return {}
+
+
+@instrument('load_store', st.cache_resource)
+def load_store(versions):
+    """Store SQLite yang sinkron dengan versi semua dataset (tabel ditulis ulang hanya jika berubah)"""
+    store = Store()
+    for dataset, version in zip(DATASETS, versions):
+        try:
+            store.sync(dataset, version, partial(_store_tables, dataset))
+        except Exception as e:
+            # Satu dataset gagal tidak boleh menghalangi dataset lain; tabelnya
+            # tertinggal di versi lama dan query produksi memakai jalur cadangan
+            _logger.warning("Sinkronisasi store SQLite dataset %s gagal", dataset, exc_info=True)
+            REGISTRY.record(f'load_store.sync_failed.{dataset}', STEP, 0.0, None, None, False, 0.0)
+    return store
+
+
+def rollup_produksi(by, start_date=None, end_date=None, filters=None, cube=None):
+    """Agregat produksi per `by` dengan filter tanggal & dimensi.
+
+    Dieksekusi di store SQLite (QUERY_ENGINE='sqlite'); roll-up cube di memori
+    sebagai cadangan. `cube` opsional: fungsi yang mengembalikan cube hasil filter
+    yang sama (mis. sudah dihitung pemanggil), dipakai hanya saat cadangan.
+    """
+    store = _produksi_store()
+    if store is not None:
+        try:
+            return store.rollup('produksi', by, start_date, end_date, filters)
+        except sqlite3.Error as e:
+            _store_fallback(e)
+    if cube is None:
+        cube = lambda: load_produksi_cube_index().take(start_date, end_date, filters)
+    with timed('rollup_produksi.cube'):
+        return rollup(cube(), by)
+
+
+def kpi_produksi(start_date=None, end_date=None, filters=None):
+    """KPI produksi rentang tanggal (rit, tonase, trip, avg/trip, excavator, hari).
+
+    Dieksekusi di store SQLite; cadangan prefix-sum / roll-up cube di memori.
+    """
+    store = _produksi_store()
+    if store is not None:
+        try:
+            return store.kpis('produksi', start_date, end_date, filters)
+        except sqlite3.Error as e:
+            _store_fallback(e)
+    return period_kpis(load_produksi_kpi(), load_produksi_cube_index(), start_date, end_date, filters)
+
+
+def detail_produksi(start_date=None, end_date=None, filters=None, search='', sort_col='Date', ascending=False):
+    """Data Detail produksi terfilter, tercari & terurut (GridResult: jumlah baris + halaman).
+
+    Dieksekusi di store SQLite, hanya satu halaman yang dibaca; cadangan grid
+    di memori atas partisi rentang tanggal.
+    """
+    store = _produksi_store()
+    if store is not None:
+        query = ('produksi', start_date, end_date, filters, search, SEARCH_COLUMNS)
+        try:
+            total = store.count(*query)
+            return GridResult(total, partial(_store_detail_page, store, query, sort_col, ascending))
+        except sqlite3.Error as e:
+            _store_fallback(e)
+    index = load_produksi_index(start_date, end_date)
+    grid = load_produksi_grid(start_date, end_date)
+    ordered = grid.query(index.select(filters=filters), search, sort_col, ascending)
+    return GridResult(len(ordered), partial(grid.page, ordered))
+
+
+def _store_detail_page(store, query, sort_col, ascending, page, page_size):
+    df = store.page(
+        query[0], DETAIL_COLUMNS, *query[1:], sort_col=sort_col, ascending=ascending,
+        limit=page_size, offset=(page - 1) * page_size,
+    )
+    # Tipe sama dengan grid di memori (DateColumn butuh datetime)
+    df['Date'] = pd.to_datetime(df['Date'])
+    df[['Rit', 'Tonnase']] = df[['Rit', 'Tonnase']].astype('float32')
+    return _categorize_produksi(df)
+
+
+def _produksi_store():
+    """Store untuk query produksi, None jika QUERY_ENGINE bukan 'sqlite' atau tabel
+    produksi belum sinkron dengan versi data (mis. sync terakhir gagal): tanpa
+    cek ini chart diam-diam memakai data lama sementara KPI & tabel data baru"""
+    if QUERY_ENGINE != 'sqlite':
+        return None
+    versions = data_versions()
+    try:
+        store = load_store(versions)
+        stored = store.version('produksi')
+    except sqlite3.Error as e:
+        _store_fallback(e)
+        return None
+    current = dict(zip(DATASETS, versions))['produksi']
+    if stored != current:
+        _store_fallback(f"tabel produksi versi {stored}, data versi {current}")
+        return None
+    return store
+
+
+def _store_fallback(error):
+    # Tiap fallback tercatat di panel performa (rollup_produksi.store_fallback);
+    # log hanya saat pesan error berganti supaya tidak berulang tiap rerun
+    global _last_store_error
+    REGISTRY.record('rollup_produksi.store_fallback', STEP, 0.0, None, None, False, 0.0)
+    if str(error) != _last_store_error:
+        _last_store_error = str(error)
+        _logger.warning("Query store SQLite gagal, memakai roll-up cube: %s", error)
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import os
+import threading
+
+import pandas as pd
+
+from utils.cache import CACHE_DIR
+from utils.grid import DETAIL_COLUMNS
+
+# ============================================================
+# EXPORT DATA TERFILTER (CSV / PARQUET / XLSX)
+# ============================================================
+# File export hanya dibuat saat tombol download diklik, ditulis per potongan
+# baris dari row-id hasil filter (tidak pernah membentuk satu string/frame
+# besar), lalu disimpan di data/.cache/exports per versi data + filter.
+# Download berikutnya dengan filter sama langsung membaca file yang ada.
+
+EXPORT_DIR = os.path.join(CACHE_DIR, 'exports')
+
+# Format -> (ekstensi, MIME)
+EXPORT_FORMATS = {
+    'CSV': ('csv', 'text/csv'),
+    'Parquet': ('parquet', 'application/vnd.apache.parquet'),
+    'XLSX': ('xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+}
+
+CHUNK_ROWS = 20000
+
+# File export lama dibuang jika jumlahnya melebihi batas ini
+EXPORT_MAX_FILES = 20
+
+_export_lock = threading.Lock()
+
+
+def iter_chunks(df, row_ids, columns, chunk_rows=CHUNK_ROWS):
+    """Potongan frame (kolom `columns`) untuk row-id berurutan"""
+    if len(row_ids) == 0:
+        yield df.iloc[[]][columns]
+        return
+    for start in range(0, len(row_ids), chunk_rows):
+        yield df.iloc[row_ids[start:start + chunk_rows]][columns]
+
+
+def _write_csv(chunks, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        for i, chunk in enumerate(chunks):
+            chunk.to_csv(f, header=(i == 0), index=False, date_format='%Y-%m-%d')
+
+
+def _write_parquet(chunks, path):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table.cast(writer.schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+def _xlsx_value(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.to_pydatetime()
+    if hasattr(value, 'item'):
+        # numpy scalar -> tipe Python biasa
+        return value.item()
+    return value
+
+
+def _write_xlsx(chunks, path):
+    from openpyxl import Workbook
+
+    # Mode write_only: baris langsung ditulis ke file, tidak disimpan di memori
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Produksi')
+    header_written = False
+    for chunk in chunks:
+        if not header_written:
+            ws.append(list(chunk.columns))
+            header_written = True
+        for row in chunk.itertuples(index=False, name=None):
+            ws.append([_xlsx_value(v) for v in row])
+    wb.save(path)
+
+
+_WRITERS = {'csv': _write_csv, 'parquet': _write_parquet, 'xlsx': _write_xlsx}
+
+
+def _prune_exports():
+    files = [os.path.join(EXPORT_DIR, name) for name in os.listdir(EXPORT_DIR)]
+    files = [p for p in files if os.path.isfile(p)]
+    if len(files) <= EXPORT_MAX_FILES:
+        return
+    files.sort(key=os.path.getmtime)
+    for path in files[:len(files) - EXPORT_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def export_rows(df, row_ids, fmt, key, columns=DETAIL_COLUMNS, name='produksi'):
+    """Path file export `fmt` untuk row-id terpilih; dibuat sekali per `key`"""
+    ext, _ = EXPORT_FORMATS[fmt]
+    columns = [c for c in columns if c in df.columns]
+    digest = hashlib.sha1(json.dumps([name, key, columns], default=str).encode('utf-8')).hexdigest()[:20]
+    path = os.path.join(EXPORT_DIR, f"{name}-{digest}.{ext}")
+
+    with _export_lock:
+        if os.path.exists(path):
+            return path
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp-{os.getpid()}-{threading.get_ident()}.{ext}"
+        try:
+            _WRITERS[ext](iter_chunks(df, row_ids, columns), tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        _prune_exports()
+    return path
+
+
+def read_export(path):
+    with open(path, 'rb') as f:
+        return f.read()
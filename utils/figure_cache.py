@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# ============================================================
+# CACHE FIGURE PLOTLY (LRU + BATAS MEMORI)
+# ============================================================
+# Figure yang sudah dibangun disimpan dengan kunci
+# (versi data, id chart, tuple filter). Selama data & filter sama, rerun
+# Streamlit memakai figure yang ada tanpa kerja pandas maupun plotly express.
+# Entri paling lama tidak dipakai dibuang jika total ukuran melebihi batas.
+# Ukuran diperkirakan dari array data trace (tanpa serialisasi JSON tambahan;
+# figure sudah diserialisasi sekali oleh st.plotly_chart saat dirender).
+
+# Atribut trace yang berisi data (ukuran figure didominasi array ini)
+_DATA_ATTRS = ('x', 'y', 'z', 'values', 'labels', 'text', 'customdata', 'ids',
+               'hovertext', 'lat', 'lon', 'r', 'theta')
+
+# Perkiraan byte JSON di luar array data: layout + template per figure, atribut lain per trace
+_FIGURE_OVERHEAD = 8 * 1024
+_TRACE_OVERHEAD = 1024
+
+
+def _data_bytes(value):
+    if value is None:
+        return 0
+    if isinstance(value, np.ndarray):
+        if value.dtype != object:
+            # Array numerik dikirim base64 (plotly >= 6): 4/3 ukuran biner
+            return value.nbytes * 4 // 3
+        value = value.ravel().tolist()
+    if isinstance(value, str):
+        return len(value) + 3
+    if isinstance(value, (list, tuple)):
+        return sum(_data_bytes(v) if isinstance(v, (str, list, tuple, np.ndarray)) else 12 for v in value)
+    return 12
+
+
+def estimate_size(fig):
+    """Perkiraan ukuran JSON figure (byte) dari array data trace"""
+    size = _FIGURE_OVERHEAD
+    for trace in fig.data:
+        size += _TRACE_OVERHEAD
+        for attr in _DATA_ATTRS:
+            size += _data_bytes(getattr(trace, attr, None))
+        marker = getattr(trace, 'marker', None)
+        color = getattr(marker, 'color', None) if marker is not None else None
+        if not isinstance(color, str):
+            size += _data_bytes(color)
+    return size
+
+
+class FigureCache:
+    """Cache LRU untuk figure Plotly, dibatasi perkiraan jumlah byte JSON"""
+
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_build(self, key, builder):
+        """Ambil figure dari cache, atau bangun dengan builder() lalu simpan"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+        fig = builder()
+        if fig is None:
+            return None
+        # Ukuran diperkirakan sekali saat figure masuk cache
+        size = estimate_size(fig)
+
+        with self._lock:
+            self.misses += 1
+            if key in self._entries:
+                self._bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (fig, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, (_, old_size) = self._entries.popitem(last=False)
+                self._bytes -= old_size
+        return fig
+
+    def evict(self, predicate):
+        """Buang semua entri yang kuncinya memenuhi predicate(key)"""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._bytes -= self._entries.pop(key)[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+            }
@@ -0,0 +1,104 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# GRID DATA DETAIL (SORT, CARI & PAGINASI DI SERVER)
+# ============================================================
+# Tabel detail produksi tidak lagi dikirim utuh ke browser. Urutan baris
+# per kolom (permutasi) disimpan sekali, pencarian teks memakai nilai unik
+# per kolom, lalu hanya satu halaman baris yang dikirim ke st.dataframe.
+
+DETAIL_COLUMNS = [
+    'Date', 'Time', 'Shift', 'BLOK', 'Front', 'Commudity',
+    'Excavator', 'Dump Truck', 'Dump Loc', 'Rit', 'Tonnase',
+]
+
+# Kolom angka tidak ikut pencarian teks
+_NUMERIC_COLUMNS = {'Rit', 'Tonnase'}
+
+# Kolom yang dicari teksnya (juga dipakai query Data Detail di store SQLite)
+SEARCH_COLUMNS = [c for c in DETAIL_COLUMNS if c not in _NUMERIC_COLUMNS]
+
+
+class DetailGrid:
+    """Permutasi sort & label pencarian di atas frame FrameIndex (row-id sama)"""
+
+    def __init__(self, frame_index, columns=DETAIL_COLUMNS):
+        self.df = frame_index.df
+        self.columns = [c for c in columns if c in self.df.columns]
+        self._orders = {}
+        self._codes = {}
+        self._labels = {}
+
+        for col in self.columns:
+            if col in _NUMERIC_COLUMNS:
+                continue
+            codes, uniques = pd.factorize(self.df[col])
+            if col == 'Date':
+                labels = pd.to_datetime(pd.Series(uniques)).dt.strftime('%Y-%m-%d')
+            else:
+                labels = pd.Series(uniques).astype(str)
+            self._codes[col] = codes
+            self._labels[col] = labels.str.lower().fillna('')
+
+    def __len__(self):
+        return len(self.df)
+
+    def order(self, col, ascending=True):
+        """Permutasi row-id terurut per kolom (NaN di akhir), dihitung sekali"""
+        key = (col, ascending)
+        if key not in self._orders:
+            ranked = self.df[col].reset_index(drop=True).sort_values(
+                ascending=ascending, na_position='last', kind='stable'
+            )
+            self._orders[key] = ranked.index.to_numpy()
+        return self._orders[key]
+
+    def search_mask(self, text):
+        """Mask baris yang salah satu kolom teksnya memuat `text` (tanpa beda huruf besar)"""
+        text = text.strip().lower()
+        mask = np.zeros(len(self.df), dtype=bool)
+        for col, labels in self._labels.items():
+            hit = labels.str.contains(text, regex=False).to_numpy()
+            if not hit.any():
+                continue
+            # Kode -1 (kosong) menunjuk ke elemen False terakhir
+            hit = np.append(hit, False)
+            mask |= hit[self._codes[col]]
+        return mask
+
+    def query(self, row_ids, search='', sort_col='Date', ascending=False):
+        """Row-id hasil filter -> row-id terurut & tersaring pencarian"""
+        mask = np.zeros(len(self.df), dtype=bool)
+        mask[row_ids] = True
+        if search and search.strip():
+            mask &= self.search_mask(search)
+        perm = self.order(sort_col, ascending)
+        # Tanpa sort ulang: ambil permutasi global, buang baris yang tidak lolos
+        return perm[mask[perm]]
+
+    @staticmethod
+    def page_count(total, page_size):
+        return max(1, math.ceil(total / page_size))
+
+    def page(self, ordered_ids, page, page_size):
+        """Frame satu halaman (page dimulai dari 1)"""
+        start = (page - 1) * page_size
+        return self.df.iloc[ordered_ids[start:start + page_size]][self.columns]
+
+
+class GridResult:
+    """Hasil query Data Detail: jumlah baris + ambil satu halaman (grid di memori atau store)"""
+
+    def __init__(self, total, fetch_page):
+        self.total = total
+        self._fetch_page = fetch_page
+
+    def __len__(self):
+        return self.total
+
+    def page(self, page, page_size):
+        """Frame satu halaman (page dimulai dari 1)"""
+        return self._fetch_page(page, page_size)
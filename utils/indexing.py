@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+# ============================================================
+# INDEX TANGGAL & INVERTED INDEX UNTUK FILTER PRODUKSI
+# ============================================================
+# Frame diurutkan per tanggal, sehingga rentang tanggal cukup dicari dengan
+# binary search (np.searchsorted) menjadi satu potongan baris berurutan.
+# Untuk tiap dimensi (shift, excavator, BLOK, front) disimpan daftar row-id
+# per nilai; filter gabungan = irisan daftar row-id, bukan perbandingan
+# seluruh kolom.
+
+INDEX_DIMENSIONS = ['Shift', 'Excavator', 'BLOK', 'Front']
+
+
+def _day_number(dates):
+    """Tanggal -> nomor hari sejak 1970-01-01 (NaT menjadi nilai terkecil)"""
+    return pd.to_datetime(dates).values.astype('datetime64[D]').astype('int64')
+
+
+class FrameIndex:
+    """Index read-only di atas frame yang sudah diurutkan per tanggal"""
+
+    def __init__(self, df, date_col='Date', dims=INDEX_DIMENSIONS):
+        if date_col in df.columns:
+            days = _day_number(df[date_col])
+        else:
+            days = np.empty(len(df), dtype='int64')
+        order = np.argsort(days, kind='stable')
+
+        self.df = df.iloc[order].reset_index(drop=True)
+        self.days = days[order]
+        self.postings = {}
+
+        for col in dims:
+            if col not in self.df.columns:
+                continue
+            codes, uniques = pd.factorize(self.df[col], sort=True)
+            # Row-id per nilai, terurut naik (stable sort atas kode)
+            row_ids = np.argsort(codes, kind='stable')
+            bounds = np.searchsorted(codes[row_ids], np.arange(len(uniques) + 1))
+            self.postings[col] = {
+                value: row_ids[bounds[i]:bounds[i + 1]]
+                for i, value in enumerate(uniques)
+            }
+
+    def __len__(self):
+        return len(self.df)
+
+    def values(self, col):
+        """Nilai unik (terurut) sebuah dimensi, untuk opsi selectbox"""
+        return list(self.postings.get(col, {}))
+
+    def date_bounds(self):
+        valid = self.days[self.days > np.iinfo('int64').min]
+        if len(valid) == 0:
+            return None, None
+        to_date = lambda d: pd.Timestamp(int(d), unit='D').date()
+        return to_date(valid[0]), to_date(valid[-1])
+
+    def date_slice(self, start_date=None, end_date=None):
+        """Rentang tanggal (inklusif) -> (lo, hi) posisi baris lewat binary search"""
+        lo = 0 if start_date is None else np.searchsorted(self.days, _day_number([start_date])[0], 'left')
+        hi = len(self.days) if end_date is None else np.searchsorted(self.days, _day_number([end_date])[0], 'right')
+        return int(lo), int(hi)
+
+    def select(self, start_date=None, end_date=None, filters=None):
+        """Row-id yang lolos rentang tanggal & filter dimensi ({kolom: nilai})"""
+        lo, hi = self.date_slice(start_date, end_date)
+
+        lists = []
+        for col, value in (filters or {}).items():
+            ids = self.postings.get(col, {}).get(value)
+            if ids is None:
+                return np.empty(0, dtype='int64')
+            # Posting terurut: potong ke rentang tanggal dengan binary search juga
+            lists.append(ids[np.searchsorted(ids, lo):np.searchsorted(ids, hi)])
+
+        if not lists:
+            return np.arange(lo, hi)
+
+        # Irisan dimulai dari daftar terpendek
+        lists.sort(key=len)
+        ids = lists[0]
+        for other in lists[1:]:
+            ids = np.intersect1d(ids, other, assume_unique=True)
+        return ids
+
+    def take(self, start_date=None, end_date=None, filters=None):
+        """Frame hasil filter (salinan)"""
+        ids = self.select(start_date, end_date, filters)
+        lo, hi = (ids[0], ids[-1] + 1) if len(ids) else (0, 0)
+        if len(ids) == hi - lo:
+            # Tanpa filter dimensi hasilnya potongan berurutan, cukup slice
+            return self.df.iloc[lo:hi].copy()
+        return self.df.iloc[ids].copy()
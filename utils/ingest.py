@@ -0,0 +1,98 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from utils.cache import move_fingerprint
+
+# ============================================================
+# INGESTION UPLOAD DI BACKGROUND
+# ============================================================
+# File upload ditulis dulu ke data/.staging, lalu di background:
+#   1. parsing + cleaning + agregat dibangun dari file staging (mengisi
+#      cache disk, kuncinya sidik isi file sehingga tetap berlaku setelah rename)
+#   2. file staging di-rename atomik menggantikan file data (os.replace)
+#   3. cache dataset itu dibersihkan (publish)
+# Selama proses berjalan, pembaca tetap memakai versi lama tanpa menunggu.
+
+STAGING_DIR = 'data/.staging'
+
+# Status job
+MENUNGGU = 'menunggu'
+MEMPROSES = 'memproses'
+SELESAI = 'selesai'
+GAGAL = 'gagal'
+
+
+class IngestJob:
+    """Status satu upload yang sedang/sudah diproses"""
+
+    def __init__(self, dataset, target_path):
+        self.dataset = dataset
+        self.target_path = target_path
+        self.status = MENUNGGU
+        self.error = None
+        self.submitted = time.time()
+        self.finished = None
+
+    @property
+    def done(self):
+        return self.status in (SELESAI, GAGAL)
+
+    @property
+    def duration(self):
+        return (self.finished or time.time()) - self.submitted
+
+
+class Ingestor:
+    """Antrian ingestion upload; satu worker supaya upload diproses berurutan"""
+
+    def __init__(self, max_workers=1):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='ingest')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, dataset, target_path, data, build, publish):
+        """Tulis `data` ke staging lalu jadwalkan build(staging_path) -> rename -> publish()"""
+        os.makedirs(STAGING_DIR, exist_ok=True)
+        # Ekstensi dipertahankan, openpyxl menolak file tanpa .xlsx
+        staging_path = os.path.join(STAGING_DIR, f"{uuid.uuid4().hex}-{os.path.basename(target_path)}")
+        with open(staging_path, 'wb') as f:
+            f.write(data)
+
+        job = IngestJob(dataset, target_path)
+        with self._lock:
+            self._jobs[dataset] = job
+        self._executor.submit(self._run, job, staging_path, build, publish)
+        return job
+
+    def _run(self, job, staging_path, build, publish):
+        job.status = MEMPROSES
+        replaced = False
+        try:
+            build(staging_path)
+            os.replace(staging_path, job.target_path)
+            replaced = True
+            publish()
+            job.status = SELESAI
+        except Exception as e:
+            job.error = str(e)
+            job.status = GAGAL
+        finally:
+            job.finished = time.time()
+            if os.path.exists(staging_path):
+                try:
+                    os.remove(staging_path)
+                except OSError:
+                    pass
+            # Sidik file staging ikut pindah ke file data (atau dibuang bila gagal),
+            # supaya manifest tidak menumpuk entri staging
+            move_fingerprint(staging_path, job.target_path if replaced else None)
+
+    def jobs(self):
+        with self._lock:
+            return list(self._jobs.values())
+
+    def busy(self):
+        return any(not job.done for job in self.jobs())
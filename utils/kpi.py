@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+import numpy as np
+
+from utils.aggregates import cube_kpis, rollup
+
+# ============================================================
+# KPI PREFIX-SUM (TOTAL RENTANG TANGGAL DALAM O(1))
+# ============================================================
+# Per hari kalender disimpan jumlah kumulatif Rit, Tonnase, trip dan hari
+# aktif, untuk keseluruhan data dan per excavator/shift/BLOK. Total rentang
+# tanggal apa pun = selisih dua baris array, tidak perlu menjumlah ulang
+# baris data, sehingga latensi KPI tetap walau histori bertambah tahunan.
+
+KPI_DIMENSIONS = ['Excavator', 'Shift', 'BLOK']
+
+# Kolom array kumulatif
+_RIT, _TON, _TRIP, _HARI = range(4)
+
+
+class PrefixKpi:
+    """Array kumulatif harian (keseluruhan & per dimensi) dari cube produksi"""
+
+    def __init__(self, cube, dims=KPI_DIMENSIONS):
+        self.dims = [d for d in dims if d in cube.columns]
+        self.prefix = {}
+        self.first_day = None
+        self.n_days = 0
+
+        cube = cube[cube['Date'].notna()] if 'Date' in cube.columns else cube
+        if cube.empty:
+            return
+
+        days = cube['Date'].values.astype('datetime64[D]')
+        self.first_day = days.min()
+        self.n_days = int((days.max() - self.first_day).astype('int64')) + 1
+
+        self.prefix[None] = self._cumulative(rollup(cube, 'Date'))
+        for col in self.dims:
+            daily = rollup(cube, ['Date', col])
+            for value, group in daily.groupby(col, observed=True):
+                self.prefix[(col, value)] = self._cumulative(group)
+
+    def _cumulative(self, daily):
+        offset = (daily['Date'].values.astype('datetime64[D]') - self.first_day).astype('int64')
+        dense = np.zeros((self.n_days + 1, 4), dtype='float64')
+        # Baris 0 = nol, baris i+1 = akumulasi sampai hari ke-i
+        dense[offset + 1, _RIT] = daily['Rit'].values
+        dense[offset + 1, _TON] = daily['Tonnase'].values
+        dense[offset + 1, _TRIP] = daily['Trip'].values
+        dense[offset + 1, _HARI] = (daily['Trip'].values > 0)
+        return np.cumsum(dense, axis=0)
+
+    def _bounds(self, start_date, end_date):
+        """Rentang tanggal -> (lo, hi) baris prefix, dipotong ke rentang data"""
+        if self.first_day is None:
+            return 0, 0
+        lo = 0 if start_date is None else int((np.datetime64(start_date, 'D') - self.first_day).astype('int64'))
+        hi = self.n_days if end_date is None else int((np.datetime64(end_date, 'D') - self.first_day).astype('int64')) + 1
+        lo, hi = min(max(lo, 0), self.n_days), min(max(hi, 0), self.n_days)
+        return lo, max(lo, hi)
+
+    def supports(self, filters):
+        """Prefix hanya tersedia untuk tanpa filter atau satu filter dimensi"""
+        filters = filters or {}
+        return len(filters) == 0 or (len(filters) == 1 and next(iter(filters)) in self.dims)
+
+    def totals(self, start_date=None, end_date=None, filters=None):
+        """Total rit, tonase, trip & hari aktif untuk rentang tanggal (dua lookup array)"""
+        filters = filters or {}
+        key = next(iter(filters.items())) if filters else None
+        lo, hi = self._bounds(start_date, end_date)
+
+        arr = self.prefix.get(key)
+        if arr is None:
+            rit = ton = trip = hari = 0.0
+        else:
+            rit, ton, trip, hari = arr[hi] - arr[lo]
+        return {
+            'rit': float(rit),
+            'tonnase': float(ton),
+            'trip': int(round(trip)),
+            'avg_trip': float(ton) / trip if trip else 0.0,
+            'hari': int(round(hari)),
+        }
+
+    def distinct(self, col, start_date=None, end_date=None):
+        """Jumlah nilai dimensi yang punya trip dalam rentang tanggal"""
+        lo, hi = self._bounds(start_date, end_date)
+        count = 0
+        for key, arr in self.prefix.items():
+            if key is not None and key[0] == col and arr[hi, _TRIP] - arr[lo, _TRIP] > 0:
+                count += 1
+        return count
+
+
+def previous_period(start_date, end_date):
+    """Periode sebelumnya dengan panjang hari yang sama"""
+    length = (end_date - start_date).days + 1
+    return start_date - timedelta(days=length), start_date - timedelta(days=1)
+
+
+def _year_before(day):
+    try:
+        return day.replace(year=day.year - 1)
+    except ValueError:  # 29 Februari
+        return day.replace(year=day.year - 1, day=28)
+
+
+def last_year_period(start_date, end_date):
+    """Rentang tanggal yang sama setahun sebelumnya"""
+    return _year_before(start_date), _year_before(end_date)
+
+
+# Pembanding KPI: label (juga dipakai di baris delta) -> fungsi rentang pembanding
+COMPARE_PERIODS = {
+    'periode sebelumnya': previous_period,
+    'tahun lalu': last_year_period,
+}
+
+
+def period_kpis(engine, cube_index, start_date, end_date, filters=None):
+    """KPI rentang tanggal: prefix-sum jika didukung, selain itu roll-up cube"""
+    filters = filters or {}
+    if engine.supports(filters):
+        kpi = engine.totals(start_date, end_date, filters)
+        if not filters:
+            kpi['excavator'] = engine.distinct('Excavator', start_date, end_date)
+        elif 'Excavator' in filters:
+            kpi['excavator'] = 1 if kpi['trip'] else 0
+        else:
+            kpi['excavator'] = int(cube_index.take(start_date, end_date, filters)['Excavator'].nunique())
+        return kpi
+    return cube_kpis(cube_index.take(start_date, end_date, filters))
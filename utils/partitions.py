@@ -0,0 +1,213 @@
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import CACHE_DIR, _write_atomic
+
+# ============================================================
+# PARTISI TAHUN/BULAN (PARQUET)
+# ============================================================
+# Frame tiap sumber (mis. satu sheet tahunan) dipecah per (tahun, bulan)
+# menjadi file parquet di data/.cache/partitions/<nama>/<versi>/src-<sumber>/
+# year=YYYY/month=MM. manifest.json mencatat versi aktif, sidik tiap sumber
+# + rentang tanggal & jumlah baris tiap partisi, sehingga query rentang
+# tanggal hanya membaca partisi yang beririsan. Versi baru ditulis di folder
+# sendiri lalu manifest diganti atomik (pointer swap). Saat versi berubah
+# hanya sumber yang sidiknya berubah yang dibaca ulang; partisi sumber lain
+# (dan partisi yang isinya sama, mis. bulan lama setelah upload append)
+# tidak ditulis ulang, manifest baru menunjuk file lamanya.
+
+PARTITION_DIR = os.path.join(CACHE_DIR, 'partitions')
+
+# Baris tanpa tanggal valid
+_NO_DATE = 'tanpa-tanggal'
+
+
+def _source_folder(key):
+    """Sub-folder partisi satu sumber (nama file/sheet bisa berisi spasi & titik dua)"""
+    return f"src-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:10]}"
+
+
+class PartitionSet:
+    """Kumpulan partisi tahun/bulan satu dataset"""
+
+    def __init__(self, name, date_col='Date', root=PARTITION_DIR):
+        self.name = name
+        self.date_col = date_col
+        self.dir = os.path.join(root, name)
+        self._manifest_path = os.path.join(self.dir, 'manifest.json')
+
+    def manifest(self):
+        try:
+            with open(self._manifest_path, 'r') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    @staticmethod
+    def _digest(part):
+        h = hashlib.sha1(json.dumps([list(part.columns), [str(t) for t in part.dtypes]]).encode('utf-8'))
+        h.update(pd.util.hash_pandas_object(part, index=False).to_numpy().tobytes())
+        return h.hexdigest()
+
+    def _is_complete(self, manifest):
+        return all(os.path.exists(os.path.join(self.dir, p['path'])) for p in manifest.get('partitions', []))
+
+    def sync(self, version, sources):
+        """Tulis partisi versi `version` jika belum ada.
+
+        sources: {kunci: (sidik, frame_fn)} per sumber (mis. satu sheet tahunan).
+        Hanya sumber yang sidiknya berubah yang dibaca & dipartisi ulang;
+        partisi sumber lain tetap menunjuk file lamanya.
+        """
+        manifest = self.manifest()
+        if manifest.get('version') == version and self._is_complete(manifest):
+            return False
+
+        old_sources = manifest.get('sources', {})
+        old_parts = {}
+        for part in manifest.get('partitions', []):
+            old_parts.setdefault(part.get('source', ''), []).append(part)
+
+        partitions = []
+        columns = None
+        categorical = set()
+        for key, (fingerprint, frame_fn) in sources.items():
+            kept = old_parts.get(key, [])
+            if old_sources.get(key) == fingerprint and self._is_complete({'partitions': kept}):
+                partitions += kept
+                continue
+            df = frame_fn()
+            if len(df.columns):
+                columns = columns or list(df.columns)
+                categorical |= {c for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)}
+            partitions += self._write_source(version, key, df, kept)
+        partitions.sort(key=lambda p: (p['year'] or 0, p['month'] or 0, p['source']))
+
+        new_manifest = {
+            'version': version,
+            'columns': columns or manifest.get('columns', []),
+            'categorical': sorted(categorical | set(manifest.get('categorical', []))),
+            'sources': {key: fingerprint for key, (fingerprint, _) in sources.items()},
+            'partitions': partitions,
+        }
+        os.makedirs(self.dir, exist_ok=True)
+        _write_atomic(self._manifest_path, json.dumps(new_manifest, indent=1), mode='w')
+
+        # Folder versi lama dibuang, kecuali yang masih dirujuk manifest baru
+        # atau manifest sebelumnya (mungkin masih dibaca)
+        keep = {version} | {
+            p['path'].split(os.sep)[0]
+            for p in partitions + manifest.get('partitions', [])
+        }
+        for name in os.listdir(self.dir):
+            path = os.path.join(self.dir, name)
+            if os.path.isdir(path) and name not in keep:
+                shutil.rmtree(path, ignore_errors=True)
+        return True
+
+    def _write_source(self, version, key, df, previous):
+        """Pecah frame satu sumber per (tahun, bulan) lalu tulis partisinya; entri manifest"""
+        if self.date_col in df.columns:
+            # Urut tanggal (stabil) supaya hasil baca partisi sudah terurut
+            dates = pd.to_datetime(df[self.date_col], errors='coerce')
+            order = np.argsort(dates.to_numpy().astype('datetime64[ns]').view('int64'), kind='stable')
+            df = df.iloc[order].reset_index(drop=True)
+            dates = dates.iloc[order].reset_index(drop=True)
+        else:
+            dates = pd.Series(pd.NaT, index=df.index)
+        keys = (dates.dt.year.fillna(0).astype(int) * 100 + dates.dt.month.fillna(0).astype(int)).to_numpy()
+
+        # Folder per sumber: dua sumber boleh berisi bulan yang sama
+        folder = os.path.join(version, _source_folder(key))
+        previous = {
+            (p['year'], p['month']): p for p in previous
+            if os.path.exists(os.path.join(self.dir, p['path']))
+        }
+        partitions = []
+        for part_key in sorted(set(keys)):
+            rows = keys == part_key
+            part = df[rows]
+            if part_key == 0:
+                rel_path = os.path.join(folder, f'{_NO_DATE}.parquet')
+                entry = {'year': None, 'month': None}
+            else:
+                year, month = divmod(int(part_key), 100)
+                rel_path = os.path.join(folder, f'year={year}', f'month={month:02d}.parquet')
+                part_dates = dates[rows]
+                entry = {
+                    'year': year,
+                    'month': month,
+                    'start': part_dates.min().strftime('%Y-%m-%d'),
+                    'end': part_dates.max().strftime('%Y-%m-%d'),
+                }
+            digest = self._digest(part)
+            old = previous.get((entry['year'], entry['month']))
+            if old is not None and old.get('digest') == digest:
+                rel_path = old['path']
+            else:
+                path = os.path.join(self.dir, rel_path)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                _write_atomic(path, part.to_parquet(index=False))
+            entry.update({'source': key, 'path': rel_path, 'rows': int(rows.sum()), 'digest': digest})
+            partitions.append(entry)
+        return partitions
+
+    def partitions(self, start_date=None, end_date=None):
+        """Entri partisi yang beririsan dengan rentang tanggal (inklusif)"""
+        selected = []
+        for part in self.manifest().get('partitions', []):
+            if part['year'] is None:
+                # Baris tanpa tanggal hanya ikut jika tidak ada batas rentang
+                if start_date is None and end_date is None:
+                    selected.append(part)
+                continue
+            if start_date is not None and part['end'] < pd.Timestamp(start_date).strftime('%Y-%m-%d'):
+                continue
+            if end_date is not None and part['start'] > pd.Timestamp(end_date).strftime('%Y-%m-%d'):
+                continue
+            selected.append(part)
+        return selected
+
+    def read(self, start_date=None, end_date=None, columns=None):
+        """Frame dari partisi yang beririsan saja, lalu dipotong tepat ke rentang tanggal"""
+        manifest = self.manifest()
+        parts = self.partitions(start_date, end_date)
+        if not parts:
+            return pd.DataFrame(columns=columns or manifest.get('columns', []))
+
+        read_cols = columns
+        if columns is not None and self.date_col not in columns:
+            read_cols = list(columns) + [self.date_col]
+        frames = [pd.read_parquet(os.path.join(self.dir, p['path']), columns=read_cols) for p in parts]
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+        if start_date is not None or end_date is not None:
+            dates = pd.to_datetime(df[self.date_col])
+            mask = pd.Series(True, index=df.index)
+            if start_date is not None:
+                mask &= dates >= pd.Timestamp(start_date)
+            if end_date is not None:
+                mask &= dates <= pd.Timestamp(end_date)
+            df = df[mask].reset_index(drop=True)
+        if read_cols is not columns:
+            df = df.drop(columns=self.date_col)
+
+        # Kategori tiap partisi berbeda, concat mengubahnya jadi object
+        for col in manifest.get('categorical', []):
+            if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype('category')
+        return df
+
+    def row_count(self):
+        return sum(p['rows'] for p in self.manifest().get('partitions', []))
+
+    def date_bounds(self):
+        parts = [p for p in self.manifest().get('partitions', []) if p['year'] is not None]
+        if not parts:
+            return None, None
+        return min(p['start'] for p in parts), max(p['end'] for p in parts)
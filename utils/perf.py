@@ -0,0 +1,225 @@
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import numpy as np
+
+# ============================================================
+# INSTRUMENTASI HOT PATH
+# ============================================================
+# Loader, parser, bagian halaman show_* & chart mencatat waktu dinding,
+# baris masuk/keluar, cache hit/miss dan selisih memori proses ke registry
+# global (per proses server, dibagi semua sesi). Tiap metrik menyimpan
+# PERF_WINDOW sampel terakhir untuk persentil bergulir. Biaya per sampel:
+# dua perf_counter + dua pembacaan RSS.
+
+PERF_WINDOW = 500
+
+# Jenis metrik
+LOADER = 'loader'
+STEP = 'step'
+SECTION = 'section'
+CHART = 'chart'
+PAGE = 'page'
+
+
+def _rss_reader():
+    try:
+        import psutil
+        process = psutil.Process()
+        return lambda: process.memory_info().rss
+    except ImportError:
+        pass
+    if os.path.exists('/proc/self/statm'):
+        page_size = os.sysconf('SC_PAGE_SIZE')
+
+        def statm():
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * page_size
+        return statm
+    return lambda: 0
+
+
+_read_rss = _rss_reader()
+
+
+def rss_mb():
+    """Memori resident proses (MB); 0 jika tidak bisa dibaca"""
+    try:
+        return _read_rss() / 1024 / 1024
+    except Exception:
+        return 0.0
+
+
+def rows_of(value):
+    """Jumlah baris hasil (DataFrame, index dengan .df, dict/tuple berisi frame); None jika bukan tabel"""
+    if hasattr(value, 'shape') and len(getattr(value, 'shape', ())) >= 1:
+        return int(value.shape[0])
+    if hasattr(value, 'df') and hasattr(value.df, 'shape'):
+        return int(value.df.shape[0])
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, (list, tuple)):
+        counts = [n for n in map(rows_of, value) if n is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+class PerfRegistry:
+    """Sampel metrik per nama (jendela bergulir) + jumlah panggilan total"""
+
+    def __init__(self, window=PERF_WINDOW):
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=window))
+        self._kinds = {}
+        self._calls = defaultdict(int)
+
+    def record(self, name, kind, seconds, rows_in=None, rows_out=None, hit=None, mem_mb=None):
+        sample = {
+            'ts': time.time(),
+            'name': name,
+            'kind': kind,
+            'seconds': seconds,
+            'rows_in': rows_in,
+            'rows_out': rows_out,
+            'hit': hit,
+            'mem_mb': mem_mb,
+        }
+        with self._lock:
+            self._samples[name].append(sample)
+            self._kinds[name] = kind
+            self._calls[name] += 1
+
+    def summary(self):
+        """Ringkasan per metrik: persentil waktu (ms), hit rate, baris terakhir, rata-rata selisih memori"""
+        with self._lock:
+            snapshot = {name: list(samples) for name, samples in self._samples.items()}
+            calls = dict(self._calls)
+        rows = []
+        for name, samples in snapshot.items():
+            ms = np.array([s['seconds'] for s in samples]) * 1000
+            hits = [s['hit'] for s in samples if s['hit'] is not None]
+            mem = [s['mem_mb'] for s in samples if s['mem_mb'] is not None]
+            last = samples[-1]
+            rows.append({
+                'name': name,
+                'kind': self._kinds[name],
+                'calls': calls[name],
+                'p50_ms': float(np.percentile(ms, 50)),
+                'p90_ms': float(np.percentile(ms, 90)),
+                'p99_ms': float(np.percentile(ms, 99)),
+                'max_ms': float(ms.max()),
+                'hit_rate': sum(hits) / len(hits) if hits else None,
+                'rows_in': last['rows_in'],
+                'rows_out': last['rows_out'],
+                'mem_mb': float(np.mean(mem)) if mem else None,
+            })
+        return sorted(rows, key=lambda r: r['p90_ms'], reverse=True)
+
+    def samples(self):
+        with self._lock:
+            return sorted((s for samples in self._samples.values() for s in samples), key=lambda s: s['ts'])
+
+    def dump_jsonl(self, path):
+        """Tambahkan semua sampel di jendela ke file JSONL (satu sampel per baris); jumlah baris"""
+        samples = self.samples()
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for sample in samples:
+                f.write(json.dumps(sample, default=str) + '\n')
+        return len(samples)
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._kinds.clear()
+            self._calls.clear()
+
+
+REGISTRY = PerfRegistry()
+
+# Tumpukan panggilan loader per thread, untuk menandai cache miss
+_local = threading.local()
+
+
+def instrument(name, cache=None):
+    """Dekorator loader: catat waktu, baris masuk/keluar, selisih memori &
+    (jika `cache` diberikan, mis. st.cache_data) hit/miss cache Streamlit.
+    Hasilnya tetap punya .clear() milik cache."""
+    def decorate(fn):
+        @functools.wraps(fn)
+        def compute(*args, **kwargs):
+            # Hanya dijalankan saat cache miss
+            stack = getattr(_local, 'stack', None)
+            if stack:
+                stack[-1]['miss'] = True
+            return fn(*args, **kwargs)
+
+        inner = cache(compute) if cache is not None else compute
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            stack = _local.__dict__.setdefault('stack', [])
+            frame = {'miss': False}
+            stack.append(frame)
+            mem0 = rss_mb()
+            t0 = time.perf_counter()
+            try:
+                result = inner(*args, **kwargs)
+            finally:
+                stack.pop()
+            REGISTRY.record(
+                name, LOADER, time.perf_counter() - t0,
+                rows_in=rows_of([a for a in args if hasattr(a, 'shape')]),
+                rows_out=rows_of(result),
+                hit=None if cache is None else not frame['miss'],
+                mem_mb=rss_mb() - mem0,
+            )
+            return result
+
+        if cache is not None:
+            wrapper.clear = inner.clear
+        return wrapper
+    return decorate
+
+
+class Timing:
+    """Hasil blok timed(); baris & hit bisa diisi di dalam blok"""
+
+    def __init__(self):
+        self.rows_in = None
+        self.rows_out = None
+        self.hit = None
+
+
+@contextmanager
+def timed(name, kind=STEP):
+    """Catat durasi blok `with`; atribut rows_in/rows_out/hit opsional"""
+    timing = Timing()
+    mem0 = rss_mb()
+    t0 = time.perf_counter()
+    yield timing
+    REGISTRY.record(name, kind, time.perf_counter() - t0, timing.rows_in, timing.rows_out,
+                    timing.hit, rss_mb() - mem0)
+
+
+class SectionTimer:
+    """Stopwatch bagian halaman: mark(nama) mencatat waktu sejak mark sebelumnya,
+    sehingga fungsi show_* cukup diberi satu baris per bagian"""
+
+    def __init__(self, page):
+        self.page = page
+        self._reset()
+
+    def _reset(self):
+        self._mem = rss_mb()
+        self._t = time.perf_counter()
+
+    def mark(self, section, rows_in=None, rows_out=None):
+        REGISTRY.record(f'{self.page}.{section}', SECTION, time.perf_counter() - self._t,
+                        rows_in, rows_out, None, rss_mb() - self._mem)
+        self._reset()
@@ -0,0 +1,273 @@
+import datetime
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+
+from utils.cache import CACHE_DIR
+
+# ============================================================
+# STORE SQLITE (MESIN QUERY AGREGAT)
+# ============================================================
+# Hasil bersih semua loader disalin ke satu file SQLite (data/.cache). Chart,
+# KPI & tabel Data Detail mengirim query (SUM/COUNT ... GROUP BY, satu halaman
+# baris dengan LIMIT/OFFSET) dengan filter tanggal & dimensi yang dieksekusi
+# di database memakai index, sehingga data histori multi-tahun tidak harus
+# disalin ke memori tiap worker Streamlit.
+# Tabel sebuah dataset hanya ditulis ulang jika versi file sumbernya berubah.
+
+STORE_PATH = os.path.join(CACHE_DIR, 'dashboard.sqlite')
+
+# Index per tabel: dimensi filter + tanggal untuk rentang
+STORE_INDEXES = {
+    'produksi': [
+        ['Date'],
+        ['Shift', 'Date'],
+        ['Excavator', 'Date'],
+        ['BLOK', 'Date'],
+        ['Front', 'Date'],
+    ],
+    'gangguan': [['Bulan']],
+    'ritase': [['Tanggal']],
+}
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _sql_value(value):
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+def _sql_ready(df):
+    """Frame siap disimpan ke SQLite: tanggal -> teks ISO, nilai object campuran -> tipe dasar"""
+    out = pd.DataFrame(index=df.index)
+    for col in df.columns:
+        series = df[col]
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Tanggal tanpa jam disimpan 'YYYY-MM-DD' agar perbandingan rentang teks benar
+            fmt = '%Y-%m-%d' if (series.dropna().dt.normalize() == series.dropna()).all() else '%Y-%m-%d %H:%M:%S'
+            out[col] = series.dt.strftime(fmt)
+        elif isinstance(series.dtype, pd.CategoricalDtype):
+            out[col] = series.astype(object).where(series.notna(), None)
+        elif series.dtype == object:
+            out[col] = series.map(_sql_value)
+        else:
+            out[col] = series
+    return out.reset_index(drop=True)
+
+
+def _sql_type(series):
+    if pd.api.types.is_bool_dtype(series) or pd.api.types.is_integer_dtype(series):
+        return 'INTEGER'
+    if pd.api.types.is_float_dtype(series):
+        return 'REAL'
+    return 'TEXT'
+
+
+def _sql_rows(df):
+    """Baris tuple bertipe Python dasar (NaN -> NULL) untuk executemany"""
+    columns = []
+    for col in df.columns:
+        series = df[col]
+        values = series.astype(object).where(series.notna(), None).tolist()
+        columns.append([v.item() if isinstance(v, np.generic) else v for v in values])
+    return zip(*columns)
+
+
+def _date_param(value):
+    if isinstance(value, (datetime.date, pd.Timestamp)):
+        return value.strftime('%Y-%m-%d')
+    return str(value)
+
+
+class Store:
+    """File SQLite berisi tabel hasil loader + metadata versi per dataset"""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._write_lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS _meta (dataset TEXT PRIMARY KEY, version TEXT)')
+
+    @contextmanager
+    def _connect(self):
+        # Koneksi baru per operasi: aman dipakai dari thread mana pun
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def version(self, dataset):
+        with self._connect() as conn:
+            row = conn.execute('SELECT version FROM _meta WHERE dataset = ?', (dataset,)).fetchone()
+        return row[0] if row else None
+
+    def sync(self, dataset, version, tables_fn):
+        """Tulis ulang tabel dataset jika versinya berbeda; tables_fn() -> {tabel: frame}"""
+        if self.version(dataset) == version:
+            return False
+        # Frame disiapkan di luar transaksi supaya kunci tulis ditahan sesingkat mungkin
+        tables = {table: None if df is None or df.empty else _sql_ready(df) for table, df in tables_fn().items()}
+
+        with self._write_lock:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            try:
+                # Satu transaksi eksplisit: tabel baru diisi di tabel staging lalu
+                # DROP + RENAME, jadi pembaca (proses mana pun) melihat tabel lama
+                # atau tabel baru lengkap dengan index-nya, tidak setengah jadi.
+                # IMMEDIATE mengambil kunci tulis di awal: sync dari proses lain menunggu.
+                conn.execute('BEGIN IMMEDIATE')
+                row = conn.execute('SELECT version FROM _meta WHERE dataset = ?', (dataset,)).fetchone()
+                if row and row[0] == version:
+                    # Sudah ditulis proses lain selama frame disiapkan
+                    conn.execute('ROLLBACK')
+                    return False
+                for table, df in tables.items():
+                    self._replace_table(conn, table, df)
+                conn.execute('INSERT OR REPLACE INTO _meta (dataset, version) VALUES (?, ?)', (dataset, version))
+                conn.execute('COMMIT')
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute('ROLLBACK')
+                raise
+            finally:
+                conn.close()
+        return True
+
+    @staticmethod
+    def _replace_table(conn, table, df):
+        """Ganti isi `table` dengan `df` (hasil _sql_ready) di dalam transaksi yang sedang berjalan"""
+        if df is None:
+            conn.execute(f'DROP TABLE IF EXISTS {_quote(table)}')
+            return
+        staging = f'{table}__staging'
+        conn.execute(f'DROP TABLE IF EXISTS {_quote(staging)}')
+        cols = ', '.join(f'{_quote(c)} {_sql_type(df[c])}' for c in df.columns)
+        conn.execute(f'CREATE TABLE {_quote(staging)} ({cols})')
+        placeholders = ', '.join('?' for _ in df.columns)
+        conn.executemany(f'INSERT INTO {_quote(staging)} VALUES ({placeholders})', _sql_rows(df))
+        conn.execute(f'DROP TABLE IF EXISTS {_quote(table)}')
+        conn.execute(f'ALTER TABLE {_quote(staging)} RENAME TO {_quote(table)}')
+        for cols in STORE_INDEXES.get(table, []):
+            if all(c in df.columns for c in cols):
+                name = _quote(f"ix_{table}_{'_'.join(cols)}".replace(' ', '_'))
+                conn.execute(f"CREATE INDEX {name} ON {_quote(table)} ({', '.join(map(_quote, cols))})")
+
+    def columns(self, table):
+        with self._connect() as conn:
+            return [row[1] for row in conn.execute(f'PRAGMA table_info({_quote(table)})')]
+
+    def _require_columns(self, table, cols=()):
+        known = set(self.columns(table))
+        if not known:
+            # Tabel belum/tidak tersinkron: pemanggil memakai jalur cadangan
+            raise sqlite3.OperationalError(f"no such table: {table}")
+        missing = [c for c in cols if c not in known]
+        if missing:
+            raise KeyError(f"Kolom {missing} tidak ada di tabel {table}")
+
+    def _where(self, table, start_date, end_date, filters, date_col='Date'):
+        known = set(self.columns(table))
+        clauses, params = [], []
+        if start_date is not None:
+            clauses.append(f'{_quote(date_col)} >= ?')
+            params.append(_date_param(start_date))
+        if end_date is not None:
+            clauses.append(f'{_quote(date_col)} <= ?')
+            params.append(_date_param(end_date))
+        for col, value in (filters or {}).items():
+            if col not in known:
+                raise KeyError(f"Kolom {col} tidak ada di tabel {table}")
+            clauses.append(f'{_quote(col)} = ?')
+            params.append(_sql_value(value))
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def rollup(self, table, by, start_date=None, end_date=None, filters=None):
+        """SUM Rit & Tonnase + jumlah trip per kolom `by`, filter dieksekusi di SQLite"""
+        by = [by] if isinstance(by, str) else list(by)
+        self._require_columns(table, by)
+
+        where, params = self._where(table, start_date, end_date, filters)
+        # Sama seperti groupby pandas: grup bernilai kosong tidak ikut
+        not_null = ' AND '.join(f'{_quote(c)} IS NOT NULL' for c in by)
+        where = f'{where} AND {not_null}' if where else f' WHERE {not_null}'
+        group = ', '.join(map(_quote, by))
+        sql = (
+            f'SELECT {group}, SUM("Rit") AS "Rit", SUM("Tonnase") AS "Tonnase", COUNT(*) AS "Trip" '
+            f'FROM {_quote(table)}{where} GROUP BY {group} ORDER BY {group}'
+        )
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql, conn, params=params)
+        if 'Date' in df.columns:
+            df['Date'] = pd.to_datetime(df['Date'])
+        return df
+
+    def kpis(self, table, start_date=None, end_date=None, filters=None):
+        """Total rit, tonase, trip, hari aktif & jumlah excavator (seperti cube_kpis) dalam satu query"""
+        self._require_columns(table, ['Date', 'Excavator', 'Rit', 'Tonnase'])
+        where, params = self._where(table, start_date, end_date, filters)
+        sql = (
+            'SELECT COALESCE(SUM("Rit"), 0), COALESCE(SUM("Tonnase"), 0), COUNT(*), '
+            f'COUNT(DISTINCT "Date"), COUNT(DISTINCT "Excavator") FROM {_quote(table)}{where}'
+        )
+        with self._connect() as conn:
+            rit, tonnase, trips, days, excavators = conn.execute(sql, params).fetchone()
+        return {
+            'rit': float(rit),
+            'tonnase': float(tonnase),
+            'trip': int(trips),
+            'avg_trip': float(tonnase) / trips if trips else 0.0,
+            'excavator': int(excavators),
+            'hari': int(days),
+        }
+
+    def _search_where(self, table, start_date, end_date, filters, search, search_cols):
+        # Cari teks tanpa beda huruf besar di salah satu kolom (seperti DetailGrid.search_mask)
+        where, params = self._where(table, start_date, end_date, filters)
+        text = (search or '').strip().lower()
+        if text and search_cols:
+            hit = ' OR '.join(f'instr(lower(CAST({_quote(c)} AS TEXT)), ?) > 0' for c in search_cols)
+            where = f'{where} AND ({hit})' if where else f' WHERE ({hit})'
+            params = params + [text] * len(search_cols)
+        return where, params
+
+    def count(self, table, start_date=None, end_date=None, filters=None, search='', search_cols=()):
+        """Jumlah baris yang lolos filter & pencarian"""
+        self._require_columns(table, search_cols)
+        where, params = self._search_where(table, start_date, end_date, filters, search, search_cols)
+        with self._connect() as conn:
+            return conn.execute(f'SELECT COUNT(*) FROM {_quote(table)}{where}', params).fetchone()[0]
+
+    def page(self, table, columns, start_date=None, end_date=None, filters=None, search='',
+             search_cols=(), sort_col='Date', ascending=False, limit=100, offset=0):
+        """Satu halaman baris yang lolos filter & pencarian, urut `sort_col` (kosong di akhir)"""
+        self._require_columns(table, list(columns) + list(search_cols) + [sort_col])
+        where, params = self._search_where(table, start_date, end_date, filters, search, search_cols)
+        # rowid = urutan tulis (tanggal): urutan baris bernilai sama tetap, seperti sort stabil
+        order = f'{_quote(sort_col)} IS NULL, {_quote(sort_col)} {"ASC" if ascending else "DESC"}, rowid'
+        sql = (
+            f'SELECT {", ".join(map(_quote, columns))} FROM {_quote(table)}{where} '
+            f'ORDER BY {order} LIMIT ? OFFSET ?'
+        )
+        with self._connect() as conn:
+            return pd.read_sql_query(sql, conn, params=params + [int(limit), int(offset)])
+
+    def read(self, table, where='', params=()):
+        """Baca tabel (opsional dengan klausa WHERE berparameter)"""
+        with self._connect() as conn:
+            return pd.read_sql_query(f'SELECT * FROM {_quote(table)} {where}', conn, params=list(params))
@@ -0,0 +1,214 @@
+import hashlib
+import re
+
+import pandas as pd
+
+# ============================================================
+# STREAMING PARSER PRODUKSI (openpyxl read-only)
+# ============================================================
+# Baris dibaca satu per satu dari XML sheet. Validasi shift, header berulang
+# dan perbaikan kolom bergeser (Sept+) dilakukan per baris, lalu baris yang
+# lolos dikumpulkan ke buffer kolom dan dikonversi per chunk. Memori puncak
+# mengikuti ukuran chunk, bukan ukuran sheet x jumlah salinan DataFrame.
+#
+# Baris mentah juga di-hash per blok (watermark). Upload berikutnya yang hanya
+# menambah baris di akhir sheet cukup mencocokkan hash baris lama lalu
+# mem-parse baris sesudahnya saja.
+
+VALID_SHIFTS = {'Shift 1', 'Shift 2', 'Shift 3'}
+
+# Urutan kolom hasil, sama dengan versi pd.read_excel
+OUTPUT_COLUMNS = ['Date', 'Time', 'Shift', 'Front', 'Commudity', 'Excavator',
+                  'Dump Truck', 'Dump Loc', 'Rit', 'Tonnase', 'BLOK']
+
+_DIGITS = re.compile(r'^\d+$')
+
+# Jumlah baris mentah per blok hash watermark
+BLOCK_ROWS = 1000
+
+
+class HistoryChanged(Exception):
+    """Baris lama di sheet berubah/terhapus: upload tidak bisa diproses sebagai append"""
+
+
+def _hash_row(h, row):
+    h.update(repr(row).encode('utf-8'))
+
+
+def _cell(value):
+    # Samakan dengan konversi pandas: sel kosong -> NaN, angka bulat float -> int
+    if value is None:
+        return float('nan')
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _as_str(value):
+    # Setara dengan Series.astype(str): sel kosong menjadi 'nan'
+    return 'nan' if value is None else str(value)
+
+
+def _new_buffer():
+    return {col: [] for col in OUTPUT_COLUMNS}
+
+
+def _flush(buffer):
+    """Ubah buffer kolom menjadi DataFrame bertipe, lalu terapkan filter numerik"""
+    df = pd.DataFrame(buffer, columns=OUTPUT_COLUMNS)
+    if df.empty:
+        return df
+
+    df['Date'] = pd.to_datetime(df['Date'], errors='coerce').dt.date
+    df['Rit'] = pd.to_numeric(df['Rit'], errors='coerce')
+    df['Tonnase'] = pd.to_numeric(df['Tonnase'], errors='coerce')
+
+    df = df.dropna(subset=['Tonnase'])
+    df = df[df['Tonnase'] > 0]
+    return df
+
+
+def stream_produksi(file_path, sheet_name='Tahun 2025', chunk_size=5000):
+    """Baca & bersihkan sheet produksi secara streaming, hasil sama dengan load_produksi"""
+    normal, shifted, watermark = stream_produksi_rows(file_path, sheet_name, chunk_size)
+    if watermark is None:
+        return pd.DataFrame()
+    return combine_rows(normal, shifted)
+
+
+def combine_rows(normal, shifted, has_shifted=None):
+    """Gabung baris normal & bergeser seperti versi pandas (concat([normal, bergeser]))"""
+    df = pd.concat([normal, shifted], ignore_index=True)
+    if not (len(shifted) > 0 if has_shifted is None else has_shifted):
+        # Sama seperti versi pandas: bulan lama tanpa kolom BLOK
+        df['BLOK'] = ''
+    return df
+
+
+def stream_produksi_rows(file_path, sheet_name='Tahun 2025', chunk_size=5000, previous=None):
+    """(baris normal, baris bergeser, watermark) dari sheet produksi.
+
+    Dengan `previous` (watermark versi lama sheet ini), baris lama hanya di-hash
+    & dicocokkan lalu dilewati; yang di-parse hanya baris sesudahnya. Hitungan
+    baris di watermark tetap total. HistoryChanged jika baris lama berbeda.
+    Watermark None jika sheet kosong."""
+    from openpyxl import load_workbook
+
+    skip = previous['rows'] if previous else 0
+    old_blocks = previous['blocks'] if previous else []
+
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet_name]
+        header = next(ws.iter_rows(max_row=1, values_only=True), None)
+        if header is None:
+            if skip:
+                raise HistoryChanged("Sheet kosong")
+            return pd.DataFrame(columns=OUTPUT_COLUMNS), pd.DataFrame(columns=OUTPUT_COLUMNS), None
+        header_hash = hashlib.sha1(repr(header).encode('utf-8')).hexdigest()
+        if previous and previous['header'] != header_hash:
+            raise HistoryChanged("Header sheet berubah")
+
+        idx = {name: i for i, name in enumerate(header) if name is not None}
+        required = ['Date', 'Time', 'Shift', 'Front', 'Commudity', 'Excavator',
+                    'Dump Truck', 'Dump Loc', 'Rit', 'Tonnase']
+        missing = [c for c in required if c not in idx]
+        if missing:
+            raise KeyError(f"Kolom tidak ditemukan: {missing}")
+
+        i_date, i_time, i_shift = idx['Date'], idx['Time'], idx['Shift']
+        i_front, i_comm, i_exc = idx['Front'], idx['Commudity'], idx['Excavator']
+        i_dt, i_loc, i_rit, i_ton = idx['Dump Truck'], idx['Dump Loc'], idx['Rit'], idx['Tonnase']
+        # Kolom setelah Tonnase ('Unnamed: 10') berisi tonase untuk baris bergeser
+        i_extra = i_ton + 1
+        width = i_extra + 1
+
+        # Baris normal & baris bergeser dikumpulkan terpisah supaya urutan
+        # hasil sama dengan concat([normal, bergeser]) versi pandas
+        normal_chunks, shifted_chunks = [], []
+        normal_buf, shifted_buf = _new_buffer(), _new_buffer()
+        normal_n = shifted_n = 0
+
+        block, blocks, n_rows = hashlib.sha1(), [], 0
+
+        for row in ws.iter_rows(min_row=2, max_col=width, values_only=True):
+            if len(row) < width:
+                row = tuple(row) + (None,) * (width - len(row))
+
+            _hash_row(block, row)
+            n_rows += 1
+            if n_rows % BLOCK_ROWS == 0:
+                blocks.append(block.hexdigest())
+                block = hashlib.sha1()
+                if len(blocks) <= len(old_blocks) and blocks[-1] != old_blocks[len(blocks) - 1]:
+                    raise HistoryChanged(f"Baris lama berubah (blok {len(blocks)})")
+            if n_rows <= skip:
+                # Baris lama: cukup dicocokkan, tidak di-parse ulang
+                if n_rows == skip and block.hexdigest() != previous['tail']:
+                    raise HistoryChanged("Baris lama berubah (blok terakhir)")
+                continue
+
+            # Header berulang ('Shift') & baris kosong tersaring di sini
+            shift = row[i_shift]
+            if shift not in VALID_SHIFTS:
+                continue
+
+            if _as_str(row[i_exc]).startswith('PC'):
+                buf = normal_buf
+                blok, front, comm, exc = None, row[i_front], row[i_comm], row[i_exc]
+                truck, loc, rit, ton = row[i_dt], row[i_loc], row[i_rit], row[i_ton]
+            else:
+                # 🔥 BLOK DIAMBIL DARI KOLOM FRONT LAMA
+                buf = shifted_buf
+                blok, front, comm, exc = row[i_front], row[i_comm], row[i_exc], row[i_dt]
+                truck, loc, rit, ton = row[i_loc], row[i_rit], row[i_ton], row[i_extra]
+                if not _as_str(exc).startswith('PC'):
+                    continue
+
+            truck = _as_str(_cell(truck))
+            if not _DIGITS.match(truck):
+                continue
+
+            buf['Date'].append(row[i_date])
+            buf['Time'].append(_as_str(_cell(row[i_time])))
+            buf['Shift'].append(shift)
+            buf['Front'].append(_cell(front))
+            buf['Commudity'].append(_cell(comm))
+            buf['Excavator'].append(exc)
+            buf['Dump Truck'].append(truck)
+            buf['Dump Loc'].append(_cell(loc))
+            buf['Rit'].append(_cell(rit))
+            buf['Tonnase'].append(_cell(ton))
+            buf['BLOK'].append(_cell(blok))
+
+            if buf is normal_buf:
+                normal_n += 1
+                if normal_n >= chunk_size:
+                    normal_chunks.append(_flush(normal_buf))
+                    normal_buf, normal_n = _new_buffer(), 0
+            else:
+                shifted_n += 1
+                if shifted_n >= chunk_size:
+                    shifted_chunks.append(_flush(shifted_buf))
+                    shifted_buf, shifted_n = _new_buffer(), 0
+
+        if n_rows < skip:
+            raise HistoryChanged("Sheet lebih pendek dari versi sebelumnya")
+
+        normal_chunks.append(_flush(normal_buf))
+        shifted_chunks.append(_flush(shifted_buf))
+    finally:
+        wb.close()
+
+    normal = pd.concat(normal_chunks, ignore_index=True)
+    shifted = pd.concat(shifted_chunks, ignore_index=True)
+    watermark = {
+        'header': header_hash,
+        'rows': n_rows,
+        'blocks': blocks,
+        'tail': block.hexdigest(),
+        # Jumlah baris hasil (setelah filter), termasuk baris versi lama
+        'normal': (previous['normal'] if previous else 0) + len(normal),
+        'shifted': (previous['shifted'] if previous else 0) + len(shifted),
+    }
+    return normal, shifted, watermark
@@ -0,0 +1,64 @@
+import json
+import os
+import threading
+import time
+
+from utils.cache import CACHE_DIR, _write_atomic, file_lock
+
+# ============================================================
+# WATERMARK SHEET (INGESTION APPEND)
+# ============================================================
+# Tiap sheet yang selesai di-parse dicatat: sidik file, jumlah baris mentah,
+# hash blok baris (lihat utils.streaming) dan jumlah baris hasil. Upload baru
+# dicocokkan dengan catatan terakhir sheet yang sama; jika baris lama identik
+# hanya ekornya yang di-parse. Catatan append menyimpan sidik versi induk &
+# rentang baris baru supaya agregat bisa diperbarui dari versi induk.
+
+WATERMARK_FILE = os.path.join(CACHE_DIR, 'watermarks.json')
+
+# Catatan per dataset yang disimpan (yang lama dibuang)
+WATERMARK_MAX = 16
+
+_watermark_lock = threading.Lock()
+
+
+def _read_all():
+    try:
+        with open(WATERMARK_FILE, 'r') as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def record_watermark(dataset, fingerprint, sheet, watermark, parent=None, appended=None):
+    """Catat watermark hasil parse `sheet` dari file bersidik `fingerprint`"""
+    entry = dict(watermark, fingerprint=fingerprint, sheet=sheet, parent=parent,
+                 appended=appended or [], time=time.time())
+    # Baca-ubah-tulis di bawah kunci file: worker Streamlit & server API bisa
+    # mencatat sheet bersamaan tanpa saling menimpa catatan
+    try:
+        with _watermark_lock, file_lock(WATERMARK_FILE):
+            data = _read_all()
+            entries = [e for e in data.get(dataset, [])
+                       if not (e['fingerprint'] == fingerprint and e['sheet'] == sheet)]
+            entries.append(entry)
+            data[dataset] = entries[-WATERMARK_MAX:]
+            _write_atomic(WATERMARK_FILE, json.dumps(data), mode='w')
+    except Exception:
+        pass
+    return entry
+
+
+def get_watermark(dataset, fingerprint, sheet):
+    """Catatan untuk (sidik file, sheet), None jika belum pernah di-parse"""
+    for entry in _read_all().get(dataset, []):
+        if entry['fingerprint'] == fingerprint and entry['sheet'] == sheet:
+            return entry
+    return None
+
+
+def latest_watermark(dataset, sheet, exclude=None):
+    """Catatan terbaru sheet `sheet` dari versi file lain (kandidat induk append)"""
+    entries = [e for e in _read_all().get(dataset, [])
+               if e['sheet'] == sheet and e['fingerprint'] != exclude]
+    return max(entries, key=lambda e: e['time']) if entries else None
@@ -0,0 +1,52 @@
+import importlib
+import threading
+
+# ============================================================
+# HALAMAN DASHBOARD (IMPORT SAAT DIBUKA)
+# ============================================================
+# Tiap menu punya modul sendiri yang baru di-import ketika menu itu pertama
+# kali dibuka, sehingga plotly & modul data tidak ikut dimuat untuk halaman
+# login atau halaman yang tidak pernah dikunjungi. Setelah ter-import, modul
+# tetap di sys.modules; rerun berikutnya hanya menjalankan fungsi halaman.
+
+# Menu -> (modul, fungsi)
+PAGES = {
+    "Dashboard Overview": ('views.overview', 'show_overview'),
+    "Produksi Harian": ('views.produksi', 'show_produksi'),
+    "Gangguan": ('views.gangguan', 'show_gangguan'),
+    "Monitoring": ('views.monitoring', 'show_monitoring'),
+    "Daily Plan": ('views.daily_plan', 'show_daily_plan'),
+}
+
+
+def render_page(menu):
+    if menu not in PAGES:
+        return
+    module, function = PAGES[menu]
+    getattr(importlib.import_module(module), function)()
+
+
+_warmup_lock = threading.Lock()
+_warmup_started = False
+
+
+def start_warmup():
+    """Picu warm-up cache dari thread terpisah (sekali per proses).
+
+    Dipakai halaman login: import modul data & fingerprint file tidak menunda
+    render form login, tetapi cache sudah mulai dipanaskan selama pengguna login.
+    """
+    global _warmup_started
+    with _warmup_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+
+    def run():
+        from utils.warmup import quiet_background_threads
+        quiet_background_threads()
+        from utils.data_loader import data_versions
+        from views.common import get_warmer
+        get_warmer().ensure(data_versions())
+
+    threading.Thread(target=run, name='cache-warmup-start', daemon=True).start()
@@ -0,0 +1,189 @@
+import os
+
+import streamlit as st
+
+from config import FIGURE_CACHE_MAX_MB
+from utils.data_loader import (
+    build_dataset, data_versions, dataset_for_upload, dataset_version,
+    invalidate_dataset, upload_target, warm_steps,
+)
+from utils.figure_cache import FigureCache
+from utils.ingest import Ingestor
+from utils.perf import CHART, timed
+from utils.warmup import CacheWarmer
+
+# ============================================================
+# KOMPONEN BERSAMA HALAMAN
+# ============================================================
+# Layout chart, cache figure, upload & status warm-up/ingestion yang dipakai
+# semua halaman. Di-import setelah login (bersama modul data).
+
+
+def chart_layout(title=None, height=300):
+    layout = dict(
+        template='plotly_dark',
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        height=height,
+        margin=dict(
+            l=60,
+            r=30,
+            t=50 if title else 30,
+            b=60
+        ),
+        xaxis=dict(
+            showgrid=False,
+            zeroline=False,
+            automargin=True
+        ),
+        yaxis=dict(
+            showgrid=True,
+            gridcolor='#21262d',
+            zeroline=False,
+            automargin=True
+        ),
+        legend=dict(
+            orientation='h',
+            y=-0.25,
+            x=0.5,
+            xanchor='center'
+        )
+    )
+
+    if title:
+        layout["title"] = dict(
+            text=title,
+            x=0.5,
+            font=dict(size=14)
+        )
+
+    return layout
+
+
+@st.cache_resource
+def get_figure_cache():
+    """Cache figure Plotly bersama untuk semua sesi"""
+    return FigureCache(max_bytes=FIGURE_CACHE_MAX_MB * 1024 * 1024)
+
+
+def show_chart(chart_id, version, params, builder):
+    """Tampilkan figure dari cache (versi data, id chart, filter); builder() hanya dipanggil saat miss"""
+    with timed(f'chart.{chart_id}.build', CHART) as t:
+        t.hit = True
+
+        def build():
+            t.hit = False
+            return builder()
+        fig = get_figure_cache().get_or_build((version, chart_id, params), build)
+    if fig is not None:
+        # Serialisasi figure ke JSON terjadi di dalam st.plotly_chart
+        with timed(f'chart.{chart_id}.render', CHART):
+            st.plotly_chart(fig, use_container_width=True)
+
+
+def delta_html(kpi, kpi_prev, key, label='periode sebelumnya'):
+    """Baris perubahan vs periode pembanding untuk metric-card"""
+    if key is None or not kpi_prev.get(key):
+        return ''
+    change = (kpi[key] - kpi_prev[key]) / kpi_prev[key] * 100
+    color = '#00E676' if change >= 0 else '#f85149'
+    arrow = '▲' if change >= 0 else '▼'
+    return f'<div class="metric-delta"><span style="color:{color}">{arrow} {abs(change):.1f}%</span> vs {label}</div>'
+
+
+@st.cache_resource
+def get_ingestor():
+    """Worker ingestion upload (satu untuk semua sesi)"""
+    return Ingestor()
+
+
+def handle_upload(uploaded_file, target_name):
+    """Serahkan file upload ke worker background; data lama tetap dipakai sampai versi baru siap"""
+    if uploaded_file:
+        # file_uploader tetap berisi file setelah rerun, jangan diproses dua kali
+        handled = st.session_state.setdefault('uploads_handled', set())
+        if uploaded_file.file_id in handled:
+            return False
+        try:
+            dataset = dataset_for_upload(target_name)
+            # Dataset terdaftar: tujuan mengikuti tahun di nama file / workbook terbaru
+            upload_path = upload_target(dataset, uploaded_file.name) if dataset else f"data/{target_name}"
+            if dataset is None:
+                # Target tidak terdaftar: tulis atomik & bersihkan semua cache
+                tmp_path = f"{upload_path}.upload-tmp.xlsx"
+                with open(tmp_path, "wb") as f:
+                    f.write(uploaded_file.getbuffer())
+                os.replace(tmp_path, upload_path)
+                st.cache_data.clear()
+                get_figure_cache().clear()
+            else:
+                old_version = dataset_version(dataset)
+
+                def publish():
+                    # Hanya rantai cache dataset ini; dataset lain tetap hangat
+                    invalidate_dataset(dataset)
+                    get_figure_cache().evict(lambda key: key[0] == old_version)
+                    # Panaskan ulang cache dengan versi data baru
+                    get_warmer().ensure(data_versions())
+
+                get_ingestor().submit(
+                    dataset, upload_path, bytes(uploaded_file.getbuffer()),
+                    build=lambda path: build_dataset(dataset, path),
+                    publish=publish,
+                )
+            handled.add(uploaded_file.file_id)
+            return True
+        except Exception as e:
+            st.error(f"❌ Upload gagal: {e}")
+            return False
+    return False
+
+
+@st.cache_resource
+def get_warmer():
+    """Pre-warm semua cache di background (satu untuk semua sesi)"""
+    return CacheWarmer(warm_steps)
+
+
+def render_cache_status():
+    """Progres pre-warm cache; refresh otomatis sampai semua cache siap"""
+    warmer = get_warmer()
+
+    @st.fragment(run_every=2 if not warmer.hot else None)
+    def cache_status():
+        done, total, failed = warmer.progress()
+        if warmer.hot:
+            st.caption(f"🔥 Cache siap ({total} langkah, {warmer.duration:.1f} dtk)")
+        else:
+            st.progress(done / total if total else 0.0, text=f"♨️ Memanaskan cache {done}/{total}")
+        if failed:
+            st.caption(f"⚠️ Gagal: {', '.join(failed)}")
+
+    cache_status()
+
+
+INGEST_LABEL = {'menunggu': '⏳ Menunggu', 'memproses': '⚙️ Memproses', 'selesai': '✅ Siap', 'gagal': '❌ Gagal'}
+
+
+def render_ingest_status():
+    """Status ingestion upload; refresh otomatis selama masih ada proses berjalan"""
+    ingestor = get_ingestor()
+    if not ingestor.jobs():
+        return
+
+    @st.fragment(run_every=2 if ingestor.busy() else None)
+    def ingest_status():
+        busy = ingestor.busy()
+        st.markdown('<p style="color:#58a6ff;font-size:0.85rem;font-weight:600;">📥 STATUS UPLOAD</p>', unsafe_allow_html=True)
+        for job in ingestor.jobs():
+            label = INGEST_LABEL.get(job.status, job.status)
+            st.caption(f"{label} · {os.path.basename(job.target_path)} ({job.duration:.0f} dtk)")
+            if job.error:
+                st.caption(f"⚠️ {job.error}")
+        # Proses baru selesai: muat ulang halaman supaya memakai versi data baru
+        if st.session_state.get('ingest_busy') and not busy:
+            st.session_state.ingest_busy = False
+            st.rerun()
+        st.session_state.ingest_busy = busy
+
+    ingest_status()
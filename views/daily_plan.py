@@ -0,0 +1,63 @@
+import pandas as pd
+import streamlit as st
+
+from utils.data_loader import load_daily_plan, load_realisasi
+from utils.perf import SectionTimer
+from views.common import handle_upload
+
+# ================================================================
+# DAILY PLAN
+# ================================================================
+def show_daily_plan():
+    sections = SectionTimer('daily_plan')
+    col_title, col_upload = st.columns([3,1])
+    with col_title:
+        st.markdown('<h2 style="color:#fff;margin-bottom:1rem;">📋 Daily Plan & Realisasi</h2>', unsafe_allow_html=True)
+    with col_upload:
+        with st.expander("📤 Upload Data Daily Plan"):
+            up = st.file_uploader("Upload file Excel", type=['xlsx','xls'], key="up_daily_main", label_visibility="collapsed")
+            if up and handle_upload(up, "DAILY_PLAN.xlsx"):
+                st.success("✅ File diterima, data diproses di background")
+                st.rerun()
+    
+    tab1, tab2 = st.tabs(["📅 Scheduling", "✅ Realisasi"])
+    
+    with tab1:
+        dp = load_daily_plan()
+        if not dp.empty:
+            c1,c2,c3,c4 = st.columns(4)
+            c1.metric("📅 Total Record", len(dp))
+            if 'Batu Kapur' in dp.columns:
+                c2.metric("🪨 Target Batu Kapur", f"{pd.to_numeric(dp['Batu Kapur'], errors='coerce').sum():,.0f}")
+            if 'Silika' in dp.columns:
+                c3.metric("🏔️ Target Silika", f"{pd.to_numeric(dp['Silika'], errors='coerce').sum():,.0f}")
+            if 'Clay' in dp.columns:
+                c4.metric("🧱 Target Clay", f"{pd.to_numeric(dp['Clay'], errors='coerce').sum():,.0f}")
+            
+            st.markdown('<div class="section-title">📋 Data Scheduling</div>', unsafe_allow_html=True)
+            st.dataframe(dp, use_container_width=True, height=400)
+            
+            # Placeholder Peta
+            st.markdown('<div class="section-title">🗺️ Peta Lokasi (Coming Soon)</div>', unsafe_allow_html=True)
+            st.info("📍 Fitur peta akan menggunakan data Blok, Grid, dan ROM untuk menampilkan lokasi penambangan.")
+        else:
+            st.info("Data scheduling tidak tersedia. Upload file DAILY_PLAN.xlsx")
+        sections.mark('scheduling', rows_out=len(dp))
+    
+    with tab2:
+        dr = load_realisasi()
+        if not dr.empty:
+            c1,c2,c3,c4 = st.columns(4)
+            c1.metric("📅 Total Record", len(dr))
+            if 'Batu Kapur' in dr.columns:
+                c2.metric("🪨 Realisasi Batu Kapur", f"{pd.to_numeric(dr['Batu Kapur'], errors='coerce').sum():,.0f}")
+            if 'Silika' in dr.columns:
+                c3.metric("🏔️ Realisasi Silika", f"{pd.to_numeric(dr['Silika'], errors='coerce').sum():,.0f}")
+            if 'Timbunan' in dr.columns:
+                c4.metric("🏗️ Realisasi Timbunan", f"{pd.to_numeric(dr['Timbunan'], errors='coerce').sum():,.0f}")
+            
+            st.markdown('<div class="section-title">📋 Data Realisasi</div>', unsafe_allow_html=True)
+            st.dataframe(dr, use_container_width=True, height=400)
+        else:
+            st.info("Data realisasi tidak tersedia")
+        sections.mark('realisasi', rows_out=len(dr))
@@ -0,0 +1,76 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from utils.data_loader import BULAN_LIST, dataset_version, load_gangguan, load_gangguan_all, load_gangguan_ytd
+from utils.perf import SectionTimer
+from views.common import chart_layout, handle_upload, show_chart
+
+# ================================================================
+# GANGGUAN
+# ================================================================
+def show_gangguan():
+    sections = SectionTimer('gangguan')
+    col_title, col_upload = st.columns([3,1])
+    with col_title:
+        st.markdown('<h2 style="color:#fff;margin-bottom:1rem;">🚨 Analisis Gangguan Produksi</h2>', unsafe_allow_html=True)
+    with col_upload:
+        with st.expander("📤 Upload Data Gangguan"):
+            up = st.file_uploader("Upload file Excel", type=['xlsx','xls'], key="up_gang_main", label_visibility="collapsed")
+            if up and handle_upload(up, "Gangguan_Produksi_2025_baru.xlsx"):
+                st.success("✅ File diterima, data diproses di background")
+                st.rerun()
+    
+    dg_all = load_gangguan_all()
+    bulan = st.selectbox("Pilih Bulan", BULAN_LIST + ["Semua Bulan (YTD)"])
+    if bulan == "Semua Bulan (YTD)":
+        dg = load_gangguan_ytd()
+    else:
+        dg = load_gangguan(bulan)
+    sections.mark('load', rows_in=len(dg_all), rows_out=len(dg))
+    
+    if not dg.empty:
+        dg['Row Labels'] = dg['Row Labels'].astype(str)
+        version = dataset_version('gangguan')
+        c1,c2,c3 = st.columns(3)
+        c1.metric("🔢 Jenis Gangguan", len(dg))
+        c2.metric("📊 Total Frekuensi", f"{dg['Frekuensi'].sum():,.0f}")
+        c3.metric("🔝 Top Issue", dg.iloc[0]['Row Labels'][:25])
+        
+        col1, col2 = st.columns([2,1])
+        with col1:
+            st.markdown('<div class="section-title">📊 Pareto Chart - 80/20 Analysis</div>', unsafe_allow_html=True)
+            def fig_pareto():
+                dp = dg.head(10).copy()
+                dp['Kumulatif'] = (dp['Frekuensi'].cumsum()/dg['Frekuensi'].sum()*100)
+                fig = make_subplots(specs=[[{"secondary_y": True}]])
+                fig.add_trace(go.Bar(x=dp['Row Labels'], y=dp['Frekuensi'], name='Frekuensi', marker_color='#f85149'), secondary_y=False)
+                fig.add_trace(go.Scatter(x=dp['Row Labels'], y=dp['Kumulatif'], name='Kumulatif %', line=dict(color='#f0883e',width=3), mode='lines+markers'), secondary_y=True)
+                fig.add_hline(y=80, line_dash="dash", line_color="#58a6ff", secondary_y=True, annotation_text="80%")
+                fig.update_layout(**chart_layout(height=400))
+                fig.update_xaxes(tickangle=-45)
+                return fig
+            show_chart('gangguan_pareto', version, (bulan,), fig_pareto)
+        
+        with col2:
+            st.markdown('<div class="section-title">🥧 Proporsi Gangguan (Pie)</div>', unsafe_allow_html=True)
+            def fig_pie():
+                fig = px.pie(dg.head(8), values='Frekuensi', names='Row Labels', hole=0.4, color_discrete_sequence=px.colors.sequential.Reds_r)
+                fig.update_layout(**chart_layout(height=400))
+                return fig
+            show_chart('gangguan_pie', version, (bulan,), fig_pie)
+        
+        st.dataframe(dg, use_container_width=True, height=250)
+        
+        st.markdown('<div class="section-title">📈 Tren Frekuensi Gangguan per Bulan</div>', unsafe_allow_html=True)
+        def fig_trend():
+            trend = dg_all.groupby('Bulan', sort=False)['Frekuensi'].sum().reindex(BULAN_LIST).dropna().reset_index()
+            fig = px.bar(trend, x='Bulan', y='Frekuensi', color_discrete_sequence=['#f85149'])
+            fig.update_layout(**chart_layout(height=300))
+            return fig
+        # Tren tidak bergantung bulan terpilih
+        show_chart('gangguan_trend', version, (), fig_trend)
+        sections.mark('charts')
+    else:
+        st.info(f"Data gangguan bulan {bulan} tidak tersedia. Upload file Gangguan_Produksi_2025_baru.xlsx")
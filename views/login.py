@@ -0,0 +1,39 @@
+import streamlit as st
+
+from config import USERS
+
+# ============================================================
+# LOGIN
+# ============================================================
+# Hanya streamlit + config: halaman login tidak meng-import modul data/chart
+
+
+def login(u, p):
+    if u in USERS and USERS[u]['password'] == p:
+        st.session_state.logged_in, st.session_state.username = True, u
+        st.session_state.role, st.session_state.name = USERS[u]['role'], USERS[u]['name']
+        return True
+    return False
+
+def logout():
+    st.session_state.logged_in = False
+    st.session_state.username = st.session_state.role = st.session_state.name = None
+
+# LOGIN PAGE
+def show_login():
+    col1, col2, col3 = st.columns([1,1.5,1])
+    with col2:
+        st.markdown("""
+        <div style="text-align:center;padding:2rem 0;">
+            <p style="font-size:3.5rem;margin:0;">⛏️</p>
+            <h1 style="background:linear-gradient(90deg,#00C853,#00E5FF);-webkit-background-clip:text;-webkit-text-fill-color:transparent;margin:0.5rem 0;font-size:2.2rem;">Dashboard Tambang</h1>
+            <p style="color:#8b949e;font-size:1rem;">Semen Padang Mining Operations</p>
+        </div>
+        """, unsafe_allow_html=True)
+        with st.form("login"):
+            u = st.text_input("👤 Username")
+            p = st.text_input("🔒 Password", type="password")
+            if st.form_submit_button("🚀 Login", use_container_width=True):
+                if login(u, p): st.rerun()
+                else: st.error("❌ Login gagal!")
+        st.caption("Demo: admin_produksi/prod123")
@@ -0,0 +1,82 @@
+import plotly.express as px
+import streamlit as st
+
+from utils.data_loader import dataset_version, load_bbm, load_ritase
+from utils.perf import SectionTimer
+from views.common import chart_layout, handle_upload, show_chart
+
+# ================================================================
+# MONITORING
+# ================================================================
+def show_monitoring():
+    sections = SectionTimer('monitoring')
+    col_title, col_upload = st.columns([3,1])
+    with col_title:
+        st.markdown('<h2 style="color:#fff;margin-bottom:1rem;">⛽ Monitoring BBM & Ritase</h2>', unsafe_allow_html=True)
+    with col_upload:
+        with st.expander("📤 Upload Data Monitoring"):
+            up = st.file_uploader("Upload file Excel", type=['xlsx','xls'], key="up_mon_main", label_visibility="collapsed")
+            if up and handle_upload(up, "Monitoring_2025_.xlsx"):
+                st.success("✅ File diterima, data diproses di background")
+                st.rerun()
+    
+    tab1, tab2 = st.tabs(["⛽ BBM", "🚛 Ritase"])
+    version = dataset_version('monitoring')
+    
+    with tab1:
+        db = load_bbm()
+        if not db.empty:
+            c1,c2,c3 = st.columns(3)
+            c1.metric("⛽ Total BBM", f"{db['Total'].sum():,.0f} L")
+            c2.metric("🏗️ Jumlah Alat", len(db))
+            c3.metric("📊 Avg/Alat", f"{db['Total'].mean():,.0f} L")
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown('<div class="section-title">📊 Distribusi BBM per Jenis Alat</div>', unsafe_allow_html=True)
+                def fig_bbm_type():
+                    bbm_type = db.groupby('Alat Berat')['Total'].sum().reset_index()
+                    fig = px.pie(bbm_type, values='Total', names='Alat Berat', hole=0.5, color_discrete_sequence=['#f0883e','#f85149','#a371f7','#00E676'])
+                    fig.update_layout(**chart_layout(height=350))
+                    return fig
+                show_chart('monitoring_bbm_type', version, (), fig_bbm_type)
+            
+            with col2:
+                st.markdown('<div class="section-title">🔝 Top 10 Konsumsi BBM</div>', unsafe_allow_html=True)
+                def fig_bbm_top():
+                    fig = px.bar(
+                        db.nlargest(10,'Total'),
+                        x='Total',
+                        y='Tipe Alat',
+                        orientation='h',
+                        color='Total',
+                        color_continuous_scale='OrRd'
+                    )
+                    fig.update_layout(**chart_layout(height=350))
+                    fig.update_yaxes(categoryorder='total ascending')
+                    fig.update_coloraxes(showscale=False)
+                    return fig
+                show_chart('monitoring_bbm_top', version, (), fig_bbm_top)
+                st.dataframe(db, use_container_width=True, height=300)
+        else:
+            st.info("Data BBM tidak tersedia. Upload file Monitoring_2025_.xlsx")
+        sections.mark('bbm', rows_out=len(db))
+    
+    with tab2:
+        st.markdown('<div class="section-title">🚛 Ritase per Front</div>', unsafe_allow_html=True)
+        dr = load_ritase()
+        if not dr.empty:
+            def fig_ritase():
+                rc = [c for c in dr.columns if c not in ['Tanggal','Shift','Pengawasan']]
+                tot = dr[rc].sum().reset_index()
+                tot.columns = ['Front','Total']
+                tot = tot[tot['Total']>0].sort_values('Total', ascending=True)
+                fig = px.bar(tot, x='Total', y='Front', orientation='h', color='Total', color_continuous_scale='Blues')
+                fig.update_layout(**chart_layout(height=400))
+                fig.update_coloraxes(showscale=False)
+                return fig
+            show_chart('monitoring_ritase', version, (), fig_ritase)
+            st.dataframe(dr, use_container_width=True, height=300)
+        else:
+            st.info("Data ritase tidak tersedia")
+        sections.mark('ritase', rows_out=len(dr))
@@ -0,0 +1,136 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+
+from utils.data_loader import dataset_version, load_overview_snapshot
+from utils.perf import SectionTimer
+from views.common import chart_layout, show_chart
+
+# ================================================================
+# DASHBOARD OVERVIEW
+# ================================================================
+def show_overview():
+    st.markdown('<h2 style="color:#fff;margin-bottom:1.5rem;">📊 Dashboard Overview</h2>', unsafe_allow_html=True)
+    
+    sections = SectionTimer('overview')
+    # Semua angka & tabel sudah dihitung di snapshot (sekali per versi data)
+    snap = load_overview_snapshot()
+    m = snap['metrics']
+    v_prod = dataset_version('produksi')
+    sections.mark('snapshot')
+    
+    # Row 1: Main KPIs
+    cols = st.columns(5)
+    metrics = [
+        ("🚛", "Total Ritase", f"{m['rit']:,.0f}", "#00E676"),
+        ("⚖️", "Total Tonase", f"{m['tonnase']:,.0f}", "#58a6ff"),
+        ("🏗️", "Unit Excavator", f"{m['excavator']}", "#f0883e"),
+        ("⛽", "Total BBM (L)", f"{m['bbm']:,.0f}", "#a371f7"),
+        ("🚨", "Jenis Gangguan", f"{m['gangguan']}", "#f85149")
+    ]
+    for col, (icon, label, value, color) in zip(cols, metrics):
+        col.markdown(f'<div class="metric-card"><div class="metric-icon">{icon}</div><div class="metric-label">{label}</div><div class="metric-value" style="color:{color}">{value}</div></div>', unsafe_allow_html=True)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    sections.mark('kpi')
+    
+    # Row 2: Charts
+    col1, col2 = st.columns([3, 2])
+    with col1:
+        st.markdown('<div class="section-title">📈 Tren Produksi Harian</div>', unsafe_allow_html=True)
+        if snap['daily'] is not None:
+            def fig_daily():
+                daily = snap['daily']
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(x=daily['Date'], y=daily['Tonnase'], name='Tonase', fill='tozeroy',
+                                         line=dict(color='#00E676',width=2), fillcolor='rgba(0,230,118,0.15)'))
+                fig.update_layout(**chart_layout(height=280))
+                return fig
+            show_chart('overview_daily', v_prod, (), fig_daily)
+        else:
+            st.info("Data produksi tidak tersedia")
+    
+    with col2:
+        st.markdown('<div class="section-title">🏗️ Produksi per Excavator</div>', unsafe_allow_html=True)
+        if snap['top_excavator'] is not None:
+            def fig_exc():
+                exc = snap['top_excavator']
+                fig = px.bar(exc, x='Tonnase', y='Excavator', orientation='h', 
+                             color='Tonnase', color_continuous_scale=['#1e3a5f','#58a6ff'])
+                fig.update_layout(**chart_layout(height=280))
+                fig.update_coloraxes(showscale=False)
+                return fig
+            show_chart('overview_excavator', v_prod, (), fig_exc)
+        else:
+            st.info("Data tidak tersedia")
+    
+    # Row 3: Distribution
+    c1, c2, c3, c4 = st.columns(4)
+    with c1:
+        st.markdown('<div class="section-title">🪨 Material</div>', unsafe_allow_html=True)
+        if snap['material'] is not None:
+            def fig_mat():
+                mat = snap['material']
+                fig = px.pie(mat, values='Tonnase', names='Commudity', hole=0.5,
+                             color_discrete_sequence=['#00E676','#58a6ff','#f0883e','#a371f7'])
+                fig.update_layout(**chart_layout(height=200))
+                fig.update_traces(textposition='inside', textinfo='percent')
+                return fig
+            show_chart('overview_material', v_prod, (), fig_mat)
+    
+    with c2:
+        st.markdown('<div class="section-title">🔄 Per Shift</div>', unsafe_allow_html=True)
+        if snap['shift'] is not None:
+            def fig_shift():
+                shift = snap['shift']
+                fig = px.bar(shift, x='Shift', y='Tonnase', color='Shift',
+                             color_discrete_sequence=['#00E676','#58a6ff','#f0883e'])
+                fig.update_layout(**chart_layout(height=200), showlegend=False)
+                return fig
+            show_chart('overview_shift', v_prod, (), fig_shift)
+    
+    with c3:
+        st.markdown('<div class="section-title">🚨 Top Gangguan</div>', unsafe_allow_html=True)
+        if snap['top_gangguan'] is not None:
+            def fig_gangguan():
+                dg_top = snap['top_gangguan']
+                fig = px.bar(
+                    dg_top,
+                    x='Frekuensi',
+                    y='Row Labels',
+                    orientation='h',
+                    color_discrete_sequence=['#f85149']
+                )
+                fig.update_layout(**chart_layout(height=200))
+                fig.update_yaxes(categoryorder='total ascending')
+                return fig
+            show_chart('overview_gangguan', dataset_version('gangguan'), (), fig_gangguan)
+
+        else:
+            st.info("Data tidak tersedia")
+    
+    with c4:
+        st.markdown('<div class="section-title">⛽ BBM per Alat</div>', unsafe_allow_html=True)
+        if snap['bbm_per_alat'] is not None:
+            def fig_bbm():
+                bbm_type = snap['bbm_per_alat']
+                fig = px.pie(bbm_type, values='Total', names='Alat Berat', hole=0.5,
+                             color_discrete_sequence=['#f0883e','#f85149','#a371f7','#00E676'])
+                fig.update_layout(**chart_layout(height=200))
+                fig.update_traces(textposition='inside', textinfo='percent')
+                return fig
+            show_chart('overview_bbm', dataset_version('monitoring'), (), fig_bbm)
+        else:
+            st.info("Data tidak tersedia")
+    
+    # Row 4: Heatmap
+    if snap['heatmap'] is not None:
+        st.markdown('<div class="section-title">🔥 Heatmap Produktivitas (Shift x Excavator)</div>', unsafe_allow_html=True)
+        def fig_heatmap():
+            pivot = snap['heatmap']
+            fig = px.imshow(pivot, color_continuous_scale='Greens', aspect='auto',
+                            labels=dict(x="Shift", y="Excavator", color="Tonase"))
+            fig.update_layout(**chart_layout(height=280))
+            return fig
+        show_chart('overview_heatmap', v_prod, (), fig_heatmap)
+    sections.mark('charts')
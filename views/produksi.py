@@ -0,0 +1,415 @@
+import plotly.express as px
+import plotly.graph_objects as go
+import streamlit as st
+from plotly.subplots import make_subplots
+
+from utils.data_loader import (
+    dataset_version, detail_produksi, export_produksi, kpi_produksi, load_produksi_cube_index,
+    load_produksi_range, load_produksi_summary, rollup_produksi,
+)
+from utils.export import EXPORT_FORMATS, read_export
+from utils.grid import DETAIL_COLUMNS, DetailGrid
+from utils.kpi import COMPARE_PERIODS
+from utils.perf import SectionTimer
+from views.common import chart_layout, delta_html, handle_upload, show_chart
+
+# ================================================================
+# PRODUKSI HARIAN
+# ================================================================
+# Setiap bagian yang memiliki widget adalah fragment (st.fragment): widget
+# filter menjalankan ulang isi halaman saja (bukan sidebar, warm-up & loader);
+# pembanding KPI, ukuran chart, export & tabel detail hanya menjalankan ulang
+# bagiannya masing-masing. Analisis tidak punya widget sehingga fungsi biasa
+# di dalam fragment isi halaman; figure-nya diambil dari cache figure bila
+# filternya tidak berubah.
+
+# Pilihan ukuran chart -> kolom agregat
+CHART_MEASURES = {'Tonase': 'Tonnase', 'Ritase': 'Rit'}
+
+
+class ProduksiFilter:
+    """Filter aktif halaman Produksi + agregat yang dihitung darinya"""
+
+    def __init__(self, cube_index, start_date, end_date, filters):
+        self.cube_index = cube_index
+        self.start_date = start_date
+        self.end_date = end_date
+        self.filters = filters
+        # Kunci cache figure: versi file + semua filter
+        self.version = dataset_version('produksi')
+        self.params = (start_date, end_date, tuple(sorted(filters.items())))
+        self._cube = None
+
+    def cube(self):
+        # Hanya dihitung bila ada chart yang belum ada di cache figure
+        if self._cube is None:
+            self._cube = self.cube_index.take(self.start_date, self.end_date, self.filters)
+        return self._cube
+
+    def rollup(self, by):
+        return rollup_produksi(by, self.start_date, self.end_date, self.filters, cube=self.cube)
+
+    def rows(self, columns):
+        # Baris mentah dibaca dari partisi bulan yang beririsan dengan rentang tanggal saja
+        df = load_produksi_range(self.start_date, self.end_date, list(dict.fromkeys([*columns, *self.filters])))
+        for col, value in self.filters.items():
+            df = df[df[col] == value]
+        return df[list(columns)]
+
+
+def show_produksi():
+    sections = SectionTimer('produksi')
+    col_title, col_upload = st.columns([3,1])
+    with col_title:
+        st.markdown('<h2 style="color:#fff;margin-bottom:1rem;">📊 Produksi Harian</h2>', unsafe_allow_html=True)
+    with col_upload:
+        with st.expander("📤 Upload Data Produksi"):
+            up = st.file_uploader("Upload file Excel", type=['xlsx','xls'], key="up_prod_main", label_visibility="collapsed")
+            if up and handle_upload(up, "Produksi_UTSG_Harian.xlsx"):
+                st.success("✅ File diterima, data diproses di background")
+                st.rerun()
+    
+    # Jumlah baris & batas tanggal dari manifest partisi, tanpa membaca data
+    summary = load_produksi_summary()
+    if not summary['rows']:
+        st.warning("⚠️ Data tidak tersedia. Upload file Produksi_UTSG_Harian.xlsx")
+        return
+    sections.mark('load', rows_out=summary['rows'])
+    produksi_content(summary)
+
+
+@st.fragment
+def produksi_content(summary):
+    """Filter + semua bagian di bawahnya; widget filter menjalankan ulang fragment ini saja"""
+    sections = SectionTimer('produksi')
+
+    # =========================
+    # Filter
+    # =========================
+    st.markdown('<div class="section-title">🔍 Filter Data</div>', unsafe_allow_html=True)
+
+    col_f1, col_f2, col_f3, col_f4, col_f5, col_f6 = st.columns(6)
+
+    # Nilai dropdown dari cube agregat (dibangun sekali per versi data)
+    cube_index = load_produksi_cube_index()
+
+    # tanggal min max
+    min_date, max_date = summary['min_date'], summary['max_date']
+
+    with col_f1:
+        start_date = st.date_input(
+            "📅 Dari Tanggal",
+            min_date,
+            min_value=min_date,
+            max_value=max_date
+        )
+
+    with col_f2:
+        end_date = st.date_input(
+            "📅 Sampai Tanggal",
+            max_date,
+            min_value=min_date,
+            max_value=max_date
+        )
+
+    with col_f3:
+        selected_shift = st.selectbox(
+            "🔄 Shift",
+            ['Semua'] + cube_index.values('Shift')
+        )
+
+    with col_f4:
+        selected_exc = st.selectbox(
+            "🏗️ Excavator",
+            ['Semua'] + cube_index.values('Excavator')
+        )
+
+    with col_f5:
+        selected_blok = st.selectbox(
+            "🧱 BLOK",
+            ['Semua'] + cube_index.values('BLOK')
+        )
+
+    with col_f6:
+        selected_front = st.selectbox(
+            "📍 Front",
+            ['Semua'] + cube_index.values('Front')
+        )
+
+    # =========================
+    # Filtering logic
+    # =========================
+    filters = {
+        col: value for col, value in [
+            ('Shift', selected_shift), ('Excavator', selected_exc),
+            ('BLOK', selected_blok), ('Front', selected_front),
+        ] if value != 'Semua'
+    }
+    sections.mark('filter')
+
+    # Chart, KPI & tabel detail di-query ke store SQLite (cadangan: cube & grid di
+    # memori); scatter hanya membaca partisi bulan yang beririsan dengan rentang tanggal
+    q = ProduksiFilter(cube_index, start_date, end_date, filters)
+
+    produksi_kpi(q, summary['rows'])
+    produksi_charts(q)
+    produksi_analisis(q)
+    produksi_export(q)
+    produksi_table(q)
+
+
+@st.fragment
+def produksi_kpi(q, total_rows):
+    """KPI + pembandingnya; radio pembanding menjalankan ulang fragment ini saja"""
+    sections = SectionTimer('produksi')
+    compare = st.radio("Bandingkan dengan", list(COMPARE_PERIODS), horizontal=True,
+                       format_func=str.capitalize, key='produksi_kpi_compare')
+
+    # KPI periode ini & periode pembanding, dihitung di store SQLite
+    kpi = kpi_produksi(q.start_date, q.end_date, q.filters)
+    kpi_prev = kpi_produksi(*COMPARE_PERIODS[compare](q.start_date, q.end_date), q.filters)
+
+    st.markdown(
+        f'<p style="color:#8b949e;font-size:0.8rem;">'
+        f'Menampilkan {kpi["trip"]:,} dari {total_rows:,} data | '
+        f'{q.start_date} s/d {q.end_date}'
+        f'</p>',
+        unsafe_allow_html=True
+    )
+
+    # KPI
+    cols = st.columns(5)
+    kpis = [("🚛","RITASE",f"{kpi['rit']:,.0f}",'rit'),("⚖️","TONASE",f"{kpi['tonnase']:,.0f}",'tonnase'),
+            ("📊","AVG/TRIP",f"{kpi['avg_trip']:.0f}",'avg_trip'),
+            ("🏗️","EXCAVATOR",f"{kpi['excavator']}",None),("📅","HARI",f"{kpi['hari']}",None)]
+    for col,(icon,label,val,key) in zip(cols,kpis):
+        col.markdown(f'<div class="metric-card"><div class="metric-icon">{icon}</div><div class="metric-label">{label}</div><div class="metric-value">{val}</div>{delta_html(kpi, kpi_prev, key, compare)}</div>', unsafe_allow_html=True)
+    sections.mark('kpi', rows_in=total_rows, rows_out=kpi['trip'])
+
+
+@st.fragment
+def produksi_charts(q):
+    """Chart produksi; radio ukuran menjalankan ulang fragment ini saja"""
+    sections = SectionTimer('produksi')
+    st.markdown("<br>", unsafe_allow_html=True)
+    measure_label = st.radio("Ukuran chart", list(CHART_MEASURES), horizontal=True, key='produksi_chart_measure')
+    measure = CHART_MEASURES[measure_label]
+    version, params = q.version, q.params + (measure,)
+
+    st.markdown('<div class="section-title">🧱 Produksi per BLOK</div>', unsafe_allow_html=True)
+
+    def fig_blok():
+        blok_prod = (
+            q.rollup('BLOK')
+            .sort_values(measure, ascending=True)
+        )
+
+        fig = px.bar(
+            blok_prod,
+            x=measure,
+            y='BLOK',
+            orientation='h',
+            color=measure,
+            color_continuous_scale='Greens'
+        )
+
+        fig.update_layout(**chart_layout(height=350))
+        fig.update_coloraxes(showscale=False)
+        return fig
+    show_chart('produksi_blok', version, params, fig_blok)
+
+    # Combo Chart
+    st.markdown('<div class="section-title">📈 Tren Produksi Harian - Tonase & Ritase (Combo Chart)</div>', unsafe_allow_html=True)
+    def fig_combo():
+        daily = q.rollup('Date')
+        fig = make_subplots(specs=[[{"secondary_y": True}]])
+        fig.add_trace(go.Bar(x=daily['Date'], y=daily['Rit'], name='Ritase', marker_color='rgba(88,166,255,0.6)'), secondary_y=False)
+        fig.add_trace(go.Scatter(x=daily['Date'], y=daily['Tonnase'], name='Tonase', line=dict(color='#00E676',width=3), mode='lines+markers'), secondary_y=True)
+        fig.update_layout(**chart_layout(height=350))
+        fig.update_yaxes(title_text="Ritase", secondary_y=False, showgrid=False)
+        fig.update_yaxes(title_text="Tonase", secondary_y=True, showgrid=True, gridcolor='#21262d')
+        return fig
+    # Combo selalu menampilkan kedua ukuran
+    show_chart('produksi_combo', version, q.params, fig_combo)
+    
+    # Distribution Charts
+    c1,c2,c3 = st.columns(3)
+    with c1:
+        st.markdown('<div class="section-title">🔄 Distribusi Shift (Donut)</div>', unsafe_allow_html=True)
+        def fig_shift():
+            shift_data = q.rollup('Shift')
+            fig = px.pie(shift_data, values=measure, names='Shift', hole=0.5, color_discrete_sequence=['#00E676','#58a6ff','#f0883e'])
+            fig.update_layout(**chart_layout(height=280))
+            fig.update_traces(textposition='inside', textinfo='percent+label')
+            return fig
+        show_chart('produksi_shift', version, params, fig_shift)
+    
+    with c2:
+        st.markdown('<div class="section-title">🏗️ Per Excavator (Horizontal Bar)</div>', unsafe_allow_html=True)
+        def fig_exc():
+            exc = q.rollup('Excavator').sort_values(measure)
+            fig = px.bar(exc, x=measure, y='Excavator', orientation='h', color=measure, color_continuous_scale='Greens')
+            fig.update_layout(**chart_layout(height=280))
+            fig.update_coloraxes(showscale=False)
+            return fig
+        show_chart('produksi_excavator', version, params, fig_exc)
+    
+    with c3:
+        st.markdown('<div class="section-title">🪨 Material (Donut)</div>', unsafe_allow_html=True)
+        def fig_mat():
+            mat = q.rollup('Commudity')
+            fig = px.pie(mat, values=measure, names='Commudity', hole=0.5, color_discrete_sequence=['#00E676','#58a6ff','#f0883e','#a371f7'])
+            fig.update_layout(**chart_layout(height=280))
+            return fig
+        show_chart('produksi_material', version, params, fig_mat)
+    sections.mark('charts')
+
+
+def produksi_analisis(q):
+    sections = SectionTimer('produksi')
+    version, params = q.version, q.params
+    # =========================================================
+    # ANALISIS PRODUKTIVITAS
+    # =========================================================
+    st.markdown(
+        """
+        <div style="
+            margin-top:20px;
+            margin-bottom:10px;
+            padding-left:6px;
+            border-left:4px solid #00E676;
+        ">
+            <h3 style="margin:0;color:#e6edf3;">
+                📊 Analisis Produktivitas
+            </h3>
+            <p style="margin:4px 0 0 0;color:#8b949e;font-size:0.85rem;">
+                Hubungan ritase, tonase, dan pola waktu produksi
+            </p>
+        </div>
+        """,
+        unsafe_allow_html=True
+    )
+
+    # =========================================================
+    # Scatter & Heatmap
+    # =========================================================
+    c1, c2 = st.columns(2)
+
+    with c1:
+        st.markdown(
+            '<div class="section-title">🔗 Korelasi Rit vs Tonase</div>',
+            unsafe_allow_html=True
+        )
+
+        def fig_scatter():
+            # Sampel diambil sekali per filter, tetap sama antar rerun
+            df_filtered = q.rows(['Rit', 'Tonnase', 'Shift'])
+            sample = (
+                df_filtered.sample(min(500, len(df_filtered)))
+                if not df_filtered.empty
+                else df_filtered
+            )
+
+            fig = px.scatter(
+                sample,
+                x='Rit',
+                y='Tonnase',
+                color='Shift',
+                color_discrete_sequence=['#00E676', '#58a6ff', '#f0883e'],
+                opacity=0.7
+            )
+            fig.update_layout(**chart_layout(height=300))
+            return fig
+        show_chart('produksi_scatter', version, params, fig_scatter)
+
+    with c2:
+        st.markdown(
+            '<div class="section-title">⏱️ Heatmap Produksi (Jam × Shift)</div>',
+            unsafe_allow_html=True
+        )
+
+        def fig_heatmap():
+            # Jam awal (07:00-08:00 → 7) sudah dihitung di cube; -1 = Time kosong
+            all_hours = list(range(24))
+            by_jam = q.rollup(['Shift', 'Jam'])
+
+            pivot = (
+                by_jam[by_jam['Jam'] >= 0]
+                .pivot(index='Shift', columns='Jam', values='Tonnase')
+                .reindex(columns=all_hours, fill_value=0)
+            )
+
+            fig = px.imshow(
+                pivot,
+                color_continuous_scale='Greens',
+                aspect='auto',
+                labels=dict(x="Jam", y="Shift", color="Tonase")
+            )
+
+            fig.update_layout(
+                height=320,
+                xaxis=dict(tickmode='array', tickvals=all_hours)
+            )
+            return fig
+        show_chart('produksi_heatmap', version, params, fig_heatmap)
+    sections.mark('analisis')
+
+
+@st.fragment
+def produksi_export(q):
+    """Ganti format export hanya menjalankan ulang bagian ini"""
+    sections = SectionTimer('produksi')
+    # Data Table
+    st.markdown('<div class="section-title">📋 Data Detail</div>', unsafe_allow_html=True)
+    col_dl1, col_dl2 = st.columns([4,1])
+    with col_dl1:
+        export_fmt = st.radio("Format export", list(EXPORT_FORMATS), horizontal=True, label_visibility="collapsed")
+    with col_dl2:
+        # File baru dibuat saat tombol diklik (callable), lalu di-cache per filter
+        ext, mime = EXPORT_FORMATS[export_fmt]
+        st.download_button(
+            f"📥 Download {export_fmt}",
+            data=lambda: read_export(export_produksi(export_fmt, q.start_date, q.end_date, q.filters)),
+            file_name=f"produksi_filtered.{ext}",
+            mime=mime,
+            use_container_width=True
+        )
+    sections.mark('export')
+
+
+@st.fragment
+def produksi_table(q):
+    """Cari, sort & paging hanya menjalankan ulang tabel detail"""
+    sections = SectionTimer('produksi')
+    # Hanya satu halaman yang dikirim ke browser; sort, cari & paging dikerjakan di store
+    g1, g2, g3, g4 = st.columns([3, 2, 1, 1])
+    with g1:
+        search = st.text_input("🔎 Cari", placeholder="Excavator, front, dump truck, tanggal ...")
+    with g2:
+        sort_col = st.selectbox("↕️ Urutkan", DETAIL_COLUMNS, index=DETAIL_COLUMNS.index('Date'))
+    with g3:
+        ascending = st.selectbox("Arah", ['Turun', 'Naik']) == 'Naik'
+    with g4:
+        page_size = st.selectbox("Baris/halaman", [50, 100, 250, 500], index=1)
+
+    result = detail_produksi(q.start_date, q.end_date, q.filters, search, sort_col, ascending)
+    n_pages = DetailGrid.page_count(len(result), page_size)
+
+    col_pg1, col_pg2 = st.columns([1, 4])
+    with col_pg1:
+        page = st.number_input("Halaman", min_value=1, max_value=n_pages, value=1, step=1)
+    with col_pg2:
+        st.markdown(
+            f'<p style="color:#8b949e;font-size:0.8rem;margin-top:2.2rem;">'
+            f'Halaman {page} dari {n_pages} | {len(result):,} baris</p>',
+            unsafe_allow_html=True
+        )
+
+    st.dataframe(
+        result.page(page, page_size),
+        use_container_width=True,
+        height=300,
+        hide_index=True,
+        column_config={'Date': st.column_config.DateColumn('Date', format='YYYY-MM-DD')}
+    )
+    sections.mark('grid', rows_out=len(result))
@@ -0,0 +1,80 @@
+import pandas as pd
+import streamlit as st
+
+from config import PERF_LOG_FILE, PERF_PANEL_ROLE
+from utils.perf import REGISTRY
+from views.common import render_cache_status, render_ingest_status
+from views.login import logout
+
+# ================================================================
+# SIDEBAR
+# ================================================================
+def select_menu(menu):
+    st.session_state.current_menu = menu
+
+
+def render_sidebar():
+    with st.sidebar:
+        st.markdown('<p class="sidebar-header">⚙️ Dashboard Produksi</p>', unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align:center;padding:1rem;background:#21262d;border-radius:12px;margin:1rem 0;">
+            <p style="font-size:2.5rem;margin:0;">👤</p>
+            <p style="color:#fff;font-weight:600;margin:0.5rem 0 0 0;">{st.session_state.name}</p>
+            <p style="color:#8b949e;font-size:0.8rem;margin:0;text-transform:uppercase;">{st.session_state.role}</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        st.markdown('<p style="color:#58a6ff;font-size:0.85rem;font-weight:600;">📋 MENU NAVIGASI</p>', unsafe_allow_html=True)
+        
+        menus = [("🏠","Dashboard Overview"),("📊","Produksi Harian"),("🚨","Gangguan"),("⛽","Monitoring"),("📋","Daily Plan")]
+        for icon, menu in menus:
+            btn_type = "primary" if st.session_state.current_menu == menu else "secondary"
+            # Menu diganti di callback (sebelum script jalan): satu rerun langsung
+            # ke halaman tujuan, halaman lama tidak ikut dirender/dibangun ulang
+            st.button(f"{icon} {menu}", key=f"menu_{menu}", use_container_width=True, type=btn_type,
+                      on_click=select_menu, args=(menu,))
+        
+        st.markdown("---")
+        render_ingest_status()
+        render_cache_status()
+        # Panel performa diisi setelah halaman selesai dirender (lihat main)
+        perf_slot = st.container() if st.session_state.role == PERF_PANEL_ROLE else None
+        if st.button("🚪 Logout", use_container_width=True): logout(); st.rerun()
+        
+        st.markdown('<div style="text-align:center;color:#8b949e;font-size:0.75rem;margin-top:1rem;">⛏️ Semen Padang v3.0</div>', unsafe_allow_html=True)
+    return perf_slot
+
+
+PERF_COLUMNS = ['name', 'kind', 'calls', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms',
+                'hit_rate', 'rows_in', 'rows_out', 'mem_mb']
+
+
+def render_perf_panel(slot):
+    """Persentil waktu loader, bagian halaman & chart (jendela sampel terakhir, semua sesi)"""
+    with slot:
+        with st.expander("⏱️ Performa"):
+            summary = REGISTRY.summary()
+            kinds = sorted({row['kind'] for row in summary})
+            selected = st.multiselect("Jenis", kinds, default=kinds, key="perf_kinds")
+            rows = [row for row in summary if row['kind'] in selected]
+            if rows:
+                st.dataframe(
+                    pd.DataFrame(rows, columns=PERF_COLUMNS),
+                    hide_index=True,
+                    height=320,
+                    column_config={
+                        col: st.column_config.NumberColumn(format='%.1f')
+                        for col in ['p50_ms', 'p90_ms', 'p99_ms', 'max_ms', 'mem_mb']
+                    } | {'hit_rate': st.column_config.ProgressColumn('hit_rate', min_value=0, max_value=1, format='%.2f')},
+                )
+            else:
+                st.caption("Belum ada sampel")
+            c1, c2 = st.columns(2)
+            if c1.button("💾 Dump JSONL", key="perf_dump", use_container_width=True):
+                n = REGISTRY.dump_jsonl(PERF_LOG_FILE)
+                st.success(f"{n} sampel ditambahkan ke {PERF_LOG_FILE}")
+            if c2.button("🧹 Reset", key="perf_reset", use_container_width=True):
+                REGISTRY.clear()
+                st.rerun()
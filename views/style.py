@@ -0,0 +1,30 @@
+import streamlit as st
+
+# CSS tema dashboard; halaman login tidak memakainya
+APP_CSS = """
+<style>
+@import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+.stApp {background: linear-gradient(135deg, #0f0f1a 0%, #1a1a2e 50%, #16213e 100%); font-family: 'Inter', sans-serif;}
+div[data-testid="stSidebar"] {background: linear-gradient(180deg, #0d1117 0%, #161b22 100%); border-right: 1px solid #30363d;}
+.sidebar-header {font-size:1.3rem;font-weight:700;background:linear-gradient(90deg,#00C853,#00E5FF);-webkit-background-clip:text;-webkit-text-fill-color:transparent;text-align:center;padding:0.5rem 0;}
+.metric-card {background:linear-gradient(145deg,#1e2a3a,#16213e);border-radius:16px;padding:1.2rem;border:1px solid #30363d;box-shadow:0 4px 20px rgba(0,0,0,0.3);transition:transform 0.2s;}
+.metric-card:hover {transform:translateY(-2px);}
+.metric-value {font-size:1.8rem;font-weight:700;color:#fff;margin:0;}
+.metric-label {font-size:0.8rem;color:#8b949e;margin-bottom:0.3rem;text-transform:uppercase;letter-spacing:0.5px;}
+.metric-icon {font-size:1.3rem;margin-bottom:0.3rem;}
+.metric-delta {font-size:0.75rem;color:#8b949e;margin-top:0.3rem;}
+.section-title {font-size:1rem;color:#58a6ff;font-weight:600;margin:1.5rem 0 1rem 0;padding-left:12px;border-left:3px solid #58a6ff;}
+.chart-container {background:#161b22;border-radius:12px;padding:1rem;border:1px solid #30363d;margin-bottom:1rem;}
+div[data-testid="stMetric"] {background:linear-gradient(145deg,#1e2a3a,#16213e);border-radius:12px;padding:1rem;border:1px solid #30363d;}
+div[data-testid="stMetric"] label {color:#8b949e !important;}
+div[data-testid="stMetric"] [data-testid="stMetricValue"] {color:#fff !important;}
+div[data-testid="stFileUploader"] {background:#21262d;border-radius:8px;padding:0.5rem;}
+div[data-testid="stDateInput"] input {background:#21262d;border:1px solid #30363d;color:#fff;}
+.overview-card {background:linear-gradient(145deg,#1e2a3a,#16213e);border-radius:16px;padding:1.5rem;border:1px solid #30363d;margin-bottom:1rem;}
+.overview-title {color:#58a6ff;font-size:1.1rem;font-weight:600;margin-bottom:1rem;display:flex;align-items:center;gap:0.5rem;}
+</style>
+"""
+
+
+def inject_css():
+    st.markdown(APP_CSS, unsafe_allow_html=True)